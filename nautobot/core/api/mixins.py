@@ -1,3 +1,4 @@
+from collections import defaultdict
 import logging
 import uuid
 
@@ -5,9 +6,11 @@ from django.core.exceptions import (
     FieldError,
     MultipleObjectsReturned,
     ObjectDoesNotExist,
+    ValidationError as DjangoValidationError,
 )
-from django.db.models import AutoField, Model
+from django.db.models import AutoField, Model, Q
 from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ManyRelatedField, RelatedField
 
 from nautobot.core.api.utils import dict_to_filter_params
 from nautobot.core.utils.data import is_url
@@ -90,6 +93,11 @@ class WritableSerializerMixin:
         Retrieve an unique object based on a dictionary of data attributes and raise errors accordingly if the object is not found.
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
+        related_object_cache = self.context.get("related_object_cache")
+        if related_object_cache is not None:
+            obj = related_object_cache.get(self, queryset, filter_params)
+            if obj is not None:
+                return obj
         try:
             return queryset.get(**filter_params)
         except ObjectDoesNotExist as e:
@@ -112,3 +120,129 @@ class WritableSerializerMixin:
         if isinstance(data, list):
             return [self.get_object(data=entry, queryset=queryset) for entry in data]
         return self.get_object(data=data, queryset=queryset)
+
+
+class _RelatedObjectLookupCollected(Exception):
+    """Raised by `RelatedObjectCache.get()` while collecting the lookups to prefetch, to skip the actual lookup."""
+
+
+class RelatedObjectCache:
+    """
+    Cache of the related objects referenced by many rows of data, such as the rows of a CSV file being imported.
+
+    `prefetch()` finds all of the related objects that the rows reference, with a few queries per related field,
+    rather than with one query per row and field. Serializers given the cache as `related_object_cache` in their
+    context then look up related objects in the cache first, falling back to querying the database as usual for any
+    lookups that weren't prefetched, such as references to objects that don't yet exist or that can't be matched
+    unambiguously.
+    """
+
+    # Maximum number of lookups to combine into a single query
+    chunk_size = 500
+
+    def __init__(self):
+        # (field key, model label, lookup) -> object
+        self._objects = {}
+        # While collecting: (field key, model label, lookup names) -> (queryset, set of lookup values)
+        self._collected = None
+
+    @staticmethod
+    def _normalize(value):
+        """Normalize a lookup value or database value so that the two can be compared."""
+        return None if value is None else str(value)
+
+    def _get_key(self, field, queryset, filter_params):
+        """Get the key of a lookup in the cache, or None if the lookup can't be cached."""
+        field_key = field.field_name or getattr(field.parent, "field_name", "")
+        lookup = tuple(sorted((name, self._normalize(value)) for name, value in filter_params.items()))
+        try:
+            hash(lookup)
+        except TypeError:
+            return None
+        return (field_key, queryset.model._meta.label_lower, lookup)
+
+    def get(self, field, queryset, filter_params):
+        """
+        Get the object that `field` would look up with the given filter params, or None if it isn't cached.
+
+        Args:
+            field (WritableSerializerMixin): Serializer field looking up the object
+            queryset (QuerySet): Queryset that the object is looked up in
+            filter_params (dict): Filter params identifying the object
+        """
+        key = self._get_key(field, queryset, filter_params)
+        if key is None:
+            return None
+        if self._collected is not None:
+            field_key, model_label, lookup = key
+            names = tuple(name for name, _ in lookup)
+            values = tuple(value for _, value in lookup)
+            self._collected.setdefault((field_key, model_label, names), (queryset, set()))[1].add(values)
+            raise _RelatedObjectLookupCollected
+        return self._objects.get(key)
+
+    def prefetch(self, serializer_class, data, context=None):
+        """
+        Find the related objects referenced by the given rows of data in bulk, and cache them.
+
+        Args:
+            serializer_class (Serializer): Serializer class that the rows will be validated with
+            data (list[dict]): Rows of data
+            context (dict): Serializer context that the rows will be validated with
+        """
+        serializer = serializer_class(context={**(context or {}), "related_object_cache": self})
+        self._collected = {}
+        try:
+            for field_name, field in serializer.fields.items():
+                self._collect_field_lookups(field_name, field, data)
+            collected = self._collected
+        finally:
+            self._collected = None
+
+        for (field_key, model_label, names), (queryset, lookups) in collected.items():
+            lookups = list(lookups)
+            for start in range(0, len(lookups), self.chunk_size):
+                self._prefetch_lookups(
+                    field_key, model_label, names, queryset, lookups[start : start + self.chunk_size]
+                )
+
+    def _collect_field_lookups(self, field_name, field, data):
+        """Collect the lookups that a related field of the serializer makes for the given rows of data."""
+        many = isinstance(field, ManyRelatedField)
+        child = field.child_relation if many else field
+        if field.read_only or not isinstance(child, WritableSerializerMixin) or not isinstance(child, RelatedField):
+            return
+        for entry in data:
+            value = entry.get(field_name)
+            for item in value if many and isinstance(value, list) else [value]:
+                if item is None:
+                    continue
+                try:
+                    child.to_internal_value(item)
+                except (_RelatedObjectLookupCollected, ValidationError, DjangoValidationError):
+                    pass
+
+    def _prefetch_lookups(self, field_key, model_label, names, queryset, lookups):
+        """Find and cache the objects matched by the given lookups with the same names, with two queries."""
+        query = Q()
+        for values in lookups:
+            query |= Q(**dict(zip(names, values)))
+        fields = [*names, "pk"] if "pk" not in names else list(names)
+        pk_index = fields.index("pk")
+        pks_by_values = defaultdict(set)
+        try:
+            for row in queryset.filter(query).values_list(*fields):
+                pks_by_values[tuple(self._normalize(row[fields.index(name)]) for name in names)].add(row[pk_index])
+        except (FieldError, DjangoValidationError, TypeError, ValueError) as exc:
+            logger.debug("Unable to prefetch %s objects by %s: %s", model_label, names, exc)
+            return
+
+        # Lookups that match several objects, or that only match due to the collation of the database, are left to
+        # the regular lookup of each row, which reports (or resolves) them exactly as it would without the cache
+        matched_pks = {
+            values: next(iter(pks_by_values[values])) for values in lookups if len(pks_by_values.get(values, ())) == 1
+        }
+        objects = {obj.pk: obj for obj in queryset.filter(pk__in=set(matched_pks.values()))}
+        for values, pk in matched_pks.items():
+            if pk in objects:
+                self._objects[(field_key, model_label, tuple(zip(names, values)))] = objects[pk]
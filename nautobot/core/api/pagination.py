@@ -1,4 +1,12 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from nautobot.core.utils.config import get_settings_or_config
 
@@ -8,13 +16,26 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     Override the stock paginator to allow setting limit=0 to disable pagination for a request. This returns all objects
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
+
+    Also supports keyset pagination, by primary key, for requests that include the `cursor` query parameter; see
+    `paginate_queryset_by_cursor()`.
     """
 
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor"
+    use_cursor = False
+    next_cursor = None
+
     def paginate_queryset(self, queryset, request, view=None):
         # No pagination when rendering to CSV
         if "text/csv" in request.accepted_media_type:
             return None
 
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if self.use_cursor:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
         self.count = self.get_count(queryset)
         self.limit = self.get_limit(request)
         self.offset = self.get_offset(request)
@@ -31,6 +52,68 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         else:
             return list(queryset[self.offset :])
 
+    def paginate_queryset_by_cursor(self, queryset, request):
+        """
+        Paginate the queryset in order of primary key, starting after the object identified by the `cursor` parameter.
+
+        Each page is found by an index scan starting where the previous page ended, rather than by counting and skipping
+        all of the objects of the previous pages with an OFFSET, so every page costs the same to retrieve. For the same
+        reason, the total `count` of matching objects is only included if requested, as an exact count
+        (`count=exact`) or as an estimate from the query planner of the database (`count=estimate`). Only a `next` link
+        is provided.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = 0
+        self.next_cursor = None
+
+        count = request.query_params.get(self.count_query_param)
+        if count == "exact":
+            self.count = self.get_count(queryset)
+        elif count == "estimate":
+            self.count = self.get_estimated_count(queryset)
+        else:
+            self.count = None
+
+        queryset = queryset.order_by("pk")
+        after = self.decode_cursor(request.query_params[self.cursor_query_param], queryset.model)
+        if after is not None:
+            queryset = queryset.filter(pk__gt=after)
+
+        if not self.limit:
+            return list(queryset)
+        # Retrieve one more object than needed to tell whether there's a next page
+        results = list(queryset[: self.limit + 1])
+        if len(results) > self.limit:
+            results = results[: self.limit]
+            self.next_cursor = self.encode_cursor(results[-1].pk)
+        return results
+
+    @staticmethod
+    def encode_cursor(pk):
+        """Encode the primary key of the last object of a page as the cursor of the next page."""
+        return base64.urlsafe_b64encode(str(pk).encode()).decode()
+
+    def decode_cursor(self, cursor, model):
+        """Decode the primary key of the last object of the previous page from a cursor, or None for the first page."""
+        if not cursor:
+            return None
+        try:
+            return model._meta.pk.to_python(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (binascii.Error, UnicodeError, ValidationError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+    def get_estimated_count(self, queryset):
+        """
+        Get an estimate of the number of objects in the queryset from the query planner of the database.
+
+        Only supported on PostgreSQL; on other databases the objects are actually counted.
+        """
+        if connection.vendor == "postgresql":
+            plan = json.loads(queryset.order_by().explain(format="json"))
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return self.get_count(queryset)
+
     def get_limit(self, request):
         if self.limit_query_param:
             try:
@@ -55,6 +138,13 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        if self.use_cursor:
+            if self.next_cursor is None:
+                return None
+            url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
         return super().get_next_link()
 
     def get_previous_link(self):
@@ -62,4 +152,8 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         if not self.limit:
             return None
 
+        # Keyset pagination only goes forward
+        if self.use_cursor:
+            return None
+
         return super().get_previous_link()
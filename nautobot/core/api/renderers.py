@@ -57,23 +57,37 @@ class NautobotCSVRenderer(BaseRenderer):
         if isinstance(data, dict):
             data = [data]
 
-        headers = self.get_headers(data)
+        return "".join(self.render_chunks([data]))
 
+    def render_chunks(self, data_chunks, model=None):
+        """
+        Render the provided data to CSV format incrementally, yielding a string of CSV rows for each chunk of data.
+
+        This allows for streaming a large CSV export (see `ModelViewSetMixin.list()`) without ever having all of the
+        serialized data, or all of the rendered CSV, in memory at once.
+
+        Args:
+            data_chunks (iterable): Iterable of lists of serialized records
+            model (Model): If specified, derive the custom field headers from this model's CustomField definitions
+                rather than from the data, since the headers have to be known before all of the data has been seen.
+        """
         buffer = StringIO()
         writer = csv.writer(buffer)
-        writer.writerow(headers)
-        for record in data:
-            writer.writerow(
-                self.object_to_row_elements(
-                    record,
-                    headers=headers,
-                )
-            )
-
-        return buffer.getvalue()
+        headers = None
+        for data in data_chunks:
+            if not data:
+                continue
+            if headers is None:
+                headers = self.get_headers(data, model=model)
+                writer.writerow(headers)
+            for record in data:
+                writer.writerow(self.object_to_row_elements(record, headers=headers))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
 
     @classmethod
-    def get_headers(cls, data):
+    def get_headers(cls, data, model=None):
         """Identify the appropriate CSV headers corresponding to the given data."""
         base_headers = list(data[0].keys())
 
@@ -89,13 +103,19 @@ class NautobotCSVRenderer(BaseRenderer):
                 base_headers.remove(undesired_header)
 
         # Add individual headers for each relevant custom field
-        # Since we know there are cases where custom field data may be missing from a given instance,
-        # we iterate over *all* instances in the data set to be safe.
         if "custom_fields" in data[0]:
-            cf_headers = set()
-            for record in data:
-                cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
-            cf_headers = sorted(cf_headers)
+            if model is not None:
+                # Avoid a circular import
+                from nautobot.extras.models import CustomField
+
+                cf_headers = sorted(f"cf_{cf.key}" for cf in CustomField.objects.get_for_model(model))
+            else:
+                # Since we know there are cases where custom field data may be missing from a given instance,
+                # we iterate over *all* instances in the data set to be safe.
+                cf_headers = set()
+                for record in data:
+                    cf_headers |= {f"cf_{key}" for key in record["custom_fields"]}
+                cf_headers = sorted(cf_headers)
         else:
             cf_headers = []
 
@@ -138,6 +138,8 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
     object_type = ObjectTypeField()
     # composite_key = serializers.SerializerMethodField()  # TODO: Revisit if we reintroduce composite keys
     natural_keys_values = None
+    # Number of rows of `natural_keys_values` to retrieve from the database at a time
+    natural_keys_chunk_size = 2000
     natural_slug = serializers.SerializerMethodField()
 
     def __init__(self, *args, force_csv=False, **kwargs):
@@ -161,13 +163,38 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
             case_query = self._build_query_case_for_natural_key_field_lookup(all_related_fields_natural_key_lookups)
             if isinstance(self.instance, models.QuerySet):
                 queryset = self.instance
-            else:
+            elif isinstance(self.instance, models.Model):
                 # We would only need to run one additional query, making this a more efficient method of
                 # obtaining all the natural key values for this instance;
                 queryset = self.Meta.model.objects.filter(pk=self.instance.pk)
+            else:
+                # A list of instances, such as a chunk of a streamed CSV export or a page of results
+                queryset = self.Meta.model.objects.filter(pk__in=[instance.pk for instance in self.instance])
             self.natural_keys_values = queryset.annotate(**case_query).values(
                 *all_related_fields_natural_key_lookups, "pk"
             )
+            # Rows of `natural_keys_values` retrieved but not yet used by `to_representation()`, by PK
+            self._natural_keys_index = {}
+            self._natural_keys_iterator = None
+
+    def _get_natural_keys_values_for_instance(self, instance):
+        """
+        Get the row of `natural_keys_values` for the given instance, or None if there isn't one.
+
+        The rows are retrieved `natural_keys_chunk_size` at a time, alongside the serialization of the instances, and
+        indexed by PK until they are used. As the instances are usually serialized in the same order as the rows are
+        retrieved, only a few rows are held in memory at any time, however many instances are serialized.
+        """
+        if instance.pk in self._natural_keys_index:
+            return self._natural_keys_index.pop(instance.pk)
+        if self._natural_keys_iterator is None:
+            self._natural_keys_iterator = self.natural_keys_values.iterator(chunk_size=self.natural_keys_chunk_size)
+        for row in self._natural_keys_iterator:
+            if row["pk"] == instance.pk:
+                return row
+            self._natural_keys_index[row["pk"]] = row
+        # The row was already used, if the same instance is serialized again
+        return self.natural_keys_values.filter(pk=instance.pk).first()
 
     def _get_lookup_field_name_and_output_field(self, lookup_field):
         """Get lookup field name and its corresponding output_field.
@@ -685,8 +712,7 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
         altered_data = {}
 
         if self._is_csv_request() and self.natural_keys_values is not None:
-            if natural_key_field_instance := [item for item in self.natural_keys_values if item["pk"] == instance.pk]:
-                cleaned_natural_key_field_instance = natural_key_field_instance[0]
+            if cleaned_natural_key_field_instance := self._get_natural_keys_values_for_instance(instance):
                 for key, value in data.items():
                     # FK field with natural_field_lookups
                     if natural_key_field_lookups_for_field := self._get_natural_key_lookups_value_for_field(
@@ -7,11 +7,13 @@ import platform
 from django import __version__ as DJANGO_VERSION, forms
 from django.apps import apps
 from django.conf import settings
+from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import transaction
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.db import IntegrityError, models, router, transaction
 from django.db.models import ProtectedError
-from django.http.response import HttpResponseBadRequest
+from django.db.models.signals import post_save, pre_save
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import NoReverseMatch, reverse as django_reverse
 from drf_spectacular.plumbing import get_relative_url, set_query_parameters
@@ -24,17 +26,19 @@ from graphql import get_default_backend
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
-from rest_framework import routers, status
-from rest_framework.exceptions import ParseError, PermissionDenied
+from rest_framework import routers, serializers as drf_serializers, status
+from rest_framework.exceptions import ParseError, PermissionDenied, ValidationError as RESTValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
+from rest_framework.utils import model_meta
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet as ModelViewSet_, ReadOnlyModelViewSet as ReadOnlyModelViewSet_
 import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.serializers import RelationshipModelSerializerMixin
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app as celery_app
 from nautobot.core.exceptions import FilterSetFieldNotFound
@@ -44,7 +48,10 @@ from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
 from nautobot.core.views.utils import get_csv_form_fields_from_serializer_class
+from nautobot.extras.api.mixins import TaggedModelSerializerMixin
+from nautobot.extras.context_managers import change_context_state, deferred_change_logging_for_bulk_operation
 from nautobot.extras.registry import registry
+from nautobot.extras.utils import bulk_delete_with_bulk_change_logging
 
 from . import serializers
 
@@ -97,6 +104,8 @@ class BulkUpdateModelMixin:
     """
 
     bulk_operation_serializer_class = BulkOperationSerializer
+    # Number of objects to write to the database at once when updating objects in bulk
+    bulk_update_batch_size = 1000
 
     def bulk_update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -114,16 +123,182 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic():
-            data_list = []
-            for obj in objects:
-                data = update_data.get(str(obj.id))
-                serializer = self.get_serializer(obj, data=data, partial=partial)
-                serializer.is_valid(raise_exception=True)
+        """
+        Validate and apply the updates of all of the given objects in a single transaction.
+
+        If any of the updates are invalid, none of them are applied, and the errors of each item of the request are
+        reported in the same order as the request (with an empty dict for each valid item), just as for the bulk
+        creation of objects. Where possible (see `_can_bulk_update()`), all of the updates are validated first, then
+        applied with `bulk_update()`, `bulk_update_batch_size` objects at a time; otherwise each object is saved as soon
+        as its update is validated. In either case, the change log entries of the objects are created in bulk once all
+        of the objects have been updated.
+
+        Updates that are each valid on their own may still conflict with one another, for example by setting the same
+        unique value on two objects. If applying them with `bulk_update()` fails for that reason, they're instead
+        validated and saved one object at a time, so that any such conflicts are reported as errors of the items
+        concerned.
+        """
+        model = self.queryset.model
+        use_bulk_update = self._can_bulk_update(model, self.get_serializer_class())
+        change_context = change_context_state.get()
+        if change_context is not None:
+            write_context = deferred_change_logging_for_bulk_operation()
+        else:
+            write_context = transaction.atomic()
+        with write_context:
+            serializers_list = self._validate_bulk_update(objects, update_data, partial, save=not use_bulk_update)
+
+            if use_bulk_update and all(self._is_field_update(model, serializer) for serializer in serializers_list):
+                self.logger.info(f"Updating {len(serializers_list)} {model._meta.verbose_name_plural} in bulk")
+                if change_context is not None:
+                    deferred_object_changes = {
+                        key: list(entries) for key, entries in change_context.deferred_object_changes.items()
+                    }
+                try:
+                    with transaction.atomic():
+                        for start in range(0, len(serializers_list), self.bulk_update_batch_size):
+                            instances = self._bulk_update_objects(
+                                model, serializers_list[start : start + self.bulk_update_batch_size]
+                            )
+                            # Enforce object-level permissions once per batch, rather than once per object
+                            try:
+                                self._validate_objects(instances)
+                            except ObjectDoesNotExist:
+                                raise PermissionDenied()
+                except IntegrityError:
+                    self.logger.info("Bulk update failed with an integrity error, updating the objects one by one")
+                    if change_context is not None:
+                        # Discard the change log entries of the updates that were just rolled back
+                        change_context.deferred_object_changes = deferred_object_changes
+                    # Start over from freshly retrieved objects, as the update attempt modified the instances
+                    serializers_list = self._validate_bulk_update(objects.all(), update_data, partial, save=True)
+            elif use_bulk_update:
+                for serializer in serializers_list:
+                    self.perform_update(serializer)
+
+        return [serializer.data for serializer in serializers_list]
+
+    def _validate_bulk_update(self, objects, update_data, partial, save):
+        """
+        Validate the updates of the given objects, saving each object as soon as its update is validated if `save`.
+
+        Once any update is invalid, the objects are no longer saved, but the remaining updates are still validated, so
+        that all of the errors are reported at once.
+
+        Returns:
+            (list): The serializers of the validated updates.
+        """
+        serializers_list = []
+        errors = {}
+        for obj in objects:
+            serializer = self.get_serializer(obj, data=update_data.get(str(obj.id)), partial=partial)
+            if not serializer.is_valid():
+                errors[str(obj.id)] = serializer.errors
+                continue
+            serializers_list.append(serializer)
+            if save and not errors:
                 self.perform_update(serializer)
-                data_list.append(serializer.data)
+        if errors:
+            raise RESTValidationError([errors.get(str(pk), {}) for pk in update_data])
+        return serializers_list
 
-            return data_list
+    def _can_bulk_update(self, model, serializer_class):
+        """
+        Check whether the objects of the given model can be updated with `bulk_update()` rather than saved one by one.
+
+        That's only the case if neither the view, the model nor its serializer customize how an object is saved (other
+        than the serializer's handling of tags and relationships), and if objects of the model can't reference one
+        another, as validating such a reference would need the referenced object to be updated already.
+
+        This doesn't guarantee that none of the updates can affect the validation of the others: two updates may still
+        set the same unique value, which `perform_bulk_update()` handles if and when `bulk_update()` fails.
+        """
+        if not hasattr(self, "_validate_objects") or type(self).perform_update is not ModelViewSet.perform_update:
+            return False
+        model_classes = model.__mro__[: model.__mro__.index(models.Model)]
+        if model._meta.parents or any("save" in klass.__dict__ for klass in model_classes):
+            return False
+        if any(field.related_model is model for field in [*model._meta.concrete_fields, *model._meta.many_to_many]):
+            return False
+        standard_updates = {
+            drf_serializers.ModelSerializer.update,
+            TaggedModelSerializerMixin.update,
+            RelationshipModelSerializerMixin.update,
+        }
+        serializer_classes = serializer_class.__mro__[: serializer_class.__mro__.index(drf_serializers.ModelSerializer)]
+        return all(
+            klass.__dict__["update"] in standard_updates for klass in serializer_classes if "update" in klass.__dict__
+        )
+
+    @staticmethod
+    def _is_field_update(model, serializer):
+        """Check whether the given validated update only sets fields of the model, its tags and its relationships."""
+        field_info = model_meta.get_field_info(model)
+        return all(
+            attr in ("tags", "relationships") or attr in field_info.fields or attr in field_info.forward_relations
+            for attr in serializer.validated_data
+        )
+
+    @staticmethod
+    def _bulk_update_objects(model, serializers_list):
+        """
+        Apply the given validated updates with `bulk_update()`, as the serializers' `update()` would.
+
+        The `pre_save` and `post_save` signals are sent for each object, so that change logging and any other receivers
+        of the signals behave just as if the objects had been saved one by one.
+
+        Returns:
+            (list): The updated objects.
+        """
+        field_info = model_meta.get_field_info(model)
+        auto_now_fields = [field for field in model._meta.concrete_fields if getattr(field, "auto_now", False)]
+        update_fields = {field.name for field in auto_now_fields}
+        pending = []
+        for serializer in serializers_list:
+            instance = serializer.instance
+            validated_data = dict(serializer.validated_data)
+            tags = validated_data.pop("tags", None)
+            relationships = validated_data.pop("relationships", {})
+            if isinstance(serializer, RelationshipModelSerializerMixin):
+                relationship_errors = model.required_related_objects_errors(
+                    output_for="api",
+                    initial_data=relationships,
+                    relationships_key_specified="relationships" in serializer.initial_data,
+                    instance=instance,
+                )
+                if relationship_errors:
+                    raise RESTValidationError({"relationships": relationship_errors})
+            if isinstance(serializer, TaggedModelSerializerMixin):
+                # Cache tags on instance for change logging
+                instance._tags = tags or []
+            many_to_many = {}
+            for attr, value in validated_data.items():
+                if attr in field_info.relations and field_info.relations[attr].to_many:
+                    many_to_many[attr] = value
+                else:
+                    setattr(instance, attr, value)
+                    update_fields.add(attr)
+            pending.append((serializer, instance, many_to_many, tags, relationships))
+
+        using = router.db_for_write(model)
+        for _, instance, _, _, _ in pending:
+            pre_save.send(sender=model, instance=instance, raw=False, using=using, update_fields=None)
+            for field in auto_now_fields:
+                field.pre_save(instance, add=False)
+        if update_fields:
+            model.objects.bulk_update([instance for _, instance, _, _, _ in pending], sorted(update_fields))
+        for serializer, instance, many_to_many, tags, relationships in pending:
+            post_save.send(sender=model, instance=instance, created=False, raw=False, using=using, update_fields=None)
+            for field_name, value in many_to_many.items():
+                getattr(instance, field_name).set(value)
+            if tags is not None:
+                serializer._save_tags(instance, tags)
+            if relationships:
+                try:
+                    serializer._save_relationships(instance, relationships)
+                except DjangoValidationError as error:
+                    raise RESTValidationError(str(error)) from error
+        return [instance for _, instance, _, _, _ in pending]
 
     def bulk_partial_update(self, request, *args, **kwargs):
         kwargs["partial"] = True
@@ -157,10 +332,67 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
+        """
+        Delete all of the given objects in a single transaction.
+
+        Where possible (see `_can_bulk_destroy()`), the objects are deleted all at once, as by the bulk delete views of
+        the UI, rather than one by one: a single collector finds all of their dependent objects (failing with the list
+        of all of the objects that protect them from deletion, if any), and their change log entries are created in
+        bulk. As only the deletion of the given objects themselves is change-logged that way, the objects are still
+        deleted one by one if that would also delete any change-logged objects depending on them.
+        """
+        if self._can_bulk_destroy():
+            model = self.queryset.model
+            pks = list(objects.values_list("pk", flat=True))
+            if not self._has_change_logged_dependents(model, pks):
+                self.logger.info(f"Deleting {len(pks)} {model._meta.verbose_name_plural} in bulk")
+                bulk_delete_with_bulk_change_logging(model.objects.filter(pk__in=pks))
+                return
+
         with transaction.atomic():
             for obj in objects:
                 self.perform_destroy(obj)
 
+    def _can_bulk_destroy(self):
+        """
+        Check whether the objects can be deleted all at once, rather than by calling `delete()` on each of them.
+
+        That's only the case if change logging is enabled, and neither the view nor the model customize how an object
+        is deleted.
+        """
+        if change_context_state.get() is None:
+            return False
+        if type(self).perform_destroy is not ModelViewSet.perform_destroy:
+            return False
+        model = self.queryset.model
+        model_classes = model.__mro__[: model.__mro__.index(models.Model)]
+        return not any("delete" in klass.__dict__ for klass in model_classes)
+
+    @staticmethod
+    def _has_change_logged_dependents(model, pks):
+        """
+        Check whether deleting the given objects would also delete any change-logged objects, such as their notes or
+        (cascading) components.
+        """
+        from nautobot.extras.models import ContactAssociation, Note  # avoid circular import
+
+        content_type = ContentType.objects.get_for_model(model)
+        dependents = [
+            Note.objects.filter(assigned_object_type=content_type, assigned_object_id__in=pks),
+            ContactAssociation.objects.filter(associated_object_type=content_type, associated_object_id__in=pks),
+        ]
+        for relation in model._meta.related_objects:
+            if relation.on_delete is models.CASCADE and hasattr(relation.related_model, "to_objectchange"):
+                dependents.append(relation.related_model._base_manager.filter(**{f"{relation.field.name}__in": pks}))
+        for field in model._meta.private_fields:
+            if isinstance(field, GenericRelation) and hasattr(field.related_model, "to_objectchange"):
+                dependents.append(
+                    field.related_model._base_manager.filter(
+                        **{field.content_type_field_name: content_type, f"{field.object_id_field_name}__in": pks}
+                    )
+                )
+        return any(queryset.exists() for queryset in dependents)
+
 
 #
 # Viewsets
@@ -177,6 +409,9 @@ class ModelViewSetMixin:
     #       composite_key value instead of a UUID. We're not currently documenting/using this feature, so OK for now
     # lookup_value_regex = r"[^/]+"
 
+    # Number of objects to retrieve from the database and serialize at once when streaming a CSV export
+    csv_export_chunk_size = 1000
+
     def get_object(self):
         """Extend rest_framework.generics.GenericAPIView.get_object to allow "pk" lookups to use a composite-key."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -230,6 +465,25 @@ class ModelViewSetMixin:
 
         return context
 
+    def list(self, request, *args, **kwargs):
+        """
+        Extend DRF's list() to stream CSV exports, rather than serializing and rendering all objects in memory at once.
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        if "text/csv" in request.accepted_media_type and hasattr(renderer, "render_chunks"):
+            queryset = self.filter_queryset(self.get_queryset())
+            return StreamingHttpResponse(
+                renderer.render_chunks(self._serialize_in_chunks(queryset), model=queryset.model),
+                content_type=f"{renderer.media_type}; charset={renderer.charset}",
+            )
+        return super().list(request, *args, **kwargs)
+
+    def _serialize_in_chunks(self, queryset):
+        """Retrieve and serialize the objects in the given queryset `csv_export_chunk_size` objects at a time."""
+        objects = queryset.iterator(chunk_size=self.csv_export_chunk_size)
+        while chunk := list(itertools.islice(objects, self.csv_export_chunk_size)):
+            yield self.get_serializer(chunk, many=True).data
+
     def restrict_queryset(self, request, *args, **kwargs):
         """
         Restrict the view's queryset to allow only the permitted objects for the given request.
@@ -937,7 +1191,7 @@ class GetFilterSetFieldLookupExpressionChoicesAPIView(NautobotAPIVersionMixin, A
             data = get_all_lookup_expr_for_field(model, field_name)
         except FilterSetFieldNotFound:
             return Response("field_name not found", status=404)
-        except ValidationError as err:
+        except DjangoValidationError as err:
             return Response(err.args[0], status=err.code)
 
         # Needs to be returned in this format because this endpoint is used by
@@ -961,7 +1215,7 @@ class GetFilterSetFieldDOMElementAPIView(NautobotAPIVersionMixin, APIView):
     def get(self, request):
         try:
             field_name, model = ensure_content_type_and_field_name_in_query_params(request.GET)
-        except ValidationError as err:
+        except DjangoValidationError as err:
             return Response(err.args[0], status=err.code)
         try:
             form_field = get_filterset_parameter_form_field(model, field_name)
@@ -906,6 +906,14 @@ class CoreConfig(NautobotConfig):
             """Convert BigIntegerField to BigInteger scalar."""
             return BigInteger()
 
+        from graphql import set_default_backend
+
+        from nautobot.core.graphql.backend import NautobotGraphQLBackend
+
+        # Cache parsed documents and enforce query depth/cost limits for all GraphQL queries, including those from
+        # graphene-django's GraphQLView and from `execute_query()`, which all use the default backend.
+        set_default_backend(NautobotGraphQLBackend())
+
         from django.conf import settings
         from django.contrib.auth.models import update_last_login
         from django.contrib.auth.signals import user_logged_in
@@ -1,5 +1,7 @@
 from collections import defaultdict
+import contextlib
 import logging
+import uuid
 
 from django.conf import settings
 from django.contrib.auth.backends import (
@@ -7,11 +9,14 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db.models import Q
+from prometheus_client import Counter
+import redis.exceptions
 
 from nautobot.core.utils.permissions import (
+    get_permission_filter,
     permission_is_exempt,
-    qs_filter_from_constraints,
     resolve_permission,
     resolve_permission_ct,
 )
@@ -19,15 +24,72 @@ from nautobot.users.models import ObjectPermission
 
 logger = logging.getLogger(__name__)
 
+# Counts lookups of users' ObjectPermissions in the shared cache, labeled by result ("hit" or "miss"),
+# from which the cache hit rate can be derived.
+OBJECT_PERMISSION_CACHE_METRIC = Counter(
+    "nautobot_object_permission_cache_lookups_total",
+    "Lookups of users' object permissions in the shared cache.",
+    ["result"],
+)
+
+
+# Incremented whenever object permissions are invalidated in this process, so that the permissions cached on any User
+# instances that outlive a single request (such as the user of a Job) are discarded as well
+_object_permissions_generation = 0
+
+
+def invalidate_object_permissions_cache(user=None):
+    """
+    Invalidate the shared cache of the permissions granted by ObjectPermissions, for the given user or for all users.
+
+    The permissions already cached on User instances in this process are discarded as well, for all users.
+    """
+    global _object_permissions_generation
+    _object_permissions_generation += 1
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        if user is not None:
+            cache.delete(f"{ObjectPermissionBackend.cache_key_prefix}.{user.pk}")
+        else:
+            cache.delete_pattern(f"{ObjectPermissionBackend.cache_key_prefix}.*")
+
 
 class ObjectPermissionBackend(ModelBackend):
+    cache_key_prefix = "nautobot.core.authentication.ObjectPermissionBackend.get_cached_object_permissions"
+
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
+        if getattr(user_obj, "_object_perm_generation", None) != _object_permissions_generation:
+            # Object permissions have changed since they were cached on this instance
+            for attr in ("_object_perm_cache", "_object_perm_filter_cache"):
+                user_obj.__dict__.pop(attr, None)
+            user_obj._object_perm_generation = _object_permissions_generation
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache, user_obj._object_perm_version = self.get_cached_object_permissions(user_obj)
         return user_obj._object_perm_cache
 
+    def get_cached_object_permissions(self, user_obj):
+        """
+        Return all permissions granted to the user by an ObjectPermission, using the shared cache where possible.
+
+        The cached permissions are invalidated by the receivers in `nautobot.users.signals` whenever an ObjectPermission,
+        the user, or the user's group membership changes.
+
+        Returns:
+            (tuple[dict, str]): The permissions, and a version token that changes whenever they are invalidated.
+        """
+        cache_key = f"{self.cache_key_prefix}.{user_obj.pk}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            OBJECT_PERMISSION_CACHE_METRIC.labels("hit").inc()
+            return defaultdict(list, cached["perms"]), cached["version"]
+
+        OBJECT_PERMISSION_CACHE_METRIC.labels("miss").inc()
+        perms = self.get_object_permissions(user_obj)
+        version = uuid.uuid4().hex
+        cache.set(cache_key, {"perms": dict(perms), "version": version})
+        return perms, version
+
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
@@ -82,15 +144,10 @@ class ObjectPermissionBackend(ModelBackend):
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
-
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
         # not the instance itself.
+        constraints = get_permission_filter(user_obj, perm)
         return model.objects.filter(constraints, pk=obj.pk).exists()
 
 
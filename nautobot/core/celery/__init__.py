@@ -16,7 +16,7 @@ from prometheus_client import CollectorRegistry, multiprocess, start_http_server
 
 from nautobot.core.celery.control import discard_git_repository, refresh_git_repository  # noqa: F401  # unused-import
 from nautobot.core.celery.encoders import NautobotKombuJSONEncoder
-from nautobot.core.celery.log import NautobotDatabaseHandler
+from nautobot.core.celery.log import flush_job_log_entries, NautobotDatabaseHandler
 from nautobot.core.utils.module_loading import import_modules_privately
 from nautobot.extras.registry import registry
 
@@ -142,6 +142,12 @@ def setup_nautobot_job_logging(sender, instance, conf, **kwargs):
         add_nautobot_log_handler(redirect_logger)
 
 
+@signals.task_postrun.connect
+def flush_nautobot_job_logging(sender=None, task_id=None, **kwargs):
+    """Write any log entries still buffered by the nautobot database logging handler once a task has completed."""
+    flush_job_log_entries(task_id=task_id, discard=True)
+
+
 @signals.worker_ready.connect
 def setup_prometheus(**kwargs):
     """This sets up an HTTP server to serve prometheus metrics from the celery workers."""
@@ -1,38 +1,137 @@
 import logging
+import threading
+import weakref
 
 from celery import current_task
 from django.core.exceptions import ValidationError
+from django.db import connections
+
+logger = logging.getLogger(__name__)
 
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
 
-    def emit(self, record):
-        if current_task is None:
-            return
+    Rather than saving each log entry individually, entries are buffered per task and written to the database in bulk
+    whenever `flush_size` entries have accumulated, whenever an entry of `flush_level` or higher is logged, and when the
+    task completes (see `flush_job_log_entries()`). A timer also writes any buffered entries at most `flush_interval`
+    seconds after they were logged, so that the progress of a task stays visible even while it runs for a long time
+    without logging anything else.
+    """
 
-        from nautobot.extras.models.jobs import JobResult
+    # All live instances of this class, so that their buffers can be flushed when a task completes
+    _instances = weakref.WeakSet()
 
-        try:
-            self.format(record)
+    def __init__(self, level=logging.NOTSET, flush_size=500, flush_interval=1.0, flush_level=logging.WARNING):
+        super().__init__(level)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        # {task_id: JobResult or None}, avoiding a JobResult lookup for every single log message
+        self._job_results = {}
+        # {task_id: [JobLogEntry, ...]}
+        self._buffers = {}
+        # {task_id: threading.Timer that writes the buffered entries once `flush_interval` has elapsed}
+        self._timers = {}
+        self._instances.add(self)
 
+    def _get_job_result(self, task_id):
+        """Get the (cached) JobResult corresponding to the given task_id, or None if there's no such JobResult."""
+        from nautobot.extras.models.jobs import JobResult
+
+        if task_id not in self._job_results:
             try:
-                job_result = JobResult.objects.get(id=record.task_id)
+                self._job_results[task_id] = JobResult.objects.get(id=task_id)
             except (ValidationError, JobResult.DoesNotExist):
                 # Both of these cases are very rare
                 # ValidationError - because the task_id might not a valid UUID
                 # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+                self._job_results[task_id] = None
+        return self._job_results[task_id]
+
+    def emit(self, record):
+        if current_task is None:
+            return
+
+        try:
+            self.format(record)
+
+            job_result = self._get_job_result(record.task_id)
+            if job_result is None:
                 return
 
             # Skip recording the log entry if it has been marked as such
             if getattr(record, "skip_db_logging", False):
                 return
 
-            job_result.log(
+            log_entry = job_result.build_log_entry(
                 message=record.message,
                 level_choice=record.levelname.lower(),
                 obj=getattr(record, "object", None),
                 grouping=getattr(record, "grouping", record.funcName),
             )
+            buffer = self._buffers.setdefault(record.task_id, [])
+            buffer.append(log_entry)
+
+            if len(buffer) >= self.flush_size or record.levelno >= self.flush_level:
+                self._flush_task(record.task_id)
+            elif record.task_id not in self._timers:
+                timer = threading.Timer(self.flush_interval, self._flush_on_timer, args=[record.task_id])
+                timer.daemon = True
+                self._timers[record.task_id] = timer
+                timer.start()
         except Exception:
             self.handleError(record)
+
+    def _flush_task(self, task_id):
+        """Write any buffered log entries for the given task_id to the database."""
+        timer = self._timers.pop(task_id, None)
+        if timer is not None:
+            timer.cancel()
+        log_entries = self._buffers.pop(task_id, None)
+        if log_entries:
+            self._job_results[task_id].bulk_log(log_entries)
+
+    def _flush_on_timer(self, task_id):
+        """Write the buffered log entries for the given task_id from a timer thread."""
+        try:
+            self.flush(task_id=task_id)
+        except Exception:
+            logger.exception("Failed to write the buffered log entries of task %s", task_id)
+        finally:
+            # Don't leave the database connections of this short-lived thread open
+            connections.close_all()
+
+    def flush(self, task_id=None, discard=False):
+        """
+        Write buffered log entries to the database, for the given task_id only or for all tasks.
+
+        Args:
+            task_id (str): If specified, only flush the log entries of this task.
+            discard (bool): If True, also forget the cached JobResult for the flushed task(s), as no more logs are expected.
+        """
+        self.acquire()
+        try:
+            task_ids = [task_id] if task_id is not None else list(self._job_results)
+            for tid in task_ids:
+                if tid not in self._job_results:
+                    continue
+                try:
+                    self._flush_task(tid)
+                finally:
+                    if discard:
+                        self._job_results.pop(tid, None)
+                        self._buffers.pop(tid, None)
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush(discard=True)
+        super().close()
+
+
+def flush_job_log_entries(task_id=None, discard=False):
+    """Write the buffered JobLogEntry records of all NautobotDatabaseHandler instances to the database."""
+    for handler in list(NautobotDatabaseHandler._instances):
+        handler.flush(task_id=task_id, discard=discard)
@@ -1,11 +1,40 @@
+import contextlib
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
 from django.test.client import RequestFactory
 from graphene.types import Scalar
 from graphene_django.settings import graphene_settings
 from graphql import get_default_backend
+from graphql.execution import ExecutionResult
 from graphql.language import ast
+import redis.exceptions
 
+from nautobot.core.graphql.analysis import QueryAnalyzer
 from nautobot.extras.models import GraphQLQuery
 
+SAVED_QUERY_CACHE_KEY_PREFIX = "nautobot.core.graphql.execute_saved_query"
+MODEL_VERSION_CACHE_KEY_PREFIX = "nautobot.core.graphql.model_version"
+
+# Models whose changes may affect the results of any saved query, regardless of the types of objects that it queries
+SAVED_QUERY_CACHE_DEPENDENCIES = (
+    "extras.computedfield",
+    "extras.configcontext",
+    "extras.customfield",
+    "extras.relationshipassociation",
+    "extras.renderedconfigcontext",
+    "extras.staticgroupassociation",
+    # Users' permissions, and thereby which objects a saved query returns for them
+    "auth.group",
+    "users.objectpermission",
+    "users.objectpermission_groups",
+    "users.user",
+    "users.user_groups",
+)
+
 
 def execute_query(query, variables=None, request=None, user=None):
     """Execute a query from the ORM.
@@ -48,7 +77,70 @@ def execute_saved_query(saved_query_name, **kwargs):
         (GraphQLDocument): Result for query
     """
     query = GraphQLQuery.objects.get(name=saved_query_name)
-    return execute_query(query=query.query, **kwargs)
+    user = kwargs.get("user") or getattr(kwargs.get("request"), "user", None)
+    if settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT <= 0 or user is None:
+        return execute_query(query=query.query, **kwargs)
+
+    cache_key = get_saved_query_cache_key(query, user, kwargs.get("variables"))
+    if cache_key is None:
+        return execute_query(query=query.query, **kwargs)
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        data = cache.get(cache_key)
+        if data is not None:
+            return ExecutionResult(data=data)
+
+    result = execute_query(query=query.query, **kwargs)
+    if not result.errors and not result.invalid:
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.set(cache_key, result.data, settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT)
+    return result
+
+
+def _get_model_version_cache_key(label):
+    return f"{MODEL_VERSION_CACHE_KEY_PREFIX}.{label}"
+
+
+def get_saved_query_cache_key(query, user, variables=None):
+    """
+    Get the key under which the results of the given saved query, as run by the given user, are cached.
+
+    The key includes a version token for each model involved in the query (see `invalidate_saved_query_results()`),
+    so that any change to one of these models results in a new key, and thereby in the query being run again.
+
+    Args:
+        query (GraphQLQuery): Saved query
+        user (User): User running the query
+        variables (dict): Values of the query variables, if any
+
+    Returns:
+        (str): The cache key, or None if the version tokens are unavailable, in which case the results can't be cached.
+    """
+    document = get_default_backend().document_from_string(graphene_settings.SCHEMA, query.query)
+    models = (
+        QueryAnalyzer(document.schema, document.document_ast, variables=variables, estimate_cost=False).analyze().models
+    )
+    labels = sorted({model._meta.label_lower for model in models}.union(SAVED_QUERY_CACHE_DEPENDENCIES))
+    try:
+        versions = cache.get_many([_get_model_version_cache_key(label) for label in labels])
+    except redis.exceptions.ConnectionError:
+        return None
+    key_data = [str(query.pk), query.query, str(user.pk), variables or {}, sorted(versions.items())]
+    key_hash = hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{SAVED_QUERY_CACHE_KEY_PREFIX}.{key_hash}"
+
+
+def invalidate_saved_query_results(labels):
+    """
+    Invalidate the cached results of all saved queries involving any of the given models.
+
+    Rather than finding and deleting the affected results, this replaces the version tokens of the given models, so that
+    the affected results will never be looked up again, and will simply expire from the cache.
+
+    Args:
+        labels (iterable): Lowercase labels of the changed models, such as `"dcim.device"`
+    """
+    with contextlib.suppress(redis.exceptions.ConnectionError):
+        cache.set_many({_get_model_version_cache_key(label): uuid.uuid4().hex for label in labels}, timeout=None)
 
 
 # See also:
@@ -0,0 +1,215 @@
+"""Static analysis of GraphQL queries, used to enforce depth and cost limits before a query is executed."""
+
+from collections import namedtuple
+import math
+
+from django.conf import settings
+from django.db import connection
+from graphql import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import get_named_type, GraphQLInterfaceType, GraphQLList, GraphQLObjectType
+from graphql.utils.get_operation_ast import get_operation_ast
+
+QueryAnalysis = namedtuple("QueryAnalysis", ["depth", "cost", "models"])
+QueryAnalysis.__doc__ = """
+Result of analyzing a GraphQL query.
+
+Attributes:
+    depth (int): Maximum nesting depth of the object fields selected by the query, where `{ devices { name } }` has a
+        depth of 1 and `{ devices { location { name } } }` has a depth of 2.
+    cost (int): Estimated number of field resolutions needed to execute the query, or None if not estimated.
+    models (set): Django models whose objects are (or may be) included in the query results.
+"""
+
+
+def get_estimated_row_count(model):
+    """
+    Get an estimate of the number of rows in the database table of the given model.
+
+    On PostgreSQL this uses the planner statistics of the table, which are nearly free to look up; otherwise (or if the
+    table hasn't been analyzed yet) the rows are actually counted.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+            row = cursor.fetchone()
+        if row is not None and row[0] > 0:
+            return int(row[0])
+    return model._default_manager.count()
+
+
+class QueryAnalyzer:
+    """
+    Walk the selections of a GraphQL query operation to determine its depth, its estimated cost, and the models involved.
+
+    The cost of a query is estimated as the number of times that its fields will be resolved. The number of objects
+    returned by a list field is estimated from the number of rows in the database table of its model (for a top-level
+    list) or from the average number of such objects per parent object (for a nested list), capped by any `limit`
+    argument of the field. For example, with 1000 devices and 50000 interfaces in the database,
+    `{ devices(limit: 10) { name interfaces { name } } }` has an estimated cost of
+    `1 + 10 + 10 + (10 * 50) = 521`.
+
+    Args:
+        schema (GraphQLSchema): Schema to analyze the query against
+        document_ast (Document): Parsed GraphQL document
+        variables (dict): Values of the variables of the query, if any
+        operation_name (str): Name of the operation to analyze, if the document defines more than one
+        estimate_cost (bool): Whether to estimate the cost of the query, which requires database queries
+    """
+
+    def __init__(self, schema, document_ast, variables=None, operation_name=None, estimate_cost=True):
+        self.schema = schema
+        self.operation = get_operation_ast(document_ast, operation_name)
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+        self.variables = {}
+        if self.operation is not None:
+            for variable_definition in self.operation.variable_definitions or []:
+                if isinstance(variable_definition.default_value, ast.IntValue):
+                    self.variables[variable_definition.variable.name.value] = int(
+                        variable_definition.default_value.value
+                    )
+        self.variables.update(variables or {})
+        self.estimate_cost = estimate_cost
+        self.models = set()
+        self._row_counts = {}
+
+    def analyze(self):
+        """Analyze the query, returning a `QueryAnalysis`."""
+        if self.operation is None:
+            return QueryAnalysis(depth=0, cost=0 if self.estimate_cost else None, models=self.models)
+        if self.operation.operation == "mutation":
+            root_type = self.schema.get_mutation_type()
+        elif self.operation.operation == "subscription":
+            root_type = self.schema.get_subscription_type()
+        else:
+            root_type = self.schema.get_query_type()
+        depth, cost = self._analyze_selection_set(root_type, self.operation.selection_set, 1, None, 0, frozenset())
+        return QueryAnalysis(depth=depth, cost=cost if self.estimate_cost else None, models=self.models)
+
+    def get_row_count(self, model):
+        """Get the (estimated) number of rows in the table of the given model, at most once per model."""
+        if not self.estimate_cost:
+            return 1
+        if model not in self._row_counts:
+            self._row_counts[model] = get_estimated_row_count(model)
+        return self._row_counts[model]
+
+    def _get_int_argument(self, field_ast, name):
+        """Get the value of the integer argument `name` of a field, if given."""
+        for argument in field_ast.arguments or []:
+            if argument.name.value != name:
+                continue
+            if isinstance(argument.value, ast.IntValue):
+                return int(argument.value.value)
+            if isinstance(argument.value, ast.Variable):
+                value = self.variables.get(argument.value.name.value)
+                return value if isinstance(value, int) else None
+        return None
+
+    def _iter_fields(self, parent_type, selection_set, visited_fragments):
+        """Yield (parent_type, field_ast) for each field in a selection set, expanding any fragments."""
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                yield parent_type, selection
+            elif isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type_map().get(selection.type_condition.name.value) or parent_type
+                yield from self._iter_fields(fragment_type, selection.selection_set, visited_fragments)
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                fragment_type = self.schema.get_type_map().get(fragment.type_condition.name.value) or parent_type
+                yield from self._iter_fields(fragment_type, fragment.selection_set, visited_fragments | {name})
+
+    def _analyze_selection_set(self, parent_type, selection_set, multiplier, parent_model, depth, visited_fragments):
+        """
+        Analyze the fields selected on `multiplier` objects of type `parent_type` (and model `parent_model`, if any).
+
+        Returns:
+            (tuple[int, int]): The maximum depth and the estimated cost of the selection set.
+        """
+        max_depth = depth
+        cost = 0
+        for field_parent_type, field_ast in self._iter_fields(parent_type, selection_set, visited_fragments):
+            if not isinstance(field_parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                continue
+            field = field_parent_type.fields.get(field_ast.name.value)
+            if field is None:
+                # Introspection fields such as `__typename`
+                continue
+            cost += multiplier
+            if field_ast.selection_set is None:
+                continue
+
+            field_type = get_named_type(field.type)
+            model = getattr(getattr(getattr(field_type, "graphene_type", None), "_meta", None), "model", None)
+            if model is not None:
+                self.models.add(model)
+            count = multiplier
+            if self._is_list(field.type):
+                limit = self._get_int_argument(field_ast, "limit")
+                if limit is not None and limit <= 0:
+                    limit = None
+                if model is not None:
+                    per_parent = self.get_row_count(model)
+                    if parent_model is not None:
+                        per_parent = math.ceil(per_parent / max(self.get_row_count(parent_model), 1))
+                    count = multiplier * (per_parent if limit is None else min(per_parent, limit))
+                elif limit is not None:
+                    # Not backed by a model, so there's nothing to go on but the limit
+                    count = multiplier * limit
+
+            field_depth, field_cost = self._analyze_selection_set(
+                field_type, field_ast.selection_set, count, model, depth + 1, visited_fragments
+            )
+            max_depth = max(max_depth, field_depth)
+            cost += field_cost
+        return max_depth, cost
+
+    @staticmethod
+    def _is_list(graphql_type):
+        """Check whether the given (possibly non-null) GraphQL type is a list type."""
+        while hasattr(graphql_type, "of_type"):
+            if isinstance(graphql_type, GraphQLList):
+                return True
+            graphql_type = graphql_type.of_type
+        return False
+
+
+def check_query_limits(schema, document_ast, variables=None, operation_name=None):
+    """
+    Check the given GraphQL query against `settings.GRAPHQL_MAX_QUERY_DEPTH` and `settings.GRAPHQL_MAX_QUERY_COST`.
+
+    Returns:
+        (list[GraphQLError]): The limits that the query exceeds, if any.
+    """
+    max_depth = settings.GRAPHQL_MAX_QUERY_DEPTH
+    max_cost = settings.GRAPHQL_MAX_QUERY_COST
+    if not max_depth and not max_cost:
+        return []
+
+    analysis = QueryAnalyzer(
+        schema, document_ast, variables=variables, operation_name=operation_name, estimate_cost=bool(max_cost)
+    ).analyze()
+    errors = []
+    if max_depth and analysis.depth > max_depth:
+        errors.append(
+            GraphQLError(
+                f"Query has a depth of {analysis.depth}, which exceeds the maximum allowed depth of {max_depth}."
+            )
+        )
+    if max_cost and analysis.cost > max_cost:
+        errors.append(
+            GraphQLError(
+                f"Query has an estimated cost of {analysis.cost}, which exceeds the maximum allowed cost of {max_cost}. "
+                "Consider requesting fewer fields or nested objects, or adding a `limit` to list fields."
+            )
+        )
+    return errors
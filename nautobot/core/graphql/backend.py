@@ -0,0 +1,92 @@
+"""GraphQL backend that caches parsed and validated documents, and enforces query limits before execution."""
+
+from collections import OrderedDict
+import hashlib
+import threading
+
+from django.conf import settings
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.language import ast
+from graphql.validation import validate
+
+from nautobot.core.graphql.analysis import check_query_limits
+
+
+class NautobotGraphQLDocument(GraphQLDocument):
+    """
+    A parsed GraphQL document, which validates itself against the schema at most once.
+
+    Before each execution, the query is checked against the configured depth and cost limits for the given variables.
+    """
+
+    def __init__(self, schema, document_string, document_ast, execute_params=None):
+        super().__init__(schema, document_string, document_ast, execute=self._execute)
+        self.execute_params = execute_params or {}
+        self._validation_errors = None
+
+    @property
+    def validation_errors(self):
+        """The errors (if any) found when validating this document against its schema."""
+        if self._validation_errors is None:
+            self._validation_errors = validate(self.schema, self.document_ast)
+        return self._validation_errors
+
+    def _execute(self, *args, **kwargs):
+        if kwargs.pop("validate", True) and self.validation_errors:
+            return ExecutionResult(errors=self.validation_errors, invalid=True)
+
+        limit_errors = check_query_limits(
+            self.schema,
+            self.document_ast,
+            variables=kwargs.get("variable_values"),
+            operation_name=kwargs.get("operation_name"),
+        )
+        if limit_errors:
+            return ExecutionResult(errors=limit_errors, invalid=True)
+
+        return execute(self.schema, self.document_ast, *args, **{**self.execute_params, **kwargs})
+
+
+class NautobotGraphQLBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend which keeps a bounded, least-recently-used cache of parsed and validated documents.
+
+    Documents are cached by schema and by a hash of the query string, so that repeated queries (such as saved queries,
+    or the same query issued by automation against many devices) are only parsed and validated once per process.
+    The size of the cache is controlled by `settings.GRAPHQL_DOCUMENT_CACHE_SIZE`.
+    """
+
+    def __init__(self, executor=None):
+        super().__init__(executor=executor)
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def document_from_string(self, schema, document_string):
+        if isinstance(document_string, ast.Document):
+            document = super().document_from_string(schema, document_string)
+            return NautobotGraphQLDocument(schema, document.document_string, document.document_ast, self.execute_params)
+
+        cache_size = settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+        key = (schema, hashlib.sha256(document_string.encode("utf-8")).hexdigest())
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+        # Parse outside of the lock; a syntax error is raised to the caller and never cached
+        document = super().document_from_string(schema, document_string)
+        document = NautobotGraphQLDocument(schema, document.document_string, document.document_ast, self.execute_params)
+        if cache_size > 0:
+            with self._lock:
+                self._documents[key] = document
+                while len(self._documents) > cache_size:
+                    self._documents.popitem(last=False)
+        return document
+
+    def clear_cache(self):
+        """Discard all cached documents."""
+        with self._lock:
+            self._documents.clear()
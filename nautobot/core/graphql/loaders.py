@@ -0,0 +1,203 @@
+"""DataLoaders for batching the resolution of GraphQL fields across all objects in a GraphQL query's results."""
+
+from collections import defaultdict
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import F, Q
+import graphene_django_optimizer as gql_optimizer
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.config_context_index import get_config_context_index
+from nautobot.extras.models import ComputedField, DynamicGroup, RelationshipAssociation, RenderedConfigContext
+
+logger = logging.getLogger(__name__)
+
+
+def get_loader(info, key, loader_factory):
+    """
+    Get the DataLoader identified by `key` for the current GraphQL request, creating it if needed.
+
+    Loaders are stored on the request (`info.context`) so that they live exactly as long as the request does. As a
+    request may be reused for several GraphQL executions, loaders should batch but not cache their results; see
+    `BatchLoader`.
+
+    Args:
+        info (ResolveInfo): The GraphQL resolve info of the field being resolved
+        key (tuple): Hashable key identifying the loader
+        loader_factory (callable): Function taking no arguments and returning a new DataLoader instance
+    """
+    if info.context is None:
+        return loader_factory()
+    loaders = getattr(info.context, "_graphql_loaders", None)
+    if loaders is None:
+        loaders = {}
+        setattr(info.context, "_graphql_loaders", loaders)
+    if key not in loaders:
+        loaders[key] = loader_factory()
+    return loaders[key]
+
+
+def get_field_key(info):
+    """Identify the position of the field being resolved in the query, so loaders can be shared by its resolvers."""
+    return tuple(id(field_ast) for field_ast in info.field_asts)
+
+
+class BatchLoader(DataLoader):
+    """Base class for the DataLoaders in this module, which batch loads of the same kind but don't cache results."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("cache", False)
+        super().__init__(**kwargs)
+
+
+class RelationshipPeersLoader(BatchLoader):
+    """
+    Load the peer objects of a given Relationship for many objects at once.
+
+    Given the primary keys of objects on one `side` of the `relationship`, this finds all of their associations in a
+    single query and all of the peer objects in a second query, rather than running those queries once per object.
+    Each key resolves to the list of its peer objects, in the default ordering of the peer model.
+
+    If `info` is given, the query for the peer objects is optimized for the fields requested in the GraphQL query.
+    """
+
+    def __init__(self, relationship, side, peer_model, info, **kwargs):
+        super().__init__(**kwargs)
+        self.relationship = relationship
+        self.side = side
+        self.peer_model = peer_model
+        self.info = info
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        peer_ids_by_key = defaultdict(list)
+        associations = RelationshipAssociation.objects.filter(relationship=self.relationship)
+        if not self.relationship.symmetric:
+            peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+            associations = associations.filter(**{f"{self.side}_id__in": keys}).values_list(
+                f"{self.side}_id", f"{peer_side}_id"
+            )
+            for key, peer_id in associations:
+                peer_ids_by_key[key].append(peer_id)
+        else:
+            # Get objects that are peers for this relationship, regardless of side
+            key_set = set(keys)
+            associations = associations.filter(Q(source_id__in=keys) | Q(destination_id__in=keys)).values_list(
+                "source_id", "destination_id"
+            )
+            for source_id, destination_id in associations:
+                if source_id in key_set:
+                    peer_ids_by_key[source_id].append(destination_id)
+                if destination_id in key_set:
+                    peer_ids_by_key[destination_id].append(source_id)
+
+        all_peer_ids = {peer_id for peer_ids in peer_ids_by_key.values() for peer_id in peer_ids}
+        peers = self.peer_model.objects.filter(id__in=all_peer_ids)
+        if not peers.ordered:
+            peers = peers.order_by("pk")
+        # https://github.com/nautobot/nautobot/issues/1228 - graphene_django_optimizer can fail in some cases,
+        # for example if only the ID of the related object was requested, so fall back to an un-optimized query.
+        try:
+            peers = list(gql_optimizer.query(peers, self.info) if self.info is not None else peers)
+        except (TypeError, AttributeError):
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+            peers = list(peers)
+        # Position of each peer in the ordered results, so that each key's peers are returned in that same order
+        peer_positions = {peer.pk: position for position, peer in enumerate(peers)}
+
+        results = []
+        for key in keys:
+            positions = sorted(
+                {peer_positions[peer_id] for peer_id in peer_ids_by_key[key] if peer_id in peer_positions}
+            )
+            results.append([peers[position] for position in positions])
+        return Promise.resolve(results)
+
+
+class ConfigContextDataLoader(BatchLoader):
+    """
+    Load the (unmerged) config context data of many objects of a ConfigContextModel at once.
+
+    Uses the in-memory ConfigContext scope index to match the config contexts applying to all of the given primary
+    keys at once; each key resolves to the value that a `config_context_data` annotation would have.
+    """
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        config_context_data = get_config_context_index().get_config_context_data(self.model, keys)
+        return Promise.resolve([config_context_data.get(key) for key in keys])
+
+
+class RenderedConfigContextLoader(BatchLoader):
+    """
+    Load the stored RenderedConfigContext data of many objects of a ConfigContextModel at once.
+
+    Each key resolves to the stored data of the object, or to None if no rendered config context is stored for it.
+    """
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        rendered_config_contexts = dict(
+            RenderedConfigContext.objects.filter(
+                assigned_object_type=ContentType.objects.get_for_model(self.model), assigned_object_id__in=keys
+            ).values_list("assigned_object_id", "data")
+        )
+        return Promise.resolve([rendered_config_contexts.get(key) for key in keys])
+
+
+class DynamicGroupsLoader(BatchLoader):
+    """
+    Load the DynamicGroups that many objects of a given model are members of, at once.
+
+    Each key resolves to the same list of groups as `DynamicGroup.objects.get_for_object()` would return.
+    """
+
+    def __init__(self, model, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        groups_by_key = defaultdict(list)
+        groups = (
+            DynamicGroup.objects.filter(
+                content_type__app_label=self.model._meta.app_label,
+                content_type__model=self.model._meta.model_name,
+                static_group_associations__associated_object_id__in=keys,
+            )
+            .annotate(member_id=F("static_group_associations__associated_object_id"))
+            .select_related("content_type")
+        )
+        for group in groups:
+            groups_by_key[group.member_id].append(group)
+        return Promise.resolve([groups_by_key[key] for key in keys])
+
+
+class ComputedFieldLoader(BatchLoader):
+    """
+    Render a given ComputedField for many objects at once.
+
+    The ComputedField itself is only looked up once, rather than once per object; keys are the objects themselves.
+    """
+
+    def __init__(self, model, key, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+        self.key = key
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        try:
+            computed_field = ComputedField.objects.get_for_model(self.model).get(key=self.key)
+        except ComputedField.DoesNotExist:
+            logger.warning(
+                "Computed Field with key %s does not exist for model %s", self.key, self.model._meta.verbose_name
+            )
+            return Promise.resolve([None for _ in keys])
+        return Promise.resolve([computed_field.render(context={"obj": obj}) for obj in keys])
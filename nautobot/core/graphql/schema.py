@@ -24,6 +24,12 @@ from nautobot.core.graphql.generators import (
     generate_restricted_queryset,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import (
+    ConfigContextDataLoader,
+    DynamicGroupsLoader,
+    get_loader,
+    RenderedConfigContextLoader,
+)
 from nautobot.core.graphql.types import ContentTypeType, DateType, JSON
 from nautobot.core.graphql.utils import str_to_var_name
 from nautobot.dcim.graphql.types import (
@@ -363,8 +369,26 @@ def extend_schema_type_config_context(schema_type, model):
     if "local_config_context_data" not in fields_name:
         return schema_type
 
-    def resolve_config_context(self, args):
-        return self.get_config_context()
+    def resolve_config_context(self, info):
+        if hasattr(self, "config_context_data") or hasattr(self, "rendered_config_context"):
+            # Already annotated by annotate_config_context_data() or annotate_rendered_config_context()
+            return self.get_config_context()
+
+        def merge_config_context_data(config_context_data):
+            self.config_context_data = config_context_data
+            return self.get_config_context()
+
+        def load_config_context_data(rendered_config_context=None):
+            if rendered_config_context is not None:
+                return rendered_config_context
+            # Retrieve the config context data of all objects resolving this field at this point in the query at once
+            loader = get_loader(info, ("config_context", model), lambda: ConfigContextDataLoader(model))
+            return loader.load(self.pk).then(merge_config_context_data)
+
+        if settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            loader = get_loader(info, ("rendered_config_context", model), lambda: RenderedConfigContextLoader(model))
+            return loader.load(self.pk).then(load_config_context_data)
+        return load_config_context_data()
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
@@ -379,8 +403,10 @@ def extend_schema_type_global_features(schema_type, model):
     # associated_contacts and associated_object_metadata are handled elsewhere by extend_schema_type_filter()
     if getattr(model, "is_dynamic_group_associable_model", False):
 
-        def resolve_dynamic_groups(self, args):
-            return self.dynamic_groups
+        def resolve_dynamic_groups(self, info):
+            # Retrieve the groups of all objects resolving this field at this point in the query at once
+            loader = get_loader(info, ("dynamic_groups", model), lambda: DynamicGroupsLoader(model))
+            return loader.load(self.pk)
 
         setattr(schema_type, "resolve_dynamic_groups", resolve_dynamic_groups)
         schema_type._meta.fields["dynamic_groups"] = graphene.Field.mounted(graphene.List(DynamicGroupType))
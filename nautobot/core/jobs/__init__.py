@@ -1,30 +1,42 @@
 import codecs
 import contextlib
 from io import BytesIO
+import itertools
+import time
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.db import transaction
+from django.db import IntegrityError, models, router, transaction
+from django.db.models.signals import post_save, pre_save
 from django.http import QueryDict
-from rest_framework import exceptions as drf_exceptions
+from rest_framework import exceptions as drf_exceptions, serializers
+from rest_framework.utils import model_meta
 
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.mixins import RelatedObjectCache
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.serializers import RelationshipModelSerializerMixin
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app, register_jobs
 from nautobot.core.exceptions import AbortTransaction
+from nautobot.core.jobs.cable_paths import TraceCablePaths
 from nautobot.core.jobs.cleanup import LogsCleanup
 from nautobot.core.jobs.groups import RefreshDynamicGroupCaches
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
+from nautobot.extras.api.mixins import TaggedModelSerializerMixin
+from nautobot.extras.context_managers import change_context_state, deferred_change_logging_for_bulk_operation
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
 from nautobot.extras.jobs import BooleanVar, ChoiceVar, FileVar, Job, ObjectVar, RunJobTaskFailed, StringVar, TextVar
 from nautobot.extras.models import ExportTemplate, GitRepository
 
 name = "System Jobs"
 
+# Number of rows of data that ImportObjects validates and creates at once when importing in bulk
+IMPORT_OBJECTS_BATCH_SIZE = 1000
+
 
 class GitRepositorySync(Job):
     """
@@ -198,10 +210,15 @@ class ExportObjectList(Job):
             self.logger.debug("Found serializer class: `%s`", serializer_class.__name__)
             renderer = NautobotCSVRenderer()
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
-            # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
-            # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
+
+            def serialized_chunks(chunk_size=1000):
+                objects = queryset.iterator(chunk_size=chunk_size)
+                while chunk := list(itertools.islice(objects, chunk_size)):
+                    # The force_csv=True attribute is a hack, but much easier than trying to construct a valid
+                    # HttpRequest object from scratch that passes all implicit and explicit assumptions in Django/DRF.
+                    yield serializer_class(chunk, many=True, context={"request": None}, force_csv=True).data
+
+            csv_data = "".join(renderer.render_chunks(serialized_chunks(), model=model))
             self.create_file(filename + ".csv", csv_data)
 
 
@@ -221,6 +238,13 @@ class ImportObjects(Job):
         default=True,
         description="If an error is encountered when processing any row of data, rollback the entire import such that no data is imported.",
     )
+    bulk_import = BooleanVar(
+        label="Bulk Import",
+        required=False,
+        default=False,
+        description="Validate and create objects in batches of rows, which is much faster for large amounts of data. "
+        "Rows are logged per batch rather than individually, except for any errors.",
+    )
 
     template_name = "system_jobs/import_objects.html"
 
@@ -232,11 +256,12 @@ class ImportObjects(Job):
         soft_time_limit = 1800
         time_limit = 2000
 
-    def _perform_atomic_operation(self, data, serializer_class, queryset):
+    def _perform_atomic_operation(self, data, serializer_class, queryset, bulk_import=False):
+        perform_operation = self._perform_bulk_operation if bulk_import else self._perform_operation
         new_objs = []
         with contextlib.suppress(AbortTransaction):
             with transaction.atomic():
-                new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
+                new_objs, validation_failed = perform_operation(data, serializer_class, queryset)
                 if validation_failed:
                     raise AbortTransaction
                 return new_objs, validation_failed
@@ -244,11 +269,11 @@ class ImportObjects(Job):
         self.logger.warning("Rolling back all %s records.", len(new_objs))
         return [], validation_failed
 
-    def _perform_operation(self, data, serializer_class, queryset):
+    def _perform_operation(self, data, serializer_class, queryset, start=1, context=None):
         new_objs = []
         validation_failed = False
-        for row, entry in enumerate(data, start=1):
-            serializer = serializer_class(data=entry, context={"request": None})
+        for row, entry in enumerate(data, start=start):
+            serializer = serializer_class(data=entry, context=context or {"request": None})
             if serializer.is_valid():
                 try:
                     with transaction.atomic():
@@ -270,7 +295,145 @@ class ImportObjects(Job):
                     self.logger.error("Row %d: `%s`: `%s`", row, field, err[0])
         return new_objs, validation_failed
 
-    def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False):
+    def _perform_bulk_operation(self, data, serializer_class, queryset):
+        """
+        Validate and create the objects in batches of `IMPORT_OBJECTS_BATCH_SIZE` rows, rather than one row at a time.
+
+        The related objects referenced by all of the rows are looked up up front, with a few queries per related field.
+        Each batch is created in a single transaction, with its change log entries created in bulk, and is then checked
+        against the user's permissions with a single query. A batch that the user isn't permitted to create in full, or
+        whose rows conflict with one another, is rolled back and redone one row at a time to report the offending rows.
+        """
+        context = {"request": None, "related_object_cache": RelatedObjectCache()}
+        context["related_object_cache"].prefetch(serializer_class, data, context={"request": None})
+        use_bulk_create = self._can_bulk_create(queryset.model, serializer_class)
+
+        new_objs = []
+        validation_failed = False
+        for start in range(0, len(data), IMPORT_OBJECTS_BATCH_SIZE):
+            batch = data[start : start + IMPORT_OBJECTS_BATCH_SIZE]
+            started = time.monotonic()
+            batch_objs, batch_failed = self._perform_bulk_batch(
+                batch, start + 1, serializer_class, queryset, context, use_bulk_create
+            )
+            elapsed = max(time.monotonic() - started, 0.001)
+            self.logger.info(
+                "Rows %d-%d: Created %d record(s) in %.2f seconds (%d rows/second)",
+                start + 1,
+                start + len(batch),
+                len(batch_objs),
+                elapsed,
+                len(batch) / elapsed,
+            )
+            new_objs += batch_objs
+            validation_failed = validation_failed or batch_failed
+        return new_objs, validation_failed
+
+    def _perform_bulk_batch(self, batch, start, serializer_class, queryset, context, use_bulk_create):
+        """Validate and create the objects of a single batch of rows, starting at row number `start`."""
+        change_context = change_context_state.get()
+        try:
+            with deferred_change_logging_for_bulk_operation() if change_context is not None else transaction.atomic():
+                new_objs = []
+                valid_rows = []
+                errors = []
+                for row, entry in enumerate(batch, start=start):
+                    serializer = serializer_class(data=entry, context=context)
+                    if not serializer.is_valid():
+                        errors += [(row, field, err[0]) for field, err in serializer.errors.items()]
+                    elif use_bulk_create:
+                        valid_rows.append((row, serializer))
+                    else:
+                        # Saved right away, as later rows may reference this object
+                        new_objs.append(serializer.save())
+
+                if valid_rows:
+                    new_objs, relationship_errors = self._bulk_create_objects(queryset.model, valid_rows)
+                    errors += relationship_errors
+
+                permitted_pks = set(queryset.filter(pk__in=[obj.pk for obj in new_objs]).values_list("pk", flat=True))
+                if len(permitted_pks) != len(new_objs):
+                    raise AbortTransaction()
+        except (AbortTransaction, IntegrityError):
+            # Some of the objects aren't permitted to this user, or conflict with one another; redo the batch one row
+            # at a time to find out which
+            return self._perform_operation(batch, serializer_class, queryset, start=start, context=context)
+
+        for row, field, err in sorted(errors, key=lambda error: error[0]):
+            self.logger.error("Row %d: `%s`: `%s`", row, field, err)
+        return new_objs, bool(errors)
+
+    @staticmethod
+    def _can_bulk_create(model, serializer_class):
+        """
+        Check whether the objects of the given model can be created with `bulk_create()` rather than saved one by one.
+
+        That's only the case if neither the model nor its serializer customize how an object is saved (other than the
+        serializer's handling of tags and relationships), and if objects of the model can't reference one another.
+        """
+        model_classes = model.__mro__[: model.__mro__.index(models.Model)]
+        if model._meta.parents or any("save" in klass.__dict__ for klass in model_classes):
+            return False
+        if any(field.related_model is model for field in [*model._meta.concrete_fields, *model._meta.many_to_many]):
+            return False
+        standard_creates = {
+            serializers.ModelSerializer.create,
+            TaggedModelSerializerMixin.create,
+            RelationshipModelSerializerMixin.create,
+        }
+        serializer_classes = serializer_class.__mro__[: serializer_class.__mro__.index(serializers.ModelSerializer)]
+        return all(
+            klass.__dict__["create"] in standard_creates for klass in serializer_classes if "create" in klass.__dict__
+        )
+
+    @staticmethod
+    def _bulk_create_objects(model, valid_rows):
+        """
+        Create the objects of the given validated rows with `bulk_create()`, as their serializers' `create()` would.
+
+        The `pre_save` and `post_save` signals are sent for each object, so that change logging and any other receivers
+        of the signals behave just as if the objects had been saved one by one.
+
+        Returns:
+            (tuple[list, list]): The created objects, and (row, field, error) for each row that couldn't be created.
+        """
+        field_info = model_meta.get_field_info(model)
+        pending = []
+        errors = []
+        for row, serializer in valid_rows:
+            validated_data = dict(serializer.validated_data)
+            tags = validated_data.pop("tags", None)
+            relationships = validated_data.pop("relationships", {})
+            if isinstance(serializer, RelationshipModelSerializerMixin):
+                relationship_errors = model.required_related_objects_errors(
+                    output_for="api", initial_data=relationships
+                )
+                if relationship_errors:
+                    errors.append((row, "relationships", relationship_errors[0]))
+                    continue
+            many_to_many = {
+                field_name: validated_data.pop(field_name)
+                for field_name, relation_info in field_info.relations.items()
+                if relation_info.to_many and field_name in validated_data
+            }
+            pending.append((serializer, model(**validated_data), many_to_many, tags, relationships))
+
+        using = router.db_for_write(model)
+        for _, instance, _, _, _ in pending:
+            pre_save.send(sender=model, instance=instance, raw=False, using=using, update_fields=None)
+        model.objects.bulk_create([instance for _, instance, _, _, _ in pending])
+        for serializer, instance, many_to_many, tags, relationships in pending:
+            post_save.send(sender=model, instance=instance, created=True, raw=False, using=using, update_fields=None)
+            for field_name, value in many_to_many.items():
+                getattr(instance, field_name).set(value)
+            if tags is not None:
+                serializer._save_tags(instance, tags)
+            if relationships:
+                serializer._save_relationships(instance, relationships)
+            serializer.instance = instance
+        return [instance for _, instance, _, _, _ in pending], errors
+
+    def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False, bulk_import=False):
         if not self.user.has_perm(f"{content_type.app_label}.add_{content_type.model}"):
             self.logger.error('User "%s" does not have permission to create %s objects', self.user, content_type.model)
             raise PermissionDenied("User does not have create permissions on the requested content-type")
@@ -311,7 +474,11 @@ class ImportObjects(Job):
             )
             self.logger.info("Processing %d rows of data", len(data))
             if roll_back_if_error:
-                new_objs, validation_failed = self._perform_atomic_operation(data, serializer_class, queryset)
+                new_objs, validation_failed = self._perform_atomic_operation(
+                    data, serializer_class, queryset, bulk_import=bulk_import
+                )
+            elif bulk_import:
+                new_objs, validation_failed = self._perform_bulk_operation(data, serializer_class, queryset)
             else:
                 new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
         except drf_exceptions.ParseError as exc:
@@ -331,5 +498,13 @@ class ImportObjects(Job):
             raise RunJobTaskFailed("CSV import not fully successful, see logs")
 
 
-jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects, LogsCleanup, RefreshDynamicGroupCaches]
+jobs = [
+    ExportObjectList,
+    GitRepositorySync,
+    GitRepositoryDryRun,
+    ImportObjects,
+    LogsCleanup,
+    RefreshDynamicGroupCaches,
+    TraceCablePaths,
+]
 register_jobs(*jobs)
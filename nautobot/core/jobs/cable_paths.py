@@ -0,0 +1,73 @@
+import time
+
+from nautobot.dcim.models import Location
+from nautobot.dcim.utils import trace_cable_paths
+from nautobot.extras.jobs import BooleanVar, IntegerVar, Job, ObjectVar
+
+name = "System Jobs"
+
+
+class TraceCablePaths(Job):
+    """
+    System job to trace the cable paths of all path endpoints and report, and optionally repair, any differences from
+    the stored cable paths.
+    """
+
+    location = ObjectVar(
+        description="Only trace paths originating at this location or any of its descendants",
+        model=Location,
+        required=False,
+    )
+    repair = BooleanVar(
+        description="Create, update, and delete stored cable paths to match the traced paths",
+        default=False,
+    )
+    batch_size = IntegerVar(
+        description="Number of path endpoints to trace at once",
+        default=1000,
+        min_value=1,
+    )
+
+    class Meta:
+        name = "Trace Cable Paths"
+        description = "Re-trace cable paths and report (and optionally repair) any that are missing or out of date."
+        has_sensitive_variables = False
+
+    def run(self, *, location=None, repair=False, batch_size=1000):
+        start_time = time.monotonic()
+        result = {"traced": 0, "missing": 0, "outdated": 0, "obsolete": 0}
+        model_counts = {}
+        for model, total, traced, to_create, to_update, to_delete in trace_cable_paths(
+            location=location, repair=repair, batch_size=batch_size
+        ):
+            model_counts[model] = model_counts.get(model, 0) + traced
+            result["traced"] += traced
+            result["missing"] += len(to_create)
+            result["outdated"] += len(to_update)
+            result["obsolete"] += len(to_delete)
+            for description, cablepaths in (
+                ("Missing", to_create),
+                ("Outdated", to_update),
+                ("Obsolete", to_delete),
+            ):
+                for cablepath in cablepaths:
+                    self.logger.warning("%s cable path", description, extra={"object": cablepath.origin})
+            self.logger.info("Traced %d of %d %s", model_counts[model], total, model._meta.verbose_name_plural)
+
+        elapsed = time.monotonic() - start_time
+        result["duration"] = round(elapsed, 3)
+        result["paths_per_second"] = round(result["traced"] / elapsed, 1) if elapsed else None
+        self.logger.info(
+            "%s %d missing, %d outdated, and %d obsolete cable paths",
+            "Repaired" if repair else "Found",
+            result["missing"],
+            result["outdated"],
+            result["obsolete"],
+        )
+        self.logger.info(
+            "Traced %d cable paths in %.2f seconds (%s paths per second)",
+            result["traced"],
+            elapsed,
+            result["paths_per_second"],
+        )
+        return result
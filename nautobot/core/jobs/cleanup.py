@@ -43,6 +43,9 @@ class LogsCleanup(Job):
         required=False,
     )
 
+    # Number of ObjectChange records to delete at once
+    object_change_batch_size = 1000
+
     class Meta:
         name = "Logs Cleanup"
         description = "Delete ObjectChange and/or JobResult/JobLogEntry records older than a specified cutoff."
@@ -89,7 +92,9 @@ class LogsCleanup(Job):
 
             if CleanupTypes.OBJECT_CHANGE in cleanup_types:
                 self.logger.info("Deleting ObjectChange records prior to %s", cutoff)
-                deleted_count, _ = ObjectChange.objects.restrict(self.user, "delete").filter(time__lt=cutoff).delete()
+                deleted_count = self._delete_object_changes(
+                    ObjectChange.objects.restrict(self.user, "delete").filter(time__lt=cutoff)
+                )
                 self.logger.info("Deleted %d ObjectChange records", deleted_count)
                 result["extras.ObjectChange"] = deleted_count
 
@@ -98,3 +103,23 @@ class LogsCleanup(Job):
             # Be sure to clean up after ourselves!
             self.logger.debug("Re-connecting signals")
             pre_delete.connect(_handle_deleted_object)
+
+    def _delete_object_changes(self, queryset):
+        """
+        Delete the given ObjectChange records, oldest first, in batches of `object_change_batch_size`.
+
+        Each batch is selected by primary key and deleted as usual, so that Django still handles any dependent records
+        and deletion signals. Each batch is committed on its own, so that new changes can still be logged while a large
+        backlog of old records is deleted, and an interrupted cleanup keeps its progress.
+
+        Returns:
+            (int): The number of deleted records.
+        """
+        deleted_count = 0
+        while True:
+            pks = list(queryset.order_by("time").values_list("pk", flat=True)[: self.object_change_batch_size])
+            if not pks:
+                return deleted_count
+            batch_count, _ = ObjectChange.objects.filter(pk__in=pks).delete()
+            deleted_count += batch_count
+            self.logger.debug("Deleted %d ObjectChange records so far", deleted_count)
@@ -1,3 +1,5 @@
+import json
+
 from django.db import NotSupportedError
 from django.db.models import Aggregate, Func, JSONField
 
@@ -68,3 +70,96 @@ class EmptyGroupByJSONBAgg(JSONBAgg):
     """
 
     contains_aggregate = False
+
+
+def _get_json_path(key):
+    """Get the MySQL JSON path of the given top-level key of a JSON object."""
+    return f"$.{json.dumps(key)}"
+
+
+class JSONSetKey(Func):
+    """
+    Set a top-level key of a JSON object field to the given (JSON-serializable) value, for use in `QuerySet.update()`.
+
+    Supports both Postgres (`jsonb_set()`) and MySQL (`JSON_SET()`); any other keys of the object are left untouched.
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, value, **extra):
+        self.key = key
+        self.value = value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):  # pylint: disable=arguments-differ
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        value = json.dumps(self.value)
+        if connection.vendor == "postgresql":
+            return f"jsonb_set({sql}, ARRAY[%s]::text[], %s::jsonb)", [*params, self.key, value]
+        if connection.vendor == "mysql":
+            return f"JSON_SET({sql}, %s, CAST(%s AS JSON))", [*params, _get_json_path(self.key), value]
+        raise NotSupportedError(f"JSONSetKey is not supported for database {connection.vendor}")
+
+
+class JSONRemoveKey(Func):
+    """
+    Remove a top-level key from a JSON object field, for use in `QuerySet.update()`.
+
+    Supports both Postgres (the `-` operator) and MySQL (`JSON_REMOVE()`).
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, **extra):
+        self.key = key
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):  # pylint: disable=arguments-differ
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        if connection.vendor == "postgresql":
+            return f"({sql} - %s)", [*params, self.key]
+        if connection.vendor == "mysql":
+            return f"JSON_REMOVE({sql}, %s)", [*params, _get_json_path(self.key)]
+        raise NotSupportedError(f"JSONRemoveKey is not supported for database {connection.vendor}")
+
+
+class JSONReplaceArrayElement(Func):
+    """
+    Replace a value in the JSON array stored under a top-level key of a JSON object field, for use in `QuerySet.update()`.
+
+    On Postgres every occurrence of `old_value` in the array is replaced, keeping the order of the array's elements.
+    On MySQL, where this is implemented with `JSON_SEARCH()`, only string values are supported and only the first
+    occurrence is replaced; the rows to update must be filtered to those whose array actually contains `old_value`.
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, old_value, new_value, **extra):
+        self.key = key
+        self.old_value = old_value
+        self.new_value = new_value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):  # pylint: disable=arguments-differ
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        old_value = json.dumps(self.old_value)
+        new_value = json.dumps(self.new_value)
+        if connection.vendor == "postgresql":
+            # `sql` is the compiled SQL of the field expression, with any values of its own passed as `params`
+            return (
+                f"jsonb_set({sql}, ARRAY[%s]::text[], ("  # noqa: S608
+                "SELECT COALESCE(jsonb_agg("
+                "CASE WHEN element = %s::jsonb THEN %s::jsonb ELSE element END ORDER BY position"
+                "), '[]'::jsonb) "
+                f"FROM jsonb_array_elements({sql} -> %s) WITH ORDINALITY AS elements(element, position)"
+                "))",
+                [*params, self.key, old_value, new_value, *params, self.key],
+            )
+        if connection.vendor == "mysql":
+            # JSON_SEARCH() treats "%" and "_" as wildcards unless escaped
+            pattern = str(self.old_value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return (
+                f"JSON_REPLACE({sql}, JSON_UNQUOTE(JSON_SEARCH({sql}, 'one', %s, NULL, %s)), CAST(%s AS JSON))",
+                [*params, *params, pattern, f"{_get_json_path(self.key)}[*]", new_value],
+            )
+        raise NotSupportedError(f"JSONReplaceArrayElement is not supported for database {connection.vendor}")
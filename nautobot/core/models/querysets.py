@@ -1,4 +1,4 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Count, OuterRef, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -130,13 +130,7 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            attrs = Q()
-            tokens = {
-                "$user": user,
-            }
-
-            attrs = permissions.qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
-            qs = self.filter(attrs)
+            qs = self.filter(permissions.get_permission_filter(user, permission_required))
 
         return qs
 
@@ -77,14 +77,28 @@ if "NAUTOBOT_BANNER_LOGIN" in os.environ and os.environ["NAUTOBOT_BANNER_LOGIN"]
 if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] != "":
     BANNER_TOP = os.environ["NAUTOBOT_BANNER_TOP"]
 
+# Set this to True to serialize the objects changed in a transaction (once each) and log their changes in bulk once the
+# transaction commits, rather than serializing each object every time that it's saved.
+CHANGELOG_DEFER_SERIALIZATION = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_DEFER_SERIALIZATION", "False"))
+
 # Number of days to retain changelog entries. Set to 0 to retain changes indefinitely. Defaults to 90 if not set here.
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
 
+# Set this to True to only log the REST API representation (`object_data_v2`) of changed objects, skipping the legacy
+# `object_data` representation.
+CHANGELOG_SKIP_OBJECT_DATA = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_SKIP_OBJECT_DATA", "False"))
+
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
 
+# Set this to True to store the rendered config context of each device and virtual machine, updating it in the background
+# as relevant objects change, and to serve the stored data in the REST API and GraphQL rather than rendering it there.
+CONFIG_CONTEXT_MATERIALIZATION_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_CONFIG_CONTEXT_MATERIALIZATION_ENABLED", "False")
+)
+
 # UUID uniquely but anonymously identifying this Nautobot deployment.
 if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID"] != "":
     DEPLOYMENT_ID = os.environ["NAUTOBOT_DEPLOYMENT_ID"]
@@ -96,6 +110,12 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"] != "":
     DEVICE_NAME_AS_NATURAL_KEY = is_truthy(os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"])
 
+# Set this to True to automatically re-evaluate the Dynamic Group memberships of objects as they are created, updated,
+# and deleted, rather than relying solely on periodic full refreshes of the Dynamic Group member caches.
+DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED = is_truthy(
+    os.getenv("NAUTOBOT_DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED", "False")
+)
+
 # Exclude potentially sensitive models from wildcard view exemption. These may still be exempted
 # by specifying the model individually in the EXEMPT_VIEW_PERMISSIONS configuration parameter.
 EXEMPT_EXCLUDE_MODELS = (
@@ -839,6 +859,10 @@ GRAPHENE = {
 GRAPHQL_CUSTOM_FIELD_PREFIX = "cf"
 GRAPHQL_RELATIONSHIP_PREFIX = "rel"
 GRAPHQL_COMPUTED_FIELD_PREFIX = "cpf"
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("NAUTOBOT_GRAPHQL_DOCUMENT_CACHE_SIZE", "1000"))
+GRAPHQL_MAX_QUERY_COST = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_COST", "0"))
+GRAPHQL_MAX_QUERY_DEPTH = int(os.getenv("NAUTOBOT_GRAPHQL_MAX_QUERY_DEPTH", "0"))
+GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT = int(os.getenv("NAUTOBOT_GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT", "0"))
 
 
 #
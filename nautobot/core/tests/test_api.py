@@ -16,6 +16,7 @@ from rest_framework.exceptions import ParseError
 from rest_framework.settings import api_settings
 import yaml
 
+from nautobot.circuits import models as circuits_models
 from nautobot.circuits.models import Provider
 from nautobot.core import testing
 from nautobot.core.api.parsers import NautobotCSVParser
@@ -30,6 +31,7 @@ from nautobot.extras import choices, models as extras_models
 from nautobot.ipam import models as ipam_models
 from nautobot.ipam.api import serializers as ipam_serializers, views as ipam_api_views
 from nautobot.tenancy import models as tenancy_models
+from nautobot.users import models as users_models
 
 User = get_user_model()
 
@@ -185,6 +187,166 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Following the `next` links of cursor pagination should return every object once, in order of primary key."""
+        url = f"{self.url}?cursor=&limit=2"
+        ids = []
+        while url is not None:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertIsNone(response.data["count"])
+            self.assertIsNone(response.data["previous"])
+            self.assertLessEqual(len(response.data["results"]), 2)
+            ids += [result["id"] for result in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(ids, sorted(str(pk) for pk in Provider.objects.values_list("pk", flat=True)))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination_count(self):
+        """Cursor pagination should only count the objects if requested."""
+        response = self.client.get(f"{self.url}?cursor=&count=exact", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.data["count"], Provider.objects.count())
+
+        response = self.client.get(f"{self.url}?cursor=&count=estimate", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertIsInstance(response.data["count"], int)
+
+        response = self.client.get(f"{self.url}?cursor=notavalidcursor", **self.header)
+        self.assertHttpStatus(response, 404)
+
+
+class APIBulkOperationTestCase(testing.APITestCase):
+    """Test the bulk update and bulk deletion of objects through a model's list endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("circuits-api:provider-list")
+        self.providers = [Provider.objects.create(name=f"Bulk Provider {i}") for i in range(1, 4)]
+
+    def test_bulk_update(self):
+        """Objects are updated in bulk, with a change log entry for each of them."""
+        self.add_permissions("circuits.change_provider")
+        tag = extras_models.Tag.objects.create(name="Bulk Tag")
+        tag.content_types.add(ContentType.objects.get_for_model(Provider))
+        data = [
+            {"id": str(provider.pk), "account": f"account {i}", "tags": [str(tag.pk)]}
+            for i, provider in enumerate(self.providers)
+        ]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(self.providers))
+        for i, provider in enumerate(self.providers):
+            updated_provider = Provider.objects.get(pk=provider.pk)
+            self.assertEqual(updated_provider.account, f"account {i}")
+            self.assertGreater(updated_provider.last_updated, provider.last_updated)
+            self.assertEqual(list(updated_provider.tags.all()), [tag])
+        object_changes = extras_models.ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(Provider),
+            changed_object_id__in=[provider.pk for provider in self.providers],
+            action=choices.ObjectChangeActionChoices.ACTION_UPDATE,
+        )
+        self.assertEqual(object_changes.count(), len(self.providers))
+        self.assertEqual(len({object_change.request_id for object_change in object_changes}), 1)
+
+    def test_bulk_update_reports_errors_of_each_item(self):
+        """If any item is invalid, no object is updated, and the errors are reported in the order of the request."""
+        self.add_permissions("circuits.change_provider")
+        data = [
+            {"id": str(self.providers[0].pk), "account": "valid"},
+            {"id": str(self.providers[1].pk), "name": self.providers[2].name},
+            {"id": str(self.providers[2].pk), "account": "also valid"},
+        ]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("name", response.data[1])
+        self.assertEqual(response.data[2], {})
+        self.assertFalse(Provider.objects.filter(account__in=["valid", "also valid"]).exists())
+
+    def test_bulk_update_reports_conflicting_items(self):
+        """Updates that are each valid on their own, but conflict with one another, are reported as item errors."""
+        self.add_permissions("circuits.change_provider")
+        data = [
+            {"id": str(self.providers[0].pk), "name": "Bulk Provider Same Name"},
+            {"id": str(self.providers[1].pk), "name": "Bulk Provider Same Name"},
+        ]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("name", response.data[1])
+        self.assertFalse(Provider.objects.filter(name="Bulk Provider Same Name").exists())
+
+    def test_bulk_update_enforces_object_permissions(self):
+        """Bulk updates that would leave objects outside of the user's permitted objects are rejected."""
+        obj_perm = users_models.ObjectPermission.objects.create(
+            name="Test permission", constraints={"account": ""}, actions=["change"]
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Provider))
+        data = [{"id": str(provider.pk), "account": "not permitted"} for provider in self.providers]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Provider.objects.filter(account="not permitted").exists())
+
+    def test_bulk_delete(self):
+        """Objects are deleted all at once, with a change log entry for each of them."""
+        self.add_permissions("circuits.delete_provider")
+        data = [{"id": str(provider.pk)} for provider in self.providers]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Provider.objects.filter(pk__in=[provider.pk for provider in self.providers]).exists())
+        self.assertEqual(
+            extras_models.ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Provider),
+                changed_object_id__in=[provider.pk for provider in self.providers],
+                action=choices.ObjectChangeActionChoices.ACTION_DELETE,
+            ).count(),
+            len(self.providers),
+        )
+
+    def test_bulk_delete_change_logged_dependents(self):
+        """The deletion of change-logged objects that are deleted along with the given objects is change-logged too."""
+        self.add_permissions("circuits.delete_provider")
+        note = extras_models.Note.objects.create(assigned_object=self.providers[0], user=self.user, note="Bulk Note")
+        data = [{"id": str(provider.pk)} for provider in self.providers]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(extras_models.Note.objects.filter(pk=note.pk).exists())
+        self.assertTrue(
+            extras_models.ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(extras_models.Note),
+                changed_object_id=note.pk,
+                action=choices.ObjectChangeActionChoices.ACTION_DELETE,
+            ).exists()
+        )
+
+    def test_bulk_delete_protected(self):
+        """If any of the objects are protected from deletion, no object is deleted."""
+        self.add_permissions("circuits.delete_provider")
+        circuit_type = circuits_models.CircuitType.objects.create(name="Bulk Circuit Type")
+        circuits_models.Circuit.objects.create(
+            cid="Bulk Circuit",
+            provider=self.providers[1],
+            circuit_type=circuit_type,
+            status=extras_models.Status.objects.get_for_model(circuits_models.Circuit).first(),
+        )
+        data = [{"id": str(provider.pk)} for provider in self.providers]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_409_CONFLICT)
+        self.assertIn("Bulk Circuit", response.data["detail"])
+        self.assertEqual(Provider.objects.filter(pk__in=[provider.pk for provider in self.providers]).count(), 3)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -12,6 +12,7 @@ from netaddr import IPNetwork
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
+from nautobot.core.utils.permissions import get_permission_filter
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import ObjectChange, Status
 from nautobot.ipam.models import Namespace, Prefix
@@ -585,3 +586,96 @@ class ObjectPermissionAPIViewTestCase(TestCase):
             response_user2.data["count"], ObjectChange.objects.filter(Q(user=obj_user2) | Q(action="delete")).count()
         )
         self.assertEqual(response_user2.data["results"][0]["user"]["id"], obj_user2.pk)
+
+
+class ObjectPermissionBackendTestCase(TestCase):
+    """Tests for the caching of compiled ObjectPermission constraints and per-object permission checks."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location_type = LocationType.objects.get(name="Campus")
+        cls.locations = list(Location.objects.filter(location_type=cls.location_type)[:3])
+
+    def setUp(self):
+        self.user = User.objects.create(username="testuser")
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"name__in": [self.locations[0].name, self.locations[1].name]},
+            actions=["change"],
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+
+    def test_permission_filter_compiled_once_per_request(self):
+        self.assertTrue(self.user.has_perm("dcim.change_location"))
+        permission_filter = get_permission_filter(self.user, "dcim.change_location")
+        self.assertIs(get_permission_filter(self.user, "dcim.change_location"), permission_filter)
+        self.assertEqual(
+            set(Location.objects.restrict(self.user, "change").values_list("pk", flat=True)),
+            {self.locations[0].pk, self.locations[1].pk},
+        )
+
+        # A new request (new user instance) reuses the compiled filter, as the constraints haven't changed
+        user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(user.has_perm("dcim.change_location"))
+        self.assertEqual(get_permission_filter(user, "dcim.change_location"), permission_filter)
+
+    def test_has_perm_for_object_after_object_change(self):
+        """Per-object permission checks reflect the current database record of the object."""
+        location = self.locations[0]
+        self.assertTrue(self.user.has_perm("dcim.change_location", location))
+        location.name = "Renamed location"
+        location.save()
+        self.assertFalse(self.user.has_perm("dcim.change_location", location))
+
+    def test_permission_filter_does_not_hold_user_instance(self):
+        obj_perm = ObjectPermission.objects.create(name="Own changes", constraints={"user": "$user"}, actions=["view"])
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(ObjectChange))
+        self.assertTrue(self.user.has_perm("extras.view_objectchange"))
+        permission_filter = get_permission_filter(self.user, "extras.view_objectchange")
+        self.assertEqual(permission_filter.children, [("user", self.user)])
+        # The memoized filter refers to a copy of the user, not to the (request-scoped) instance itself
+        self.assertIsNot(permission_filter.children[0][1], self.user)
+
+    def test_has_perm_for_object_after_permission_change(self):
+        """Per-object permission checks on a long-lived user instance reflect changes to object permissions."""
+        self.assertFalse(self.user.has_perm("dcim.change_location", self.locations[2]))
+        obj_perm = ObjectPermission.objects.get(name="Test permission")
+        obj_perm.constraints = {"name": self.locations[2].name}
+        obj_perm.save()
+        self.assertTrue(self.user.has_perm("dcim.change_location", self.locations[2]))
+        self.assertFalse(self.user.has_perm("dcim.change_location", self.locations[0]))
+        self.assertEqual(
+            list(Location.objects.restrict(self.user, "change").values_list("pk", flat=True)), [self.locations[2].pk]
+        )
+
+    def test_object_permissions_shared_cache(self):
+        self.assertTrue(self.user.has_perm("dcim.change_location"))
+
+        # Another request for the same user is served from the shared cache
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("dcim.change_location"))
+            self.assertFalse(user.has_perm("dcim.delete_location"))
+
+        # Changes to ObjectPermissions invalidate the shared cache
+        obj_perm = ObjectPermission.objects.create(name="Delete permission", actions=["delete"])
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        obj_perm.users.add(self.user)
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.delete_location"))
+        obj_perm.enabled = False
+        obj_perm.save()
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.delete_location"))
+
+        # Changes to group membership invalidate the shared cache
+        group = Group.objects.create(name="Test group")
+        obj_perm.enabled = True
+        obj_perm.save()
+        obj_perm.users.remove(self.user)
+        obj_perm.groups.add(group)
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.delete_location"))
+        self.user.groups.add(group)
+        self.assertTrue(User.objects.get(pk=self.user.pk).has_perm("dcim.delete_location"))
+        group.user_set.remove(self.user)
+        self.assertFalse(User.objects.get(pk=self.user.pk).has_perm("dcim.delete_location"))
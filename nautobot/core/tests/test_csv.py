@@ -1,11 +1,17 @@
+import csv
+from io import StringIO
+from unittest import mock
+
 from django.contrib.contenttypes.models import ContentType
 from django.test import override_settings, RequestFactory, TestCase
 from django.urls import reverse
 
+from nautobot.core.api.views import ModelViewSetMixin
 from nautobot.core.constants import CSV_NO_OBJECT, CSV_NULL_TYPE, VARBINARY_IP_FIELD_REPR_OF_CSV_NO_OBJECT
 from nautobot.dcim.api.serializers import DeviceSerializer
 from nautobot.dcim.models.devices import Controller, Device, DeviceType
 from nautobot.dcim.models.locations import Location
+from nautobot.extras.models.customfields import CustomField
 from nautobot.extras.models.roles import Role
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.models.tags import Tag
@@ -259,7 +265,7 @@ class CSVParsingRelatedTestCase(TestCase):
         self.client.force_login(user)
         response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
         self.assertEqual(response.status_code, 200)
-        response_data = response.content.decode(response.charset)
+        response_data = response.getvalue().decode(response.charset)
 
         # Replace Device Name
         import_data = response_data.replace("TestDevice1", "TestDevice3").replace("TestDevice2", "")
@@ -290,3 +296,42 @@ class CSVParsingRelatedTestCase(TestCase):
             tenant=self.device2.tenant,
         )
         self.assertEqual(device4.tags.count(), 0)
+
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_streaming_csv_export(self):
+        """Test that CSV exports from the REST API are streamed in chunks, with headers from CustomField definitions."""
+        custom_field = CustomField.objects.create(key="streaming_cf", label="Streaming CF")
+        custom_field.content_types.add(ContentType.objects.get_for_model(Device))
+        self.device._custom_field_data["streaming_cf"] = "some value"
+        self.device.save()
+        user = UserFactory.create()
+        user.is_superuser = True
+        user.is_active = True
+        user.save()
+        self.client.force_login(user)
+
+        with mock.patch.object(ModelViewSetMixin, "csv_export_chunk_size", 1):
+            response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.streaming)
+            self.assertEqual(response.get("Content-Type"), "text/csv; charset=UTF-8")
+            chunks = list(response.streaming_content)
+
+        # One chunk per device, the first of which also contains the headers
+        self.assertEqual(len(chunks), 2)
+        rows = list(csv.DictReader(StringIO(b"".join(chunks).decode(response.charset))))
+        self.assertEqual(len(rows), 2)
+        self.assertIn("cf_streaming_cf", rows[0])
+        self.assertEqual(
+            {row["name"]: row["cf_streaming_cf"] for row in rows}, {"TestDevice1": "some value", "TestDevice2": ""}
+        )
+
+    def test_csv_natural_keys_values_for_list_of_instances(self):
+        """Test that the natural key values of a list of instances are matched to each instance, in any order."""
+        devices = sorted([self.device, self.device2], key=lambda device: device.pk, reverse=True)
+        with mock.patch.object(DeviceSerializer, "natural_keys_chunk_size", 1):
+            data = DeviceSerializer(devices, many=True, context={"request": None}, force_csv=True).data
+        self.assertEqual([record["name"] for record in data], [device.name for device in devices])
+        for record, device in zip(data, devices):
+            self.assertEqual(record["location__name"], device.location.name)
+            self.assertEqual(record["tenant__name"], device.tenant.name if device.tenant else CSV_NO_OBJECT)
@@ -1,30 +1,35 @@
 import datetime
 import random
 import types
-from unittest import skip, TestCase as UnitTestTestCase
+from unittest import mock, skip, TestCase as UnitTestTestCase
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
 from graphene_django.settings import graphene_settings
 from graphql import get_default_backend, GraphQLError
 from graphql.error.located_error import GraphQLLocatedError
+import redis.exceptions
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
 from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql.analysis import QueryAnalyzer
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import RelationshipPeersLoader
 from nautobot.core.graphql.schema import (
     extend_schema_type,
     extend_schema_type_config_context,
@@ -61,11 +66,12 @@ from nautobot.dcim.models import (
     Rack,
     RearPort,
 )
-from nautobot.extras.choices import CustomFieldTypeChoices
+from nautobot.extras.choices import CustomFieldTypeChoices, DynamicGroupTypeChoices
 from nautobot.extras.models import (
     ChangeLoggedModel,
     ConfigContext,
     CustomField,
+    DynamicGroup,
     GraphQLQuery,
     Relationship,
     RelationshipAssociation,
@@ -172,6 +178,100 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         resp = execute_saved_query("GQL 2", user=self.user, variables={"name": "location-1"}).to_dict()
         self.assertFalse(resp["data"].get("error"))
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT=60)
+    def test_execute_saved_query_result_cache(self):
+        location = self.locations[0]
+        resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertIn({"name": "Location-1"}, resp["data"]["query"])
+
+        # A queryset update() doesn't send any signals, so the cached results are still returned
+        Location.objects.filter(pk=location.pk).update(name="Location-1-updated")
+        resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertIn({"name": "Location-1"}, resp["data"]["query"])
+
+        # Saving a location invalidates the cached results of queries involving locations
+        location.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            location.save()
+        resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertNotIn({"name": "Location-1"}, resp["data"]["query"])
+        self.assertIn({"name": "Location-1-updated"}, resp["data"]["query"])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT=60)
+    def test_execute_saved_query_result_cache_permission_changes(self):
+        location = self.locations[0]
+        resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertIn({"name": "Location-1"}, resp["data"]["query"])
+        Location.objects.filter(pk=location.pk).update(name="Location-1-updated")
+
+        # Changing a user's groups may change their permissions, and so invalidates all cached results
+        group = Group.objects.create(name="Saved Query Cache Group")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.groups.add(group)
+        resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertNotIn({"name": "Location-1"}, resp["data"]["query"])
+        self.assertIn({"name": "Location-1-updated"}, resp["data"]["query"])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT=60)
+    def test_execute_saved_query_result_cache_unavailable(self):
+        # If the cache is unavailable, the query is simply run without caching its results
+        with mock.patch(
+            "nautobot.core.graphql.cache.get_many", side_effect=redis.exceptions.ConnectionError
+        ), mock.patch("nautobot.core.graphql.cache.set") as mock_set:
+            resp = execute_saved_query("GQL 1", user=self.user).to_dict()
+        self.assertIn({"name": "Location-1"}, resp["data"]["query"])
+        mock_set.assert_not_called()
+
+    def test_execute_query_document_cache(self):
+        backend = get_default_backend()
+        query = "{ query: locations {name} }"
+        self.assertIs(
+            backend.document_from_string(self.SCHEMA, query), backend.document_from_string(self.SCHEMA, query)
+        )
+        with override_settings(GRAPHQL_DOCUMENT_CACHE_SIZE=0):
+            query = "{ query: locations {id} }"
+            self.assertIsNot(
+                backend.document_from_string(self.SCHEMA, query), backend.document_from_string(self.SCHEMA, query)
+            )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], GRAPHQL_MAX_QUERY_DEPTH=2)
+    def test_execute_query_max_depth(self):
+        resp = execute_query("{ locations { location_type { name } } }", user=self.user).to_dict()
+        self.assertNotIn("errors", resp)
+
+        resp = execute_query("{ locations { parent { parent { name } } } }", user=self.user).to_dict()
+        self.assertIsNone(resp["data"])
+        self.assertIn("depth of 3, which exceeds the maximum allowed depth of 2", resp["errors"][0]["message"])
+
+        # Depth is counted through fragments as well
+        query = (
+            "{ locations { ...LocationFields } } fragment LocationFields on LocationType { parent { parent { id } } }"
+        )
+        resp = execute_query(query, user=self.user).to_dict()
+        self.assertIn("depth of 3, which exceeds the maximum allowed depth of 2", resp["errors"][0]["message"])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_execute_query_max_cost(self):
+        query = "query ($limit: Int) { locations(limit: $limit) { name location_type { name } } }"
+        analysis = QueryAnalyzer(
+            self.SCHEMA, get_default_backend().document_from_string(self.SCHEMA, query).document_ast, {"limit": 2}
+        ).analyze()
+        # 1 (locations) + 2 * 2 (name, location_type) + 2 * 1 (location_type.name)
+        self.assertEqual(analysis.cost, 7)
+        self.assertEqual(analysis.depth, 2)
+        self.assertEqual(analysis.models, {Location, LocationType})
+
+        with override_settings(GRAPHQL_MAX_QUERY_COST=7):
+            resp = execute_query(query, user=self.user, variables={"limit": 2}).to_dict()
+            self.assertNotIn("errors", resp)
+            self.assertEqual(len(resp["data"]["locations"]), 2)
+        with override_settings(GRAPHQL_MAX_QUERY_COST=6):
+            resp = execute_query(query, user=self.user, variables={"limit": 2}).to_dict()
+            self.assertIsNone(resp["data"])
+            self.assertIn(
+                "estimated cost of 7, which exceeds the maximum allowed cost of 6", resp["errors"][0]["message"]
+            )
+
     def test_graphql_types_registry(self):
         """Ensure models with graphql feature are registered in the graphene_django registry."""
         graphene_django_registry = get_global_registry()
@@ -454,6 +554,34 @@ class GraphQLExtendSchemaRelationship(GraphQLTestCaseBase):
             field_name = f"pr_{str_to_var_name(rel.key)}"
             self.assertNotIn(field_name, schema._meta.fields.keys())
 
+    def test_relationship_peers_loader(self):
+        """Verify that RelationshipPeersLoader loads the peers of many objects at once."""
+        racks = list(Rack.objects.all()[:3])
+        vlans = list(VLAN.objects.all()[:3])
+        locations = list(Location.objects.all()[:3])
+        for rack, vlan in [(racks[0], vlans[0]), (racks[0], vlans[1]), (racks[1], vlans[2])]:
+            RelationshipAssociation(relationship=self.m2m_1, source=rack, destination=vlan).validated_save()
+        RelationshipAssociation(
+            relationship=self.o2os_1, source=locations[0], destination=locations[1]
+        ).validated_save()
+
+        loader = RelationshipPeersLoader(self.m2m_1, "source", VLAN, info=None)
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                loader.batch_load_fn([rack.pk for rack in racks]).get(),
+                [vlans[:2], vlans[2:], []],
+            )
+
+        loader = RelationshipPeersLoader(self.m2m_1, "destination", Rack, info=None)
+        self.assertEqual(loader.batch_load_fn([vlan.pk for vlan in vlans]).get(), [[racks[0]], [racks[0]], [racks[1]]])
+
+        # Symmetric relationships find peers regardless of side
+        loader = RelationshipPeersLoader(self.o2os_1, "peer", Location, info=None)
+        self.assertEqual(
+            loader.batch_load_fn([location.pk for location in locations]).get(),
+            [[locations[1]], [locations[0]], []],
+        )
+
 
 class GraphQLSearchParameters(GraphQLTestCaseBase):
     def setUp(self):
@@ -1224,6 +1352,44 @@ query {
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_and_dynamic_groups_in_bulk(self):
+        """Config context and dynamic groups of all devices in a list should be resolved without per-device queries."""
+        dynamic_group = DynamicGroup.objects.create(
+            name="GraphQL Devices",
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+            content_type=ContentType.objects.get_for_model(Device),
+        )
+        dynamic_group.add_members(Device.objects.filter(pk__in=[self.device1.pk, self.device2.pk]))
+        query = """
+            query ($limit: Int) {
+                devices (limit: $limit) {
+                    id
+                    config_context
+                    dynamic_groups { name }
+                }
+            }
+        """
+
+        # Warm up any caches first so as not to skew the query counts below
+        self.execute_query(query, variables={"limit": 1})
+        with CaptureQueriesContext(connection) as single_device_queries:
+            result = self.execute_query(query, variables={"limit": 1})
+        self.assertIsNone(result.errors)
+        with CaptureQueriesContext(connection) as all_devices_queries:
+            result = self.execute_query(query, variables={"limit": 1000})
+        self.assertIsNone(result.errors)
+        self.assertGreater(len(result.data["devices"]), 1)
+        self.assertEqual(len(all_devices_queries), len(single_device_queries))
+
+        for item in result.data["devices"]:
+            device = Device.objects.get(pk=item["id"])
+            self.assertEqual(item["config_context"], device.get_config_context())
+            self.assertEqual(
+                [group["name"] for group in item["dynamic_groups"]],
+                [group.name for group in DynamicGroup.objects.get_for_object(device)],
+            )
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_console_ports_cable_peer(self):
         """Test querying console port terminations for their cable peers"""
@@ -1,5 +1,6 @@
 from datetime import timedelta
 from pathlib import Path
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
@@ -7,10 +8,10 @@ from django.core.files.base import ContentFile
 from django.utils import timezone
 import yaml
 
-from nautobot.core.jobs.cleanup import CleanupTypes
+from nautobot.core.jobs.cleanup import CleanupTypes, LogsCleanup
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
-from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
-from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
+from nautobot.dcim.models import Cable, CablePath, Device, DeviceType, Interface, Location, LocationType, Manufacturer
+from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices, ObjectChangeActionChoices
 from nautobot.extras.factory import JobResultFactory, ObjectChangeFactory
 from nautobot.extras.models import (
     Contact,
@@ -221,6 +222,71 @@ class ImportObjectsTestCase(TransactionTestCase):
         )
         self.assertEqual(4, Status.objects.filter(name__startswith="test_status").count())
 
+    def test_csv_import_bulk(self):
+        """Importing in bulk should create all specified objects and log a summary of each batch of rows."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Status).pk,
+            csv_data=self.csv_data,
+            bulk_import=True,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertFalse(
+            JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR).exists()
+        )
+        self.assertTrue(
+            JobLogEntry.objects.filter(
+                job_result=job_result, message__startswith="Rows 1-4: Created 4 record(s)"
+            ).exists()
+        )
+        statuses = Status.objects.filter(name__startswith="test_status")
+        self.assertEqual(4, statuses.count())
+        self.assertEqual(
+            list(statuses.get(name="test_status2").content_types.order_by("model")),
+            [ContentType.objects.get_for_model(Device), ContentType.objects.get_for_model(Location)],
+        )
+        self.assertEqual(
+            4,
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(Status),
+                changed_object_id__in=statuses.values_list("pk", flat=True),
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+            ).count(),
+        )
+
+    def test_csv_import_bulk_with_constrained_permission(self):
+        """Importing in bulk should only allow the user to import objects they have permission to add."""
+        obj_perm = ObjectPermission(
+            name="Test permission",
+            constraints={"color__in": ["111111", "222222"]},
+            actions=["add"],
+        )
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Status))
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            username=self.user.username,  # otherwise run_job_for_testing defaults to a superuser account
+            content_type=ContentType.objects.get_for_model(Status).pk,
+            csv_data=self.csv_data,
+            bulk_import=True,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            [log_error.message for log_error in log_errors],
+            [
+                f'Row 3: User "{self.user}" does not have permission to create an object with these attributes',
+                f'Row 4: User "{self.user}" does not have permission to create an object with these attributes',
+            ],
+        )
+        self.assertEqual(
+            sorted(Status.objects.filter(name__startswith="test_status").values_list("name", flat=True)),
+            ["test_status1", "test_status2"],
+        )
+
     def test_csv_import_with_utf_8_with_bom_encoding(self):
         """
         A superuser running the job with a .csv file with utf_8 with bom encoding should successfully create all specified objects.
@@ -535,3 +601,88 @@ class LogsCleanupTestCase(TransactionTestCase):
         self.assertTrue(JobResult.objects.filter(date_done__gte=cutoff).exists())
         self.assertFalse(ObjectChange.objects.filter(time__lt=cutoff).exists())
         self.assertTrue(ObjectChange.objects.filter(time__gte=cutoff).exists())
+
+    def test_cleanup_object_changes_in_batches(self):
+        """ObjectChanges should be deleted in as many batches as needed."""
+        cutoff = timezone.now() - timedelta(days=60)
+        expected_count = ObjectChange.objects.filter(time__lt=cutoff).count()
+        self.assertGreater(expected_count, 3)
+        with mock.patch.object(LogsCleanup, "object_change_batch_size", 3):
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs.cleanup",
+                "LogsCleanup",
+                cleanup_types=[CleanupTypes.OBJECT_CHANGE],
+                max_age=60,
+            )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result["extras.ObjectChange"], expected_count)
+        self.assertFalse(ObjectChange.objects.filter(time__lt=cutoff).exists())
+        self.assertTrue(ObjectChange.objects.filter(time__gte=cutoff).exists())
+
+
+class TraceCablePathsTestCase(TransactionTestCase):
+    """
+    Test the TraceCablePaths system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    def setUp(self):
+        super().setUp()
+        location_type = LocationType.objects.create(name="Trace Cable Paths Location Type")
+        location_type.content_types.add(ContentType.objects.get_for_model(Device))
+        location = Location.objects.create(
+            name="Trace Cable Paths Location",
+            location_type=location_type,
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        device_role = Role.objects.create(name="Trace Cable Paths Role")
+        device_role.content_types.add(ContentType.objects.get_for_model(Device))
+        device = Device.objects.create(
+            name="Trace Cable Paths Device",
+            device_type=DeviceType.objects.create(
+                manufacturer=Manufacturer.objects.create(name="Trace Cable Paths Manufacturer"), model="Test"
+            ),
+            location=location,
+            role=device_role,
+            status=Status.objects.get_for_model(Device).first(),
+        )
+        interface_status = Status.objects.get_for_model(Interface).first()
+        self.interface1 = Interface.objects.create(device=device, name="eth0", status=interface_status)
+        self.interface2 = Interface.objects.create(device=device, name="eth1", status=interface_status)
+        Cable.objects.create(
+            termination_a=self.interface1,
+            termination_b=self.interface2,
+            status=Status.objects.get_for_model(Cable).get(name="Connected"),
+        )
+        self.assertEqual(CablePath.objects.count(), 2)
+
+    def test_trace_cable_paths_report_only(self):
+        """Without `repair`, missing cable paths should be reported but not created."""
+        CablePath.objects.all().delete()
+        job_result = create_job_result_and_run_job("nautobot.core.jobs.cable_paths", "TraceCablePaths")
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result["traced"], 2)
+        self.assertEqual(job_result.result["missing"], 2)
+        self.assertEqual(CablePath.objects.count(), 0)
+        self.assertEqual(
+            JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_WARNING).count(), 2
+        )
+
+    def test_trace_cable_paths_repair(self):
+        """With `repair`, missing and outdated cable paths should be fixed."""
+        CablePath.objects.filter(origin_id=self.interface1.pk).delete()
+        CablePath.objects.update(is_active=False)
+        job_result = create_job_result_and_run_job("nautobot.core.jobs.cable_paths", "TraceCablePaths", repair=True)
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(job_result.result["missing"], 1)
+        self.assertEqual(job_result.result["outdated"], 1)
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 2)
+        self.interface1.refresh_from_db()
+        self.assertEqual(self.interface1.connected_endpoint, self.interface2)
+
+        # Nothing left to repair
+        job_result = create_job_result_and_run_job("nautobot.core.jobs.cable_paths", "TraceCablePaths", repair=True)
+        self.assertEqual(
+            job_result.result["missing"] + job_result.result["outdated"] + job_result.result["obsolete"], 0
+        )
@@ -5,6 +5,7 @@ from django.apps import apps
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 from django.http import QueryDict
 
@@ -14,7 +15,9 @@ from nautobot.core.api import utils as api_utils
 from nautobot.core.models import fields as core_fields, utils as models_utils, validators
 from nautobot.core.testing import TestCase
 from nautobot.core.utils import data as data_utils, filtering, lookup, requests
+from nautobot.core.utils.cache import ProcessLocalCache, ProcessLocalLRUCache
 from nautobot.core.utils.migrations import update_object_change_ct_for_replaced_models
+from nautobot.core.utils.transactions import OnCommitCallback
 from nautobot.dcim import filters as dcim_filters, forms as dcim_forms, models as dcim_models, tables
 from nautobot.extras import models as extras_models, utils as extras_utils
 from nautobot.extras.choices import ObjectChangeActionChoices, RelationshipTypeChoices
@@ -809,3 +812,97 @@ class TestMigrationUtils(TestCase):
             )
             self.assertEqual(ObjectChange.objects.get(request_id=request_id).changed_object_type, location_ct)
             self.assertEqual(ObjectChange.objects.get(request_id=request_id).related_object_type, location_ct)
+
+
+class ProcessLocalCacheTest(TestCase):
+    """Tests for the `ProcessLocalCache` class."""
+
+    def test_invalidation_rolled_back(self):
+        built = []
+        local_cache = ProcessLocalCache("tests.local", lambda: built.append(True) or len(built))
+        self.assertEqual(local_cache.get(), 1)
+        self.assertEqual(local_cache.get(), 1)
+
+        # Changes pending in a savepoint get a private value, which is reused until further changes are queued, and
+        # once they're rolled back the shared value is used again
+        with transaction.atomic():
+            local_cache.queue_invalidation()
+            self.assertEqual(local_cache.get(), 2)
+            self.assertEqual(local_cache.get(), 2)
+            local_cache.queue_invalidation()
+            self.assertEqual(local_cache.get(), 3)
+            self.assertEqual(local_cache.get(), 3)
+            transaction.set_rollback(True)
+        self.assertEqual(local_cache.get(), 1)
+        self.assertEqual(local_cache.get(), 1)
+        self.assertEqual(len(built), 3)
+
+
+class ProcessLocalLRUCacheTest(TestCase):
+    """Tests for the `ProcessLocalLRUCache` class."""
+
+    def test_least_recently_used_values_are_evicted(self):
+        lru_cache = ProcessLocalLRUCache("tests.lru", maxsize=2)
+        built = []
+
+        def get(key):
+            return lru_cache.get(key, lambda: built.append(key) or key)
+
+        for key in ["a", "b", "a", "c", "a", "b"]:
+            self.assertEqual(get(key), key)
+        self.assertEqual(built, ["a", "b", "c", "b"])
+
+    def test_invalidation(self):
+        lru_cache = ProcessLocalLRUCache("tests.lru", maxsize=2)
+        self.assertEqual(lru_cache.get("a", lambda: 1), 1)
+
+        # Changes pending in a transaction don't affect the shared values, and are discarded if it's rolled back
+        with transaction.atomic():
+            lru_cache.queue_invalidation()
+            self.assertEqual(lru_cache.get("a", lambda: 2), 2)
+            self.assertEqual(lru_cache.get("a", lambda: 3), 2)
+            transaction.set_rollback(True)
+        self.assertEqual(lru_cache.get("a", lambda: 4), 1)
+
+        lru_cache.invalidate()
+        self.assertEqual(lru_cache.get("a", lambda: 5), 5)
+
+
+class OnCommitCallbackTest(TestCase):
+    """Tests for the `OnCommitCallback` class."""
+
+    def test_registered_once_per_savepoint(self):
+        calls = []
+        on_commit = OnCommitCallback("tests.on_commit", lambda: calls.append(True))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for _ in range(3):
+                    on_commit.register()
+                with transaction.atomic():
+                    on_commit.register()
+                    on_commit.register()
+                self.assertTrue(on_commit.is_pending())
+        self.assertEqual(len(callbacks), 2)
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(on_commit.is_pending())
+
+        # Registered anew once the previous registrations have run
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            on_commit.register()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(calls), 3)
+
+    def test_rolled_back_savepoint(self):
+        on_commit = OnCommitCallback("tests.on_commit", lambda: None)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                outer_callback = on_commit.register()
+                with transaction.atomic():
+                    inner_callback = on_commit.register()
+                    self.assertEqual(on_commit.pending_callbacks(), [outer_callback, inner_callback])
+                    transaction.set_rollback(True)
+                self.assertEqual(on_commit.pending_callbacks(), [outer_callback])
+                self.assertIs(on_commit.register(), outer_callback)
+        self.assertEqual(callbacks, [outer_callback])
@@ -0,0 +1,219 @@
+"""Utilities for caching data derived from the database in the memory of each Nautobot process."""
+
+from collections import OrderedDict
+import contextlib
+import contextvars
+import copy
+import logging
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import connection
+from prometheus_client import Counter
+import redis.exceptions
+
+from nautobot.core.utils.transactions import OnCommitCallback
+
+logger = logging.getLogger(__name__)
+
+PROCESS_LOCAL_CACHE_METRIC = Counter(
+    "nautobot_process_local_cache_lookups_total",
+    "Lookups of values in the in-process caches.",
+    ["cache", "result"],
+)
+
+
+class ProcessLocalCache:
+    """
+    A value built from the database, kept in the memory of each process, and invalidated across all processes at once.
+
+    Each process caches the value together with the version token (stored in Django's cache) that was current when it
+    was built, and rebuilds the value whenever the token has since changed. Call `queue_invalidation()` whenever the
+    data that the value is built from changes; the token is replaced once the current transaction (if any) commits.
+
+    While such changes are pending in the current, not yet committed, transaction, `get()` builds a private value
+    instead of using (or updating) the shared one, as the changes may yet be rolled back. The private value is reused
+    for the rest of the transaction, until further changes are queued or the savepoint of the latest changes is rolled
+    back.
+
+    Args:
+        name (str): Unique name of the cache, used in the key of its version token
+        builder (callable): Function taking no arguments and returning a newly built value
+    """
+
+    def __init__(self, name, builder):
+        self.name = name
+        self.builder = builder
+        self.version_cache_key = f"nautobot.core.utils.cache.{name}.version"
+        self.pending_changes = contextvars.ContextVar(f"{name}_pending_changes", default=False)
+        self._flush_callback = OnCommitCallback(f"{name}_flush_invalidation", self.flush_invalidation)
+        # (on-commit callback of the latest invalidation, value) of the current transaction, if any
+        self.private_value = contextvars.ContextVar(f"{name}_private_value", default=None)
+        # (version, value), replaced as a whole so that concurrent threads never see a mismatched pair
+        self._cached = None
+
+    def get(self):
+        """Get the value, rebuilding it first if it's out of date."""
+        if self.pending_changes.get():
+            pending_callbacks = self._flush_callback.pending_callbacks()
+            if pending_callbacks:
+                private_value = self.private_value.get()
+                if private_value is None or private_value[0] is not pending_callbacks[-1]:
+                    PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "miss").inc()
+                    private_value = (pending_callbacks[-1], self.builder())
+                    self.private_value.set(private_value)
+                else:
+                    PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "hit").inc()
+                return private_value[1]
+            self.private_value.set(None)
+            # The (savepoint of the) transaction that made the changes was rolled back, as it would otherwise have reset
+            # the flag on commit
+            self.pending_changes.set(False)
+
+        version = self._get_version()
+        cached = self._cached
+        if cached is not None and version is not None and cached[0] == version:
+            PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "hit").inc()
+            return cached[1]
+        PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "miss").inc()
+        logger.debug("Building the %s cache", self.name)
+        value = self.builder()
+        if version is not None:
+            self._cached = (version, value)
+        return value
+
+    def _get_version(self):
+        """Get the current version token from Django's cache, creating it if needed, or None if it's unavailable."""
+        version = None
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            version = cache.get(self.version_cache_key)
+            if version is None:
+                cache.add(self.version_cache_key, uuid.uuid4().hex, timeout=None)
+                version = cache.get(self.version_cache_key)
+        return version
+
+    def queue_invalidation(self):
+        """Invalidate the value in all processes, once the current transaction (if any) commits."""
+        self.pending_changes.set(True)
+        # Any private value of the transaction predates these changes
+        self.private_value.set(None)
+        self._flush_callback.register()
+
+    def flush_invalidation(self):
+        """Invalidate the value in all processes right away, if an invalidation is queued."""
+        if self.pending_changes.get():
+            self.invalidate()
+
+    def invalidate(self):
+        """Invalidate the value in all processes, by replacing the version token stored in Django's cache."""
+        self.pending_changes.set(False)
+        self.private_value.set(None)
+        self._cached = None
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.set(self.version_cache_key, uuid.uuid4().hex, timeout=None)
+
+
+class ProcessLocalLRUCache(ProcessLocalCache):
+    """
+    Like `ProcessLocalCache`, but for any number of values, each looked up by key and built by its own builder function.
+
+    At most `maxsize` values are kept, evicting the least recently used ones first. All of the values share a single
+    version token, so `queue_invalidation()` invalidates all of them at once.
+
+    While invalidations are pending in the current, not yet committed, transaction, values are cached separately for
+    that transaction only, until it is either committed (at which point the shared values are invalidated) or rolled
+    back (at which point the shared values are still valid).
+
+    Args:
+        name (str): Unique name of the cache, used in the key of its version token
+        maxsize (int): Maximum number of values to keep
+    """
+
+    def __init__(self, name, maxsize=1024):
+        super().__init__(name, builder=None)
+        self.maxsize = maxsize
+        # (on-commit callback of the latest invalidation, {key: value}) of the current transaction, if any
+        self.private_values = contextvars.ContextVar(f"{name}_private_values", default=None)
+        self._lock = threading.Lock()
+
+    def get(self, key, builder):  # pylint: disable=arguments-differ
+        """
+        Get the value for the given key, building it first if it's not cached or is out of date.
+
+        Args:
+            key (Hashable): Key of the value
+            builder (callable): Function taking no arguments and returning a newly built value for the key
+        """
+        private_values = self._get_private_values()
+        if private_values is not None:
+            if key in private_values:
+                PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "hit").inc()
+            else:
+                PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "miss").inc()
+                private_values[key] = builder()
+            return private_values[key]
+
+        version = self._get_version()
+        with self._lock:
+            cached = self._cached
+            if cached is not None and version is not None and cached[0] == version and key in cached[1]:
+                cached[1].move_to_end(key)
+                PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "hit").inc()
+                return cached[1][key]
+
+        PROCESS_LOCAL_CACHE_METRIC.labels(self.name, "miss").inc()
+        logger.debug("Building the %s cache for %s", self.name, key)
+        value = builder()
+        if version is not None:
+            with self._lock:
+                if self._cached is None or self._cached[0] != version:
+                    self._cached = (version, OrderedDict())
+                values = self._cached[1]
+                values[key] = value
+                values.move_to_end(key)
+                while len(values) > self.maxsize:
+                    values.popitem(last=False)
+        return value
+
+    def get_queryset(self, key, queryset):
+        """
+        Get the given queryset, with its results taken from the cache (rather than the database) if possible.
+
+        The returned queryset can be iterated, counted, indexed and so on without any database queries; filtering it
+        (or otherwise deriving a new queryset from it) queries the database as usual. Each call returns copies of the
+        cached objects, so the objects may be modified without affecting the cache.
+
+        Args:
+            key (Hashable): Key identifying the results of the queryset
+            queryset (QuerySet): Queryset to get (and if need be, evaluate) the results of
+        """
+        instances = self.get(key, lambda: tuple(queryset._chain()))
+        queryset = queryset._chain()
+        queryset._result_cache = [copy.copy(instance) for instance in instances]
+        queryset._prefetch_done = True
+        return queryset
+
+    def queue_invalidation(self):
+        """Invalidate the values in all processes, once the current transaction (if any) commits."""
+        self.pending_changes.set(True)
+        callback = self._flush_callback.register()
+        if connection.in_atomic_block:
+            self.private_values.set((callback, {}))
+
+    def _get_private_values(self):
+        """Get the values cached for the current transaction only, if it has pending invalidations."""
+        private_values = self.private_values.get()
+        if private_values is None:
+            return None
+        callback, values = private_values
+        pending_callbacks = self._flush_callback.pending_callbacks()
+        if callback in pending_callbacks:
+            return values
+        if pending_callbacks:
+            # The savepoint of the latest invalidation was rolled back, but earlier invalidations in the transaction stand
+            values = {}
+            self.private_values.set((pending_callbacks[-1], values))
+            return values
+        self.private_values.set(None)
+        return None
@@ -1,3 +1,7 @@
+from collections import OrderedDict
+import json
+import threading
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
@@ -97,3 +101,59 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+# Compiled permission filters memoized across requests, by (user PK, permissions version, constraints JSON)
+_permission_filters = OrderedDict()
+_permission_filters_lock = threading.Lock()
+PERMISSION_FILTERS_MAXSIZE = 1024
+
+
+def _compile_permission_filter(user, permissions_version, constraints_json):
+    """
+    Compile the given JSON-serialized constraints into a `Q` filter, substituting the given user for the "$user" token.
+
+    Memoized across requests by the user's PK, the version of the user's cached object permissions (which changes
+    whenever the user or any of their ObjectPermissions change) and the constraints. The memoized filter refers to a
+    detached copy of the user's own fields, rather than to the given User instance and everything cached on it.
+    """
+    key = (user.pk, permissions_version, constraints_json)
+    with _permission_filters_lock:
+        if key in _permission_filters:
+            _permission_filters.move_to_end(key)
+            return _permission_filters[key]
+
+    user_model = type(user)
+    detached_user = user_model(**{field.attname: getattr(user, field.attname) for field in user_model._meta.fields})
+    permission_filter = qs_filter_from_constraints(json.loads(constraints_json), {"$user": detached_user})
+    with _permission_filters_lock:
+        _permission_filters[key] = permission_filter
+        while len(_permission_filters) > PERMISSION_FILTERS_MAXSIZE:
+            _permission_filters.popitem(last=False)
+    return permission_filter
+
+
+def get_permission_filter(user, permission):
+    """
+    Get the `Q` filter matching all objects on which the given user has been granted the given permission.
+
+    The compiled filter is cached on the user instance until object permissions next change, and is also memoized across
+    requests by the user's PK, the version of their cached object permissions and the constraints granted to them.
+
+    Args:
+        user (User): User instance, which must have been granted `permission` by at least one ObjectPermission
+        permission (str): Permission name in the format <app_label>.<action>_<model>
+
+    Returns:
+        (Q): Filter for the permitted objects; an empty `Q()` if the permission is unconstrained
+    """
+    if not hasattr(user, "_object_perm_filter_cache"):
+        user._object_perm_filter_cache = {}
+    if permission not in user._object_perm_filter_cache:
+        constraints = user._object_perm_cache[permission]
+        user._object_perm_filter_cache[permission] = _compile_permission_filter(
+            user,
+            getattr(user, "_object_perm_version", None),
+            json.dumps(constraints, sort_keys=True, default=str),
+        )
+    return user._object_perm_filter_cache[permission]
@@ -0,0 +1,68 @@
+"""Utilities for deferring work until the current database transaction commits."""
+
+import contextvars
+import functools
+
+from django.db import connection, transaction
+
+
+class OnCommitCallback:
+    """
+    A function to run once the current database transaction commits, however often that's requested in the transaction.
+
+    Code that queues work on every save (to process it all in one go once the transaction commits) can call
+    `register()` each time, and the function is only registered with `transaction.on_commit()` once per transaction or
+    savepoint, rather than once per save. As Django discards the callbacks registered in a savepoint that's rolled back,
+    `pending_callbacks()` can tell whether the work queued in a given savepoint still stands.
+
+    Once the transaction commits, the function runs once per registration, so it should do nothing if there's no work
+    left to do.
+
+    Args:
+        name (str): Unique name of the callback, used in the name of its context variable
+        func (callable): Function taking no arguments
+    """
+
+    def __init__(self, name, func):
+        self.func = func
+        # [(savepoint IDs at the time of registration, registered callback), ...] in the current transaction
+        self._registrations = contextvars.ContextVar(f"{name}_on_commit_registrations", default=None)
+
+    def register(self):
+        """
+        Register the function to run once the current transaction commits, unless it's already registered in the current
+        savepoint (if any) of the transaction. Outside of a transaction, the function is run right away.
+
+        Returns:
+            (callable): The registered callback.
+        """
+        registrations = self._get_pending_registrations()
+        savepoint_ids = tuple(connection.savepoint_ids)
+        if registrations and registrations[-1][0] == savepoint_ids:
+            return registrations[-1][1]
+        # A new callback object each time, so that Django's discarding of any single registration can be detected
+        callback = functools.partial(self._run)
+        self._registrations.set([*registrations, (savepoint_ids, callback)])
+        transaction.on_commit(callback)
+        return callback
+
+    def pending_callbacks(self):
+        """Get the callbacks registered by `register()` that are still due to run once the transaction commits."""
+        return [callback for _, callback in self._get_pending_registrations()]
+
+    def is_pending(self):
+        """Check whether the function is still due to run once the current transaction commits."""
+        return bool(self._get_pending_registrations())
+
+    def _get_pending_registrations(self):
+        registrations = self._registrations.get()
+        if not registrations:
+            return []
+        # Django drops on-commit callbacks once the (savepoint of the) transaction that registered them is rolled back
+        registered_ids = {id(func) for _, func, _ in connection.run_on_commit}
+        return [registration for registration in registrations if id(registration[1]) in registered_ids]
+
+    def _run(self):
+        # All of the registrations of the transaction are run together, and any later ones are no longer needed
+        self._registrations.set(None)
+        self.func()
@@ -22,6 +22,7 @@ from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.api.views import ModelViewSet
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim import filters
+from nautobot.dcim.elevations import render_rack_elevation_svgs
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -210,8 +211,9 @@ class RackViewSet(NautobotModelViewSet):
         data = serializer.validated_data
 
         if data["render"] == "svg":
-            # Render and return the elevation as an SVG drawing with the correct content type
-            drawing = rack.get_elevation_svg(
+            # Render (or retrieve from the cache) and return the elevation as an SVG drawing with the correct content type
+            svgs = render_rack_elevation_svgs(
+                [rack],
                 face=data["face"],
                 user=request.user,
                 unit_width=data["unit_width"],
@@ -221,7 +223,7 @@ class RackViewSet(NautobotModelViewSet):
                 base_url=request.build_absolute_uri("/"),
                 display_fullname=data["display_fullname"],
             )
-            return HttpResponse(drawing.tostring(), content_type="image/svg+xml")
+            return HttpResponse(svgs[rack.pk], content_type="image/svg+xml")
 
         else:
             # Return a JSON representation of the rack units in the elevation
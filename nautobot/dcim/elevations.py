@@ -1,12 +1,141 @@
+from collections import namedtuple
+import contextlib
+import hashlib
+
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count
 from django.urls import reverse
 from django.utils.http import urlencode
+import redis.exceptions
 import svgwrite
 
+from nautobot.core.utils.cache import ProcessLocalCache
 from nautobot.core.utils.config import get_settings_or_config
 
 from .choices import DeviceFaceChoices
-from .constants import RACK_ELEVATION_BORDER_WIDTH
+from .constants import RACK_ELEVATION_BORDER_WIDTH, RACK_ELEVATION_LEGEND_WIDTH_DEFAULT
+
+# How long to keep a rendered rack elevation in the cache, in seconds
+RACK_ELEVATION_CACHE_TIMEOUT = 24 * 60 * 60
+
+RackElevationData = namedtuple("RackElevationData", ["devices", "permitted_device_ids", "reservations"])
+RackElevationData.__doc__ = """
+Data needed to render the elevation of a rack.
+
+Attributes:
+    devices (list[Device]): Devices occupying units of the rack, in their default ordering
+    permitted_device_ids (set): PKs of those Devices that the user may view
+    reservations (list[RackReservation]): Reservations of units of the rack
+"""
+
+
+def get_permitted_device_ids(racks, user=None):
+    """
+    Get the PKs of the Devices occupying units of each of the given racks that the user may view, with a single query.
+
+    Args:
+        racks (iterable): Racks to get the Devices of
+        user (User): User whose permissions to evaluate; if None, all Devices are included
+
+    Returns:
+        (dict): Set of Device PKs of each rack, by rack PK.
+    """
+    from .models import Device
+
+    rack_pks = [rack.pk for rack in racks]
+    permitted_device_ids = {rack_pk: set() for rack_pk in rack_pks}
+    devices = Device.objects.filter(rack__in=rack_pks, position__gt=0)
+    if user is not None:
+        devices = devices.restrict(user, "view")
+    for rack_pk, device_pk in devices.values_list("rack_id", "pk"):
+        permitted_device_ids[rack_pk].add(device_pk)
+    return permitted_device_ids
+
+
+def get_rack_elevation_data(racks, user=None, permitted_device_ids=None):
+    """
+    Get the data needed to render the elevations of the given racks, with three queries regardless of their number.
+
+    Args:
+        racks (iterable): Racks to get the data of
+        user (User): User whose permissions to evaluate; if None, all Devices may be viewed
+        permitted_device_ids (dict): Result of `get_permitted_device_ids()` for the racks and user, if already known
+
+    Returns:
+        (dict): `RackElevationData` of each rack, by rack PK.
+    """
+    from .models import Device, RackReservation
+
+    rack_pks = [rack.pk for rack in racks]
+    if permitted_device_ids is None:
+        permitted_device_ids = get_permitted_device_ids(racks, user=user)
+    data = {
+        rack_pk: RackElevationData(devices=[], permitted_device_ids=permitted_device_ids[rack_pk], reservations=[])
+        for rack_pk in rack_pks
+    }
+    devices = (
+        Device.objects.select_related("device_type", "device_type__manufacturer", "role", "virtual_chassis")
+        .annotate(device_bay_count=Count("device_bays"), installed_device_count=Count("device_bays__installed_device"))
+        .filter(rack__in=rack_pks, position__gt=0, device_type__u_height__gt=0)
+    )
+    for device in devices:
+        data[device.rack_id].devices.append(device)
+    for reservation in RackReservation.objects.select_related("user").filter(rack__in=rack_pks):
+        data[reservation.rack_id].reservations.append(reservation)
+    return data
+
+
+class RackElevationSVGCache(ProcessLocalCache):
+    """
+    Cache of rendered rack elevations, stored in Django's cache and thus shared by all processes.
+
+    All of the cached elevations share the version token of a `ProcessLocalCache`, so `queue_invalidation()`
+    invalidates all of them at once, once the current transaction (if any) commits. While such an invalidation is
+    pending, the cache is bypassed altogether.
+
+    Args:
+        name (str): Unique name of the cache, used in the key of its version token
+        timeout (int): How long to keep each rendered elevation, in seconds
+    """
+
+    def __init__(self, name, timeout):
+        super().__init__(name, builder=None)
+        self.timeout = timeout
+
+    def _get_current_version(self):
+        """Get the current version token, or None if the cache can't be used right now."""
+        if self.pending_changes.get():
+            if connection.in_atomic_block:
+                return None
+            self.pending_changes.set(False)
+        return self._get_version()
+
+    def _make_key(self, version, key):
+        return f"nautobot.dcim.elevations.{self.name}.{version}.{key}"
+
+    def get_many(self, keys):
+        """Get the cached values of those of the given keys that are in the cache, as a `{key: value}` dict."""
+        version = self._get_current_version()
+        if version is None:
+            return {}
+        cache_keys = {self._make_key(version, key): key for key in keys}
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            return {cache_keys[cache_key]: value for cache_key, value in cache.get_many(cache_keys).items()}
+        return {}
+
+    def set_many(self, values):
+        """Cache the given `{key: value}` values."""
+        version = self._get_current_version()
+        if version is None or not values:
+            return
+        with contextlib.suppress(redis.exceptions.ConnectionError):
+            cache.set_many({self._make_key(version, key): value for key, value in values.items()}, timeout=self.timeout)
+
+
+# Rendered SVG documents of rack elevations, invalidated by signals whenever anything shown in an elevation changes
+rack_elevation_svg_cache = RackElevationSVGCache("dcim.rack_elevation_svgs", timeout=RACK_ELEVATION_CACHE_TIMEOUT)
 
 
 class RackElevationSVG:
@@ -17,9 +146,11 @@ class RackElevationSVG:
     :param user: User instance. If specified, only devices viewable by this user will be fully displayed.
     :param include_images: If true, the SVG document will embed front/rear device face images, where available
     :param base_url: Base URL for links within the SVG document. If none, links will be relative.
+    :param elevation_data: `RackElevationData` of the rack for the given user, if already retrieved (such as by
+        `get_rack_elevation_data()` for many racks at once)
     """
 
-    def __init__(self, rack, user=None, include_images=True, base_url=None, display_fullname=True):
+    def __init__(self, rack, user=None, include_images=True, base_url=None, display_fullname=True, elevation_data=None):
         self.rack = rack
         self.include_images = include_images
         self.display_fullname = display_fullname
@@ -28,11 +159,15 @@ class RackElevationSVG:
         else:
             self.base_url = ""
 
-        # Determine the subset of devices within this rack that are viewable by the user, if any
-        permitted_devices = self.rack.devices
-        if user is not None:
-            permitted_devices = permitted_devices.restrict(user, "view")
-        self.permitted_device_ids = permitted_devices.values_list("pk", flat=True)
+        # Retrieve the devices within this rack, the subset of them that are viewable by the user, and reservations
+        if elevation_data is None:
+            elevation_data = get_rack_elevation_data([rack], user=user)[rack.pk]
+        self.devices = elevation_data.devices
+        self.permitted_device_ids = elevation_data.permitted_device_ids
+        self.reserved_units = {}
+        for reservation in elevation_data.reservations:
+            for u in reservation.units:
+                self.reserved_units[u] = reservation
 
     @staticmethod
     def _get_device_description(device):
@@ -91,7 +226,10 @@ class RackElevationSVG:
     def _draw_device_front(self, drawing, device, start, end, text):
         device_bay_details = ""
         if device.device_bay_count:
-            device_bay_details += f" ({device.get_children().count()}/{device.device_bay_count})"
+            installed_device_count = getattr(device, "installed_device_count", None)
+            if installed_device_count is None:
+                installed_device_count = device.get_children().count()
+            device_bay_details += f" ({installed_device_count}/{device.device_bay_count})"
 
         device_fullname = str(device) + device_bay_details
         device_shortname = settings.UI_RACK_VIEW_TRUNCATE_FUNCTION(str(device)) + device_bay_details
@@ -183,7 +321,7 @@ class RackElevationSVG:
         query_params = urlencode(
             {
                 "rack": rack.pk,
-                "location": rack.location.pk,
+                "location": rack.location_id,
                 "face": face_id,
                 "position": id_,
             }
@@ -199,13 +337,45 @@ class RackElevationSVG:
         link.add(drawing.rect(start, end, class_=class_))
         link.add(drawing.text("add device", insert=text, class_="add-device"))
 
+    def get_rack_units(self, face=DeviceFaceChoices.FACE_FRONT, expand_devices=True):
+        """
+        Return a list of rack units as dictionaries, the same as `Rack.get_rack_units()` without a `user` would.
+
+        Unlike `Rack.get_rack_units()`, this uses the already retrieved devices of the rack rather than querying them.
+        """
+        elevation = {}
+        for u in self.rack.units:
+            elevation[u] = {
+                "id": u,
+                "name": f"U{u}",
+                "face": face,
+                "device": None,
+                "occupied": False,
+            }
+
+        for device in self.devices:
+            if device.face != face and not device.device_type.is_full_depth:
+                continue
+            if expand_devices:
+                for u in range(device.position, device.position + device.device_type.u_height):
+                    elevation[u]["device"] = device
+                    elevation[u]["occupied"] = True
+            else:
+                elevation[device.position]["device"] = device
+                elevation[device.position]["occupied"] = True
+                elevation[device.position]["height"] = device.device_type.u_height
+                for u in range(device.position + 1, device.position + device.device_type.u_height):
+                    elevation.pop(u, None)
+
+        return list(elevation.values())
+
     def merge_elevations(self, face):
-        elevation = self.rack.get_rack_units(face=face, expand_devices=False)
+        elevation = self.get_rack_units(face=face, expand_devices=False)
         if face == DeviceFaceChoices.FACE_REAR:
             other_face = DeviceFaceChoices.FACE_FRONT
         else:
             other_face = DeviceFaceChoices.FACE_REAR
-        other = self.rack.get_rack_units(face=other_face)
+        other = self.get_rack_units(face=other_face)
 
         unit_cursor = 0
         for u in elevation:
@@ -225,7 +395,8 @@ class RackElevationSVG:
             unit_width + legend_width + RACK_ELEVATION_BORDER_WIDTH * 2,
             unit_height * self.rack.u_height + RACK_ELEVATION_BORDER_WIDTH * 2,
         )
-        reserved_units = self.rack.get_reserved_units()
+        reserved_units = self.reserved_units
+        unit_two_digit_format = get_settings_or_config("RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT")
 
         unit_cursor = 0
         for ru in range(0, self.rack.u_height):
@@ -235,7 +406,6 @@ class RackElevationSVG:
                 start_y + unit_height / 2 + RACK_ELEVATION_BORDER_WIDTH,
             )
             unit = ru + 1 if self.rack.desc_units else self.rack.u_height - ru
-            unit_two_digit_format = get_settings_or_config("RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT")
             unit_display = f"{unit:02d}" if unit_two_digit_format else str(unit)
             drawing.add(drawing.text(unit_display, position_coordinates, class_="unit"))
 
@@ -310,3 +480,71 @@ class RackElevationSVG:
         drawing.add(frame)
 
         return drawing
+
+
+def render_rack_elevation_svgs(
+    racks,
+    face=DeviceFaceChoices.FACE_FRONT,
+    user=None,
+    unit_width=None,
+    unit_height=None,
+    legend_width=RACK_ELEVATION_LEGEND_WIDTH_DEFAULT,
+    include_images=True,
+    base_url=None,
+    display_fullname=True,
+):
+    """
+    Render the elevations of many racks at once as SVG documents, taking them from the cache where possible.
+
+    Rendered elevations are cached per rack, face, rendering options, and set of devices in the rack that the user may
+    view, so users with the same permissions share them. The devices and reservations of all of the racks that aren't
+    cached are retrieved together, with a fixed number of queries.
+
+    Takes the same arguments as `Rack.get_elevation_svg()`, except for the list of racks.
+
+    Returns:
+        (dict): SVG document (as a string) of each rack, by rack PK.
+    """
+    racks = list(racks)
+    if unit_width is None:
+        unit_width = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_WIDTH")
+    if unit_height is None:
+        unit_height = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_HEIGHT")
+    options = (
+        face,
+        unit_width,
+        unit_height,
+        legend_width,
+        include_images,
+        base_url,
+        display_fullname,
+        get_settings_or_config("RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT"),
+    )
+
+    permitted_device_ids = get_permitted_device_ids(racks, user=user)
+    cache_keys = {
+        rack.pk: hashlib.sha256(
+            repr((str(rack.pk), options, sorted(str(pk) for pk in permitted_device_ids[rack.pk]))).encode()
+        ).hexdigest()
+        for rack in racks
+    }
+    cached_svgs = rack_elevation_svg_cache.get_many(cache_keys.values())
+    svgs = {rack.pk: cached_svgs[cache_keys[rack.pk]] for rack in racks if cache_keys[rack.pk] in cached_svgs}
+
+    uncached_racks = [rack for rack in racks if rack.pk not in svgs]
+    elevation_data = get_rack_elevation_data(uncached_racks, user=user, permitted_device_ids=permitted_device_ids)
+    new_svgs = {}
+    for rack in uncached_racks:
+        elevation = RackElevationSVG(
+            rack,
+            user=user,
+            include_images=include_images,
+            base_url=base_url,
+            display_fullname=display_fullname,
+            elevation_data=elevation_data[rack.pk],
+        )
+        svgs[rack.pk] = new_svgs[cache_keys[rack.pk]] = elevation.render(
+            face, unit_width, unit_height, legend_width
+        ).tostring()
+    rack_elevation_svg_cache.set_many(new_svgs)
+    return svgs
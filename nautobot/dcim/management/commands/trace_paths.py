@@ -1,28 +1,10 @@
-from django.core.management.base import BaseCommand
-from django.core.management.color import no_style
-from django.db import connection
+import time
 
-from nautobot.circuits.models import CircuitTermination
-from nautobot.dcim.models import (
-    CablePath,
-    ConsolePort,
-    ConsoleServerPort,
-    Interface,
-    PowerFeed,
-    PowerOutlet,
-    PowerPort,
-)
-from nautobot.dcim.signals import create_cablepath
+from django.core.management.base import BaseCommand, CommandError
 
-ENDPOINT_MODELS = (
-    CircuitTermination,
-    ConsolePort,
-    ConsoleServerPort,
-    Interface,
-    PowerFeed,
-    PowerOutlet,
-    PowerPort,
-)
+from nautobot.core.utils.data import is_uuid
+from nautobot.dcim.models import CablePath, Location
+from nautobot.dcim.utils import get_path_endpoint_models, trace_cable_paths
 
 
 class Command(BaseCommand):
@@ -41,6 +23,24 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
+        parser.add_argument(
+            "--location",
+            dest="location",
+            help="Only trace paths originating at the Location with this name or ID, or any of its descendants",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            dest="dry_run",
+            help="Report any missing, outdated, or obsolete cable paths without repairing them",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of path endpoints to trace at once (default: 1000)",
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -50,50 +50,73 @@ class Command(BaseCommand):
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
 
     def handle(self, *model_names, **options):
-        # If --force was passed, first delete all existing CablePaths
-        if options["force"]:
-            cable_paths = CablePath.objects.all()
-            paths_count = cable_paths.count()
+        location = None
+        if options["location"]:
+            lookup = {"pk": options["location"]} if is_uuid(options["location"]) else {"name": options["location"]}
+            try:
+                location = Location.objects.get(**lookup)
+            except (Location.DoesNotExist, Location.MultipleObjectsReturned):
+                raise CommandError(f"Location {options['location']!r} not found or not unique")
 
-            # Prompt the user to confirm recalculation of all paths
-            if paths_count and not options["no_input"]:
+        # Prompt the user to confirm recalculation of all paths
+        if options["force"] and not options["dry_run"] and not options["no_input"]:
+            paths_count = CablePath.objects.count()
+            if paths_count:
                 self.stdout.write(self.style.ERROR("WARNING: Forcing recalculation of all cable paths."))
                 self.stdout.write(
-                    f"This will delete and recalculate all {paths_count} existing cable paths. Are you sure?"
+                    f"This will recalculate and repair all {paths_count} existing cable paths. Are you sure?"
                 )
                 confirmation = input("Type yes to confirm: ")
                 if confirmation != "yes":
                     self.stdout.write(self.style.SUCCESS("Aborting"))
                     return
 
-            # Delete all existing CablePath instances
-            self.stdout.write(f"Deleting {paths_count} existing cable paths...")
-            deleted_count, _ = CablePath.objects.all().delete()
-            self.stdout.write((self.style.SUCCESS(f"  Deleted {deleted_count} paths")))
-
-            # Reinitialize the model's PK sequence
-            self.stdout.write("Resetting database sequence for CablePath model")
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [CablePath])
-            with connection.cursor() as cursor:
-                for sql in sequence_sql:
-                    cursor.execute(sql)
-
         # Retrace paths
-        for model in ENDPOINT_MODELS:
-            origins = model.objects.filter(cable__isnull=False)
-            if not options["force"]:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
-                self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
-                continue
-            self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+        start_time = time.monotonic()
+        counts = {"traced": 0, "created": 0, "updated": 0, "deleted": 0}
+        model_counts = {}
+        for model, total, traced, to_create, to_update, to_delete in trace_cable_paths(
+            location=location,
+            missing_only=not options["force"],
+            repair=not options["dry_run"],
+            batch_size=options["batch_size"],
+        ):
+            if model not in model_counts:
+                if model_counts:
+                    self.stdout.write("")
+                self.stdout.write(f"Retracing {total} {model._meta.verbose_name_plural}...")
+                model_counts[model] = 0
+            model_counts[model] += traced
+            counts["traced"] += traced
+            counts["created"] += len(to_create)
+            counts["updated"] += len(to_update)
+            counts["deleted"] += len(to_delete)
+            if options["verbosity"] > 1:
+                self.stdout.write("")
+                for description, cablepaths in (
+                    ("Missing", to_create),
+                    ("Outdated", to_update),
+                    ("Obsolete", to_delete),
+                ):
+                    for cablepath in cablepaths:
+                        self.stdout.write(f"  {description} path originating from {cablepath.origin}")
+            self.draw_progress_bar(model_counts[model] * 100 / total)
+        if model_counts:
+            self.stdout.write("")
+        for model in get_path_endpoint_models():
+            if model not in model_counts:
+                missing = "" if options["force"] else "missing "
+                self.stdout.write(f"Found no {missing}{model._meta.verbose_name} paths; skipping")
 
-        self.stdout.write(self.style.SUCCESS("Finished."))
+        elapsed = time.monotonic() - start_time
+        verb = "Found" if options["dry_run"] else "Repaired"
+        self.stdout.write(
+            f"{verb} {counts['created']} missing, {counts['updated']} outdated, "
+            f"and {counts['deleted']} obsolete cable paths"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Finished tracing {counts['traced']} paths in {elapsed:.2f} seconds "
+                f"({counts['traced'] / elapsed if elapsed else 0:.1f} paths per second)."
+            )
+        )
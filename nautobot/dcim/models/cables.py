@@ -5,7 +5,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
-from django.db.models import Sum
+from django.db.models import Case, Sum, Value, When
 from django.utils.functional import classproperty
 
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
@@ -15,6 +15,7 @@ from nautobot.dcim.choices import CableLengthUnitChoices, CableTypeChoices
 from nautobot.dcim.constants import CABLE_TERMINATION_MODELS, COMPATIBLE_TERMINATION_TYPES, NONCONNECTABLE_IFACE_TYPES
 from nautobot.dcim.fields import JSONPathField
 from nautobot.dcim.utils import (
+    compile_path_node,
     decompile_path_node,
     object_to_path_node,
     path_node_to_object,
@@ -28,7 +29,7 @@ from nautobot.extras.utils import extras_features
 # would be the much more invasive but much more "correct" fix.
 from nautobot.core.models.generics import BaseModel, PrimaryModel  # isort: skip
 
-from .device_components import FrontPort, RearPort
+from .device_components import FrontPort, PathEndpoint, RearPort
 from .devices import Device
 
 __all__ = (
@@ -481,3 +482,350 @@ class CablePath(BaseModel):
         """
         rearport = path_node_to_object(self.path[-1])
         return FrontPort.objects.filter(rear_port=rearport)
+
+
+class _TopologyMiss(Exception):
+    """Raised by `CablePathTracer` when tracing a path requires topology data that hasn't been loaded yet."""
+
+    def __init__(self, kind, key):
+        super().__init__(kind, key)
+        self.kind = kind
+        self.key = key
+
+
+class CablePathTracer:
+    """
+    Trace and store the CablePaths of many origins at once, using an in-memory copy of the relevant cabling topology.
+
+    Whereas `CablePath.from_origin()` follows a single path hop by hop, querying the database for the cable, cable peer
+    and (if applicable) front port or peer circuit termination at each hop, the tracer advances all of the requested
+    paths together. Whenever any path needs topology data that isn't known yet, the data needed by *all* pending paths
+    is loaded with a single query per model, so the number of queries is bounded by the length of the longest path
+    rather than by the number of paths being traced.
+
+    The semantics of each traced path (pass-through positions, splits, loops and `is_active`) are identical to those of
+    `CablePath.from_origin()`.
+    """
+
+    batch_size = 1000
+    _update_fields = ["destination_type", "destination_id", "path", "is_active", "is_split"]
+
+    def __init__(self):
+        # Import added here to avoid circular imports with Cable.
+        from nautobot.circuits.models import CircuitTermination
+
+        self._cable_ct_id = ContentType.objects.get_for_model(Cable).pk
+        self._frontport_ct_id = ContentType.objects.get_for_model(FrontPort).pk
+        self._rearport_ct_id = ContentType.objects.get_for_model(RearPort).pk
+        self._circuittermination_ct_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        connected_status = Cable.STATUS_CONNECTED
+        self._connected_status_id = connected_status.pk if connected_status is not None else None
+
+        # {(content_type_id, object_id): {field: value} or None (if no such object exists)}
+        self._terminations = {}
+        # {rear_port_id: {rear_port_position: front_port_id}}
+        self._front_ports = {}
+        # {circuit_id: {term_side: circuit_termination_id}}
+        self._circuit_terminations = {}
+
+    @staticmethod
+    def _get_node(obj):
+        """Normalize a PathEndpoint instance or a `(content_type_id, object_id)` tuple to the latter."""
+        if isinstance(obj, models.Model):
+            return ContentType.objects.get_for_model(obj).pk, obj.pk
+        return obj
+
+    #
+    # Topology access
+    #
+
+    def _get_termination(self, node):
+        if node not in self._terminations:
+            raise _TopologyMiss("termination", node)
+        return self._terminations[node]
+
+    def _get_front_port_id(self, rear_port_id, position):
+        if rear_port_id not in self._front_ports:
+            raise _TopologyMiss("front_ports", rear_port_id)
+        return self._front_ports[rear_port_id].get(position)
+
+    def _get_circuit_termination_id(self, circuit_id, term_side):
+        if circuit_id not in self._circuit_terminations:
+            raise _TopologyMiss("circuit_terminations", circuit_id)
+        return self._circuit_terminations[circuit_id].get(term_side)
+
+    #
+    # Topology loading
+    #
+
+    def _load(self, missing):
+        """Bulk-load the given missing topology data, as collected from `_TopologyMiss` exceptions."""
+        # Import added here to avoid circular imports with Cable.
+        from nautobot.circuits.models import CircuitTermination
+
+        terminations_by_type = defaultdict(set)
+        for ct_id, object_id in missing["termination"]:
+            terminations_by_type[ct_id].add(object_id)
+        for ct_id, object_ids in terminations_by_type.items():
+            self._load_terminations(ct_id, object_ids)
+
+        if missing["front_ports"]:
+            for rear_port_id in missing["front_ports"]:
+                self._front_ports[rear_port_id] = {}
+            for rear_port_id, position, front_port_id in FrontPort.objects.filter(
+                rear_port_id__in=missing["front_ports"]
+            ).values_list("rear_port_id", "rear_port_position", "pk"):
+                self._front_ports[rear_port_id][position] = front_port_id
+
+        if missing["circuit_terminations"]:
+            for circuit_id in missing["circuit_terminations"]:
+                self._circuit_terminations[circuit_id] = {}
+            for circuit_id, term_side, termination_id in CircuitTermination.objects.filter(
+                circuit_id__in=missing["circuit_terminations"]
+            ).values_list("circuit_id", "term_side", "pk"):
+                self._circuit_terminations[circuit_id][term_side] = termination_id
+
+    def _load_terminations(self, ct_id, object_ids):
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        fields = ["pk", "cable_id", "cable__status_id", "_cable_peer_type_id", "_cable_peer_id"]
+        if issubclass(model, PathEndpoint):
+            fields.append("_path_id")
+        if ct_id == self._frontport_ct_id:
+            fields += ["rear_port_id", "rear_port_position", "rear_port__positions"]
+        elif ct_id == self._rearport_ct_id:
+            fields.append("positions")
+        elif ct_id == self._circuittermination_ct_id:
+            fields += ["circuit_id", "term_side"]
+
+        for object_id in object_ids:
+            self._terminations[(ct_id, object_id)] = None
+        for record in model.objects.filter(pk__in=object_ids).values(*fields):
+            self._terminations[(ct_id, record["pk"])] = record
+
+    #
+    # Tracing
+    #
+
+    def _trace(self, origin):
+        """
+        Trace the path from the given origin node, mirroring `CablePath.from_origin()`.
+
+        Raises `_TopologyMiss` if the topology data needed to complete the trace hasn't been loaded yet.
+        """
+        node = origin
+        record = self._get_termination(node)
+        if record is None or record["cable_id"] is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        visited_nodes = set()
+        while record["cable_id"] is not None:
+            if node[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node[1])
+            if record["cable__status_id"] != self._connected_status_id:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self._cable_ct_id, record["cable_id"]))
+            if record["_cable_peer_id"] is None:
+                break
+            peer = (record["_cable_peer_type_id"], record["_cable_peer_id"])
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer[0] == self._frontport_ct_id:
+                peer_record = self._get_termination(peer)
+                if peer_record is None:
+                    break
+                path.append(compile_path_node(*peer))
+                node = (self._rearport_ct_id, peer_record["rear_port_id"])
+                if peer_record["rear_port__positions"] > 1:
+                    position_stack.append(peer_record["rear_port_position"])
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer[0] == self._rearport_ct_id:
+                peer_record = self._get_termination(peer)
+                if peer_record is None:
+                    break
+                path.append(compile_path_node(*peer))
+
+                # Determine the peer FrontPort's position
+                if peer_record["positions"] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_id = self._get_front_port_id(peer[1], position)
+                if front_port_id is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self._frontport_ct_id, front_port_id)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer[0] == self._circuittermination_ct_id:
+                peer_record = self._get_termination(peer)
+                if peer_record is None:
+                    break
+                peer_side = "Z" if peer_record["term_side"] == "A" else "A"
+                peer_termination_id = self._get_circuit_termination_id(peer_record["circuit_id"], peer_side)
+                # A Circuit Termination does not require a peer.
+                if peer_termination_id is None:
+                    destination = peer
+                    break
+                node = (self._circuittermination_ct_id, peer_termination_id)
+                path.append(compile_path_node(*peer))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer
+                break
+
+            record = self._get_termination(node)
+            if record is None:
+                break
+
+        if destination is None:
+            is_active = False
+
+        return CablePath(
+            origin_type_id=origin[0],
+            origin_id=origin[1],
+            destination_type_id=destination[0] if destination else None,
+            destination_id=destination[1] if destination else None,
+            path=path,
+            is_active=is_active,
+            is_split=is_split,
+        )
+
+    def trace(self, origins):
+        """
+        Trace the paths originating from each of the given origins.
+
+        Args:
+            origins (iterable): PathEndpoint instances and/or `(content_type_id, object_id)` tuples identifying them
+
+        Returns:
+            (dict): `{(content_type_id, object_id): CablePath or None}`. The returned CablePaths are not saved.
+        """
+        pending = {self._get_node(origin) for origin in origins}
+        traced = {}
+        while pending:
+            missing = defaultdict(set)
+            for origin in pending:
+                try:
+                    traced[origin] = self._trace(origin)
+                except _TopologyMiss as miss:
+                    missing[miss.kind].add(miss.key)
+            pending.difference_update(traced)
+            if pending:
+                self._load(missing)
+        return traced
+
+    def diff(self, origins):
+        """
+        Trace the given origins and compare the results against their stored CablePaths.
+
+        An origin whose stored CablePath matches the traced path, but which doesn't reference that CablePath as its
+        `_path`, is reported as needing an update.
+
+        Args:
+            origins (iterable): PathEndpoint instances and/or `(content_type_id, object_id)` tuples identifying them
+
+        Returns:
+            (tuple): Lists of the CablePaths that need to be created, updated, and deleted
+        """
+        traced = self.trace(origins)
+
+        origin_ids_by_type = defaultdict(list)
+        for ct_id, object_id in traced:
+            origin_ids_by_type[ct_id].append(object_id)
+        existing = {}
+        for ct_id, object_ids in origin_ids_by_type.items():
+            for cablepath in CablePath.objects.filter(origin_type_id=ct_id, origin_id__in=object_ids):
+                existing[(cablepath.origin_type_id, cablepath.origin_id)] = cablepath
+
+        attnames = [CablePath._meta.get_field(field).attname for field in self._update_fields]
+        to_create = []
+        to_update = []
+        to_delete = []
+        for origin, cablepath in traced.items():
+            current = existing.get(origin)
+            if cablepath is None:
+                if current is not None:
+                    to_delete.append(current)
+            elif current is None:
+                to_create.append(cablepath)
+            else:
+                cablepath.pk = current.pk
+                if any(getattr(cablepath, attname) != getattr(current, attname) for attname in attnames) or (
+                    self._get_origin_path_id(cablepath) != cablepath.pk
+                ):
+                    to_update.append(cablepath)
+
+        return to_create, to_update, to_delete
+
+    def rebuild(self, origins):
+        """
+        Trace the given origins, then create, update and delete their stored CablePaths to match, in bulk.
+
+        Args:
+            origins (iterable): PathEndpoint instances and/or `(content_type_id, object_id)` tuples identifying them
+
+        Returns:
+            (tuple): The number of CablePaths created, updated, and deleted
+        """
+        to_create, to_update, to_delete = self.diff(origins)
+        self.write(to_create, to_update, to_delete)
+        return len(to_create), len(to_update), len(to_delete)
+
+    def write(self, to_create, to_update, to_delete):
+        """
+        Save the CablePath changes computed by `diff()` to the database, in bulk.
+        """
+        from nautobot.extras.signals import queue_saved_query_results_invalidation  # avoid circular import
+
+        if to_delete:
+            CablePath.objects.filter(pk__in=[cablepath.pk for cablepath in to_delete]).delete()
+        if to_create:
+            CablePath.objects.bulk_create(to_create, batch_size=self.batch_size)
+        if to_update:
+            CablePath.objects.bulk_update(to_update, self._update_fields, batch_size=self.batch_size)
+
+        # Record a direct reference to each CablePath on its originating object, where not already present
+        path_ids_by_type = defaultdict(dict)
+        for cablepath in [*to_create, *to_update]:
+            if self._get_origin_path_id(cablepath) != cablepath.pk:
+                path_ids_by_type[cablepath.origin_type_id][cablepath.origin_id] = cablepath.pk
+        for ct_id, path_ids in path_ids_by_type.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            items = list(path_ids.items())
+            for i in range(0, len(items), self.batch_size):
+                batch = dict(items[i : i + self.batch_size])
+                model.objects.filter(pk__in=batch).update(
+                    _path=Case(
+                        *(When(pk=object_id, then=Value(path_id)) for object_id, path_id in batch.items()),
+                        output_field=models.UUIDField(),
+                    )
+                )
+            queue_saved_query_results_invalidation(model)
+
+        # None of the above sends the model signals that would otherwise invalidate cached saved query results
+        if to_create or to_update or to_delete:
+            queue_saved_query_results_invalidation(CablePath)
+
+    def _get_origin_path_id(self, cablepath):
+        """Get the `_path_id` currently recorded on the origin of the given CablePath."""
+        record = self._terminations.get((cablepath.origin_type_id, cablepath.origin_id))
+        return record.get("_path_id") if record is not None else None
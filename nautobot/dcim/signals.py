@@ -3,24 +3,32 @@ import logging
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
+from nautobot.extras.models import Role
+from nautobot.extras.signals import queue_saved_query_results_invalidation
 
+from .elevations import rack_elevation_svg_cache
 from .models import (
     Cable,
     CablePath,
     ControllerManagedDeviceGroup,
     Device,
+    DeviceBay,
     DeviceRedundancyGroup,
+    DeviceType,
     Interface,
+    Manufacturer,
     PathEndpoint,
     PowerPanel,
     Rack,
     RackGroup,
+    RackReservation,
     VirtualChassis,
 )
+from .models.cables import CablePathTracer
 from .utils import validate_interface_tagged_vlans
 
 
@@ -30,13 +38,7 @@ def create_cablepath(node, rebuild=True):
 
     rebuild (bool) - Used to refresh paths where this node is not an endpoint.
     """
-    cp = CablePath.from_origin(node)
-    if cp:
-        try:
-            cp.save()
-        except Exception as e:
-            print(node, node.pk)
-            raise e
+    CablePathTracer().rebuild([node])
     if rebuild:
         rebuild_paths(node)
 
@@ -45,13 +47,11 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
+    origins = CablePath.objects.filter(path__contains=obj).values_list("origin_type_id", "origin_id")
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+        # Retrace all affected paths together, against a single in-memory copy of the relevant topology
+        CablePathTracer().rebuild(origins)
 
 
 #
@@ -165,6 +165,32 @@ def clear_deviceredundancygroup_members(instance, **kwargs):
         device.save()
 
 
+#
+# Rack elevations
+#
+
+
+@receiver(post_save, sender=Device)
+@receiver(post_save, sender=DeviceBay)
+@receiver(post_save, sender=DeviceType)
+@receiver(post_save, sender=Manufacturer)
+@receiver(post_save, sender=Rack)
+@receiver(post_save, sender=RackReservation)
+@receiver(post_save, sender=Role)
+@receiver(post_save, sender=VirtualChassis)
+@receiver(post_delete, sender=Device)
+@receiver(post_delete, sender=DeviceBay)
+@receiver(post_delete, sender=DeviceType)
+@receiver(post_delete, sender=Manufacturer)
+@receiver(post_delete, sender=Rack)
+@receiver(post_delete, sender=RackReservation)
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=VirtualChassis)
+def invalidate_rack_elevation_cache(sender, **kwargs):
+    """Invalidate the cached rack elevations of all racks, whenever anything shown in an elevation changes."""
+    rack_elevation_svg_cache.queue_invalidation()
+
+
 #
 # Virtual chassis
 #
@@ -237,6 +263,7 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
         # any CablePaths accordingly.
         if instance.status != Cable.STATUS_CONNECTED:
             CablePath.objects.filter(path__contains=instance).update(is_active=False)
+            queue_saved_query_results_invalidation(CablePath)
         else:
             rebuild_paths(instance)
 
@@ -261,18 +288,8 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b.save()
 
     # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    origins = CablePath.objects.filter(path__contains=instance).values_list("origin_type_id", "origin_id")
+    CablePathTracer().rebuild(origins)
 
 
 #
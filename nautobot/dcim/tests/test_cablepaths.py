@@ -1,6 +1,8 @@
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
 from nautobot.dcim.models import (
@@ -21,6 +23,7 @@ from nautobot.dcim.models import (
     PowerPort,
     RearPort,
 )
+from nautobot.dcim.models.cables import CablePathTracer
 from nautobot.dcim.utils import object_to_path_node
 from nautobot.extras.models import Role, Status
 
@@ -1494,3 +1497,79 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def test_401_tracer_matches_from_origin(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C5-- [RP2] [FP2:1] --C6-- [IF5]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C7-- [IF6]
+        [IF3] --C3-- [FP1:3]                    [FP2:3]
+        [IF4] --C4-- [FP1:4]                    [FP2:4]
+        """
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=4)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=4)
+        interfaces = []
+        for i in range(1, 5):
+            frontport = FrontPort.objects.create(
+                device=self.device, name=f"Front Port 1:{i}", rear_port=rearport1, rear_port_position=i
+            )
+            interface = Interface.objects.create(
+                device=self.device, name=f"Interface {i}", status=self.interface_status
+            )
+            Cable(termination_a=interface, termination_b=frontport, status=self.status).save()
+            interfaces.append(interface)
+        for i in range(1, 5):
+            frontport = FrontPort.objects.create(
+                device=self.device, name=f"Front Port 2:{i}", rear_port=rearport2, rear_port_position=i
+            )
+            if i <= 2:
+                interface = Interface.objects.create(
+                    device=self.device, name=f"Interface {i + 4}", status=self.interface_status
+                )
+                Cable(termination_a=frontport, termination_b=interface, status=self.status_planned).save()
+                interfaces.append(interface)
+        Cable(termination_a=rearport1, termination_b=rearport2, status=self.status).save()
+
+        rearport1.refresh_from_db()
+        for interface in interfaces:
+            interface.refresh_from_db()
+
+        with CaptureQueriesContext(connection) as single_queries:
+            CablePathTracer().trace(interfaces[:1])
+        with CaptureQueriesContext(connection) as all_queries:
+            traced = CablePathTracer().trace(interfaces)
+        # The number of queries depends on the length of the paths, not on the number of paths
+        self.assertLessEqual(len(all_queries), len(single_queries))
+
+        interface_ct = ContentType.objects.get_for_model(Interface)
+        self.assertEqual(len(traced), len(interfaces))
+        for interface in interfaces:
+            expected = CablePath.from_origin(interface)
+            actual = traced[(interface_ct.pk, interface.pk)]
+            self.assertEqual(actual.path, expected.path)
+            self.assertEqual(actual.destination_id, expected.destination.pk if expected.destination else None)
+            self.assertEqual(actual.is_active, expected.is_active)
+            self.assertEqual(actual.is_split, expected.is_split)
+
+        # Stored paths already match the traced paths, so rebuilding them is a no-op
+        self.assertEqual(CablePathTracer().rebuild(interfaces), (0, 0, 0))
+
+        # Stale paths are updated in bulk and their origins updated accordingly
+        CablePath.objects.update(path=[], is_active=False)
+        CablePath.objects.filter(origin_id=interfaces[0].pk).delete()
+        self.assertEqual(CablePathTracer().rebuild(interfaces), (1, len(interfaces) - 1, 0))
+        self.assertPathExists(
+            origin=interfaces[0],
+            destination=interfaces[4],
+            path=(
+                interfaces[0].cable,
+                FrontPort.objects.get(name="Front Port 1:1"),
+                rearport1,
+                rearport1.cable,
+                rearport2,
+                FrontPort.objects.get(name="Front Port 2:1"),
+                interfaces[4].cable,
+            ),
+            is_active=False,
+        )
+        interfaces[0].refresh_from_db()
+        self.assertPathIsSet(interfaces[0], CablePath.objects.get(origin_id=interfaces[0].pk))
@@ -3,9 +3,9 @@ from decimal import Decimal
 from constance.test import override_config
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import connection, IntegrityError
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider, ProviderNetwork
 from nautobot.core.testing.models import ModelTestCases
@@ -22,6 +22,7 @@ from nautobot.dcim.choices import (
     PowerPortTypeChoices,
     SubdeviceRoleChoices,
 )
+from nautobot.dcim.elevations import rack_elevation_svg_cache, render_rack_elevation_svgs
 from nautobot.dcim.models import (
     Cable,
     ConsolePort,
@@ -57,6 +58,7 @@ from nautobot.dcim.models import (
     PowerPortTemplate,
     Rack,
     RackGroup,
+    RackReservation,
     RearPort,
     RearPortTemplate,
     SoftwareImageFile,
@@ -1036,6 +1038,54 @@ class RackTestCase(ModelTestCases.BaseModelTestCase):
         for u in rack1_inventory_rear:
             self.assertIsNone(u["device"])
 
+    def test_render_rack_elevation_svgs(self):
+        """Rendering the elevations of many racks at once should match rendering them individually."""
+        racks = [self.rack]
+        for i in range(2, 5):
+            racks.append(Rack.objects.create(name=f"TestRack{i}", location=self.location1, status=self.status))
+        for i, rack in enumerate(racks):
+            Device.objects.create(
+                name=f"TestSwitch{i}",
+                device_type=self.device_type["ff2048"],
+                role=self.device_roles[0],
+                status=self.device_status,
+                location=self.location1,
+                rack=rack,
+                position=i + 1,
+                face=DeviceFaceChoices.FACE_FRONT,
+            )
+        RackReservation.objects.create(
+            rack=racks[1], units=[10, 11], user=User.objects.create(username="Reserver"), description="Test"
+        )
+
+        for face in DeviceFaceChoices.values():
+            svgs = render_rack_elevation_svgs(racks, face=face)
+            for rack in racks:
+                self.assertEqual(svgs[rack.pk], rack.get_elevation_svg(face=face).tostring())
+        self.assertIn("TestSwitch1", svgs[racks[1].pk])
+        self.assertIn("Reserver", svgs[racks[1].pk])
+
+        # The number of queries doesn't depend on the number of racks
+        with CaptureQueriesContext(connection) as one_rack_queries:
+            render_rack_elevation_svgs(racks[:1])
+        with CaptureQueriesContext(connection) as many_racks_queries:
+            render_rack_elevation_svgs(racks)
+        self.assertEqual(len(one_rack_queries), len(many_racks_queries))
+
+    def test_render_rack_elevation_svgs_cache(self):
+        """Rendered rack elevations should be cached until a device or reservation in a rack changes."""
+        rack_elevation_svg_cache.invalidate()
+        svg = render_rack_elevation_svgs([self.rack])[self.rack.pk]
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(render_rack_elevation_svgs([self.rack])[self.rack.pk], svg)
+        # Only the devices that the user may view are looked up, to identify the cached elevation
+        self.assertEqual(len([query for query in queries if "dcim_rackreservation" in query["sql"]]), 0)
+
+        RackReservation.objects.create(
+            rack=self.rack, units=[1], user=User.objects.create(username="Reserver"), description="Test"
+        )
+        self.assertIn("Reserver", render_rack_elevation_svgs([self.rack])[self.rack.pk])
+
     def test_mount_zero_ru(self):
         pdu = Device.objects.create(
             name="TestPDU",
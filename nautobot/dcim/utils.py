@@ -2,6 +2,8 @@ import uuid
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
 from netutils.lib_mapper import (
     ANSIBLE_LIB_MAPPER_REVERSE,
     HIERCONFIG_LIB_MAPPER_REVERSE,
@@ -153,3 +155,66 @@ def validate_interface_tagged_vlans(instance, model, pk_set):
                 )
             }
         )
+
+
+def get_path_endpoint_models():
+    """
+    Return the list of models which may originate a CablePath.
+    """
+    # Avoiding circular imports
+    from nautobot.circuits.models import CircuitTermination
+    from nautobot.dcim.models import ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
+
+    return [CircuitTermination, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort]
+
+
+def trace_cable_paths(location=None, missing_only=False, repair=False, batch_size=1000):
+    """
+    Trace the CablePaths of all path endpoints, in batches, and compare them against the stored CablePaths.
+
+    Each batch of endpoints is traced together by a `CablePathTracer`, so the number of database queries per batch
+    depends only on the length of the longest path in the batch rather than on the number of endpoints in it.
+
+    Args:
+        location (Location): If specified, only trace endpoints at this location or any of its descendants
+        missing_only (bool): Only trace cabled endpoints that don't currently have a CablePath
+        repair (bool): Create, update, and delete stored CablePaths to match the traced paths
+        batch_size (int): Number of endpoints to trace at once
+
+    Yields:
+        (tuple): `(model, total, traced, to_create, to_update, to_delete)` for each batch, where `total` is the number
+            of endpoints of `model` being traced, `traced` is the number of endpoints in this batch, and `to_create`,
+            `to_update` and `to_delete` are lists of CablePaths which were found to be missing, out of date, or obsolete.
+    """
+    # Avoiding circular imports
+    from nautobot.dcim.models.cables import CablePathTracer
+
+    locations = location.descendants(include_self=True) if location is not None else None
+
+    for model in get_path_endpoint_models():
+        if missing_only:
+            origins = model.objects.filter(cable__isnull=False, _path__isnull=True)
+        else:
+            # Also include uncabled endpoints which still have a (now obsolete) CablePath
+            origins = model.objects.filter(Q(cable__isnull=False) | Q(_path__isnull=False))
+        if locations is not None:
+            if hasattr(model, "device"):
+                origins = origins.filter(device__location__in=locations)
+            elif hasattr(model, "power_panel"):
+                origins = origins.filter(power_panel__location__in=locations)
+            else:
+                origins = origins.filter(location__in=locations)
+
+        # Evaluated up front, as repairing paths may change which endpoints match `origins`
+        origin_ids = list(origins.order_by().values_list("pk", flat=True))
+        ct_id = ContentType.objects.get_for_model(model).pk
+        for i in range(0, len(origin_ids), batch_size):
+            batch = [(ct_id, origin_id) for origin_id in origin_ids[i : i + batch_size]]
+            tracer = CablePathTracer()
+            if repair:
+                with transaction.atomic():
+                    to_create, to_update, to_delete = tracer.diff(batch)
+                    tracer.write(to_create, to_update, to_delete)
+            else:
+                to_create, to_update, to_delete = tracer.diff(batch)
+            yield model, len(origin_ids), len(batch), to_create, to_update, to_delete
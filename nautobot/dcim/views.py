@@ -64,6 +64,7 @@ from . import filters, forms, tables
 from .api import serializers
 from .choices import DeviceFaceChoices
 from .constants import NONCONNECTABLE_IFACE_TYPES
+from .elevations import render_rack_elevation_svgs
 from .models import (
     Cable,
     CablePath,
@@ -603,6 +604,12 @@ class RackElevationListView(generic.ObjectListView):
         if rack_face not in DeviceFaceChoices.values():
             rack_face = DeviceFaceChoices.FACE_FRONT
 
+        # Render the elevations of all of the racks on the page at once, so that the requests for each of them that the
+        # page then makes (with the default rendering options) are answered from the cache
+        render_rack_elevation_svgs(
+            page.object_list, face=rack_face, user=request.user, base_url=request.build_absolute_uri("/")
+        )
+
         return {
             "paginator": paginator,
             "page": page,
@@ -163,14 +163,18 @@ class ConfigContextQuerySetMixin:
         """
         Build the proper queryset based on the request context
 
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
+        If the `include` query param includes `config_context`, return the queryset with the config context data of its
+        objects looked up from the in-memory ConfigContext scope index, or annotated with the stored rendered config
+        context if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set.
 
         Else, return the base queryset.
         """
         queryset = super().get_queryset()
         request = self.get_serializer_context()["request"]
         if request is not None and "config_context" in request.query_params.get("include", []):
-            return queryset.annotate_config_context_data()
+            if settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+                return queryset.annotate_rendered_config_context()
+            return queryset.prefetch_config_context_data()
         return queryset
 
 
@@ -0,0 +1,249 @@
+"""In-memory inverted index of the scopes of ConfigContexts, used to match ConfigContexts to objects without SQL joins."""
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+
+from nautobot.core.utils.cache import ProcessLocalCache
+
+# ConfigContext fields by which a ConfigContext can be scoped, and the labels of the corresponding models
+SCOPE_FIELDS = {
+    "locations": "dcim.location",
+    "roles": "extras.role",
+    "device_types": "dcim.devicetype",
+    "platforms": "dcim.platform",
+    "cluster_groups": "virtualization.clustergroup",
+    "clusters": "virtualization.cluster",
+    "device_redundancy_groups": "dcim.deviceredundancygroup",
+    "tenant_groups": "tenancy.tenantgroup",
+    "tenants": "tenancy.tenant",
+    "tags": "extras.tag",
+    "dynamic_groups": "extras.dynamicgroup",
+}
+
+# Scope fields of tree models, where an object also matches ConfigContexts scoped to any ancestor of its own value
+TREE_SCOPE_FIELDS = ("locations", "tenant_groups")
+
+
+class ConfigContextScopeIndex:
+    """
+    Inverted index from the value of each scope field (such as a Location or a Tag) to the active ConfigContexts that
+    are scoped to it.
+
+    An object matches a ConfigContext if, for each scope field, the context either isn't scoped by that field at all or
+    is scoped to one of the object's values for it, exactly as in `ConfigContext.objects.get_for_object()`. With the
+    index, the contexts matching an object are found by intersecting one set of context PKs per scope field, rather
+    than by joining all of the scope tables in the database.
+
+    Use `get_config_context_index()` to get an up-to-date instance rather than building one directly.
+    """
+
+    def __init__(self):
+        # Data of all active ConfigContexts by PK, in the same form as the `config_context_data` annotation
+        self.contexts = {}
+        # Scope field name -> {PK of scope object -> set of PKs of the contexts scoped to it}
+        self.scoped = {}
+        # Scope field name -> set of PKs of the contexts that aren't scoped by that field
+        self.unscoped = {}
+        # Tree scope field name -> {PK of scope object -> PK of its parent}
+        self.parents = {}
+
+    @classmethod
+    def build(cls):
+        """Build an index of the current ConfigContexts in the database."""
+        from nautobot.dcim.models import Location
+        from nautobot.extras.models import ConfigContext
+        from nautobot.tenancy.models import TenantGroup
+
+        index = cls()
+        index.contexts = {
+            context["id"]: context
+            for context in ConfigContext.objects.filter(is_active=True).values("id", "data", "name", "weight")
+        }
+        for field_name in SCOPE_FIELDS:
+            scoped = defaultdict(set)
+            for context_pk, value_pk in ConfigContext.objects.filter(
+                is_active=True, **{f"{field_name}__isnull": False}
+            ).values_list("pk", field_name):
+                scoped[value_pk].add(context_pk)
+            index.scoped[field_name] = dict(scoped)
+            index.unscoped[field_name] = set(index.contexts).difference(*scoped.values())
+
+        tree_models = {"locations": Location, "tenant_groups": TenantGroup}
+        for field_name in TREE_SCOPE_FIELDS:
+            model = tree_models[field_name]
+            if index.scoped[field_name]:
+                index.parents[field_name] = dict(model.objects.values_list("pk", "parent_id"))
+        return index
+
+    def get_scope_fields(self):
+        """Get the names of the scope fields by which any active ConfigContexts are actually scoped."""
+        return [
+            field_name
+            for field_name, scoped in self.scoped.items()
+            if scoped and (field_name != "dynamic_groups" or settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED)
+        ]
+
+    def get_config_context_ids(self, scope_values):
+        """
+        Get the PKs of the active ConfigContexts matching an object, ordered by weight and name.
+
+        Args:
+            scope_values (dict): PKs of the scope objects of the object, by scope field name, as returned by
+                `get_scope_values()`; for tree scope fields, only the object's own value (not its ancestors) is needed
+        """
+        matches = set(self.contexts)
+        for field_name in self.get_scope_fields():
+            scoped = self.scoped[field_name]
+            candidates = set(self.unscoped[field_name])
+            for value in self._expand(field_name, scope_values.get(field_name, ())):
+                candidates.update(scoped.get(value, ()))
+            matches.intersection_update(candidates)
+            if not matches:
+                break
+        return sorted(matches, key=lambda pk: (self.contexts[pk]["weight"], self.contexts[pk]["name"]))
+
+    def get_config_context_data(self, model, object_ids):
+        """
+        Get the data of the active ConfigContexts matching each of the given objects, in bulk.
+
+        The scope values of all of the objects are retrieved with at most three queries, regardless of their number.
+        The data of each object is in the same form as the `config_context_data` annotation added by
+        `annotate_config_context_data()`, and is shared between objects, so it must not be modified.
+
+        Args:
+            model (Model): The ConfigContextModel subclass (Device or VirtualMachine) of the objects
+            object_ids (iterable): The PKs of the objects
+
+        Returns:
+            (dict): The list of ConfigContext data of each object that exists, by object PK.
+        """
+        return {
+            pk: [self.contexts[context_pk] for context_pk in self.get_config_context_ids(scope_values)]
+            for pk, scope_values in get_scope_values(model, object_ids, self.get_scope_fields()).items()
+        }
+
+    def _expand(self, field_name, values):
+        """Add the ancestors of the given values of a tree scope field to them."""
+        parents = self.parents.get(field_name)
+        if parents is None:
+            yield from values
+            return
+        seen = set()
+        for value in values:
+            while value is not None and value not in seen:
+                seen.add(value)
+                yield value
+                value = parents.get(value)
+
+
+def get_scope_values(model, object_ids, scope_fields=tuple(SCOPE_FIELDS)):
+    """
+    Get the PKs of the scope objects of the given Devices or VirtualMachines, in bulk.
+
+    Args:
+        model (Model): The ConfigContextModel subclass (Device or VirtualMachine) of the objects
+        object_ids (iterable): The PKs of the objects
+        scope_fields (iterable): Names of the scope fields to get values for
+
+    Returns:
+        (dict): {scope field name: list of PKs} of each object that exists, by object PK.
+    """
+    from nautobot.extras.models import StaticGroupAssociation, TaggedItem
+
+    is_device = model._meta.model_name == "device"
+    lookups = {
+        "locations": "location_id" if is_device else "cluster__location_id",
+        "roles": "role_id",
+        "device_types": "device_type_id" if is_device else None,
+        "platforms": "platform_id",
+        "cluster_groups": "cluster__cluster_group_id",
+        "clusters": "cluster_id",
+        "device_redundancy_groups": "device_redundancy_group_id" if is_device else None,
+        "tenant_groups": "tenant__tenant_group_id",
+        "tenants": "tenant_id",
+    }
+    lookups = {field_name: lookup for field_name, lookup in lookups.items() if field_name in scope_fields and lookup}
+    scope_values = {}
+    for row in model.objects.filter(pk__in=object_ids).values("pk", *lookups.values()):
+        scope_values[row["pk"]] = {
+            field_name: [row[lookup]] if row[lookup] is not None else [] for field_name, lookup in lookups.items()
+        }
+
+    content_type = ContentType.objects.get_for_model(model)
+    many_valued = []
+    if "tags" in scope_fields:
+        many_valued.append(
+            (
+                "tags",
+                TaggedItem.objects.filter(content_type=content_type, object_id__in=scope_values).values_list(
+                    "object_id", "tag_id"
+                ),
+            )
+        )
+    if "dynamic_groups" in scope_fields:
+        many_valued.append(
+            (
+                "dynamic_groups",
+                StaticGroupAssociation.all_objects.filter(
+                    associated_object_type=content_type, associated_object_id__in=scope_values
+                ).values_list("associated_object_id", "dynamic_group_id"),
+            )
+        )
+    for field_name, pairs in many_valued:
+        for values in scope_values.values():
+            values[field_name] = []
+        for pk, value in pairs:
+            scope_values[pk][field_name].append(value)
+    return scope_values
+
+
+def get_object_scope_values(obj, scope_fields=tuple(SCOPE_FIELDS)):
+    """
+    Get the PKs of the scope objects of a single Device or VirtualMachine.
+
+    Unlike `get_scope_values()`, this uses the current values of the object's own fields, even if not yet saved.
+
+    Args:
+        obj (ConfigContextModel): The Device or VirtualMachine
+        scope_fields (iterable): Names of the scope fields to get values for
+
+    Returns:
+        (dict): {scope field name: list of PKs}
+    """
+    cluster = getattr(obj, "cluster", None)
+    scope_values = {
+        # VirtualMachine.location_id is a property that raises an AttributeError if the VM has no cluster
+        "locations": [getattr(obj, "location_id", None)],
+        "roles": [obj.role_id],
+        "device_types": [getattr(obj, "device_type_id", None)],
+        "platforms": [obj.platform_id],
+        "cluster_groups": [getattr(cluster, "cluster_group_id", None)],
+        "clusters": [getattr(obj, "cluster_id", None)],
+        "device_redundancy_groups": [getattr(obj, "device_redundancy_group_id", None)],
+        "tenant_groups": [getattr(obj.tenant, "tenant_group_id", None)],
+        "tenants": [obj.tenant_id],
+    }
+    scope_values = {
+        field_name: [value for value in values if value is not None]
+        for field_name, values in scope_values.items()
+        if field_name in scope_fields
+    }
+    if "tags" in scope_fields:
+        scope_values["tags"] = list(obj.tags.values_list("pk", flat=True))
+    if "dynamic_groups" in scope_fields:
+        scope_values["dynamic_groups"] = list(obj.dynamic_groups.values_list("pk", flat=True))
+    return scope_values
+
+
+def get_config_context_index():
+    """
+    Get the ConfigContext scope index of this process, rebuilding it first if it's out of date.
+
+    The index is shared by all threads of the process; see `ProcessLocalCache` for how it is kept up to date.
+    """
+    return config_context_index_cache.get()
+
+
+config_context_index_cache = ProcessLocalCache("extras.config_context_index", ConfigContextScopeIndex.build)
@@ -1,9 +1,12 @@
+from collections import defaultdict
 from contextlib import contextmanager
+import functools
 import uuid
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.db import transaction
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
 from django.test.client import RequestFactory
 
 from nautobot.extras.choices import ObjectChangeEventContextChoices
@@ -33,6 +36,8 @@ class ChangeContext:
         self.request = request
         self.user = user
         self.reset_deferred_object_changes()
+        # Object changes queued by `queue_object_change()`, in batches per transaction (or savepoint)
+        self.queued_object_change_batches = []
 
         if self.request is None and self.user is None:
             raise TypeError("Either user or request must be provided")
@@ -80,6 +85,33 @@ class ChangeContext:
     def reset_deferred_object_changes(self):
         self.deferred_object_changes = {}
 
+    def add_deferred_object_changes(self, instances, action):
+        """
+        Record deferred object changes for the given instances, which were modified without emitting model signals.
+
+        For use with bulk operations (such as `bulk_create()`) performed inside `deferred_change_logging_for_bulk_operation`,
+        so that the resulting object changes are still created in bulk when the deferred object changes are flushed.
+
+        :param instances: Iterable of model instances that were changed
+        :param action: ObjectChangeActionChoices value describing the change
+        """
+        user = self.get_user()
+        for instance in instances:
+            changed_object_type = ContentType.objects.get_for_model(instance)
+            if user is not None:
+                unique_object_change_id = f"{changed_object_type.pk}__{instance.pk}__{user.pk}"
+            else:
+                unique_object_change_id = f"{changed_object_type.pk}__{instance.pk}"
+            self.deferred_object_changes.setdefault(unique_object_change_id, []).append(
+                {
+                    "action": action,
+                    "instance": instance,
+                    "user": user,
+                    "changed_object_id": instance.pk,
+                    "changed_object_type": changed_object_type,
+                }
+            )
+
     def flush_deferred_object_changes(self, batch_size=1000):
         if self.defer_object_changes:
             self.create_object_changes(batch_size=batch_size)
@@ -89,23 +121,101 @@ class ChangeContext:
             create_object_changes = []
             for key in self._object_change_batch(batch_size):
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    objectchange = self._to_objectchange(entry)
                     if objectchange is not None:
-                        objectchange.user = entry["user"]
-                        objectchange.user_name = objectchange.user.username
-                        objectchange.request_id = self.change_id
-                        objectchange.change_context = self.context
-                        objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
-                        if not objectchange.changed_object_id:  # changed_object was deleted
-                            # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
-                            objectchange.changed_object = None
-                            # Set the component fields individually:
-                            objectchange.changed_object_id = entry.get("changed_object_id")
-                            objectchange.changed_object_type = entry.get("changed_object_type")
                         create_object_changes.append(objectchange)
                 self.deferred_object_changes.pop(key, None)
             ObjectChange.objects.bulk_create(create_object_changes, batch_size=batch_size)
 
+    def _to_objectchange(self, entry, instance=None):
+        """Build (but don't save) the ObjectChange for a deferred object change, optionally from a fresher instance."""
+        if instance is None:
+            instance = entry["instance"]
+        objectchange = instance.to_objectchange(entry["action"])
+        if objectchange is not None:
+            objectchange.user = entry["user"]
+            objectchange.user_name = objectchange.user.username if objectchange.user is not None else "Undefined"
+            objectchange.request_id = self.change_id
+            objectchange.change_context = self.context
+            objectchange.change_context_detail = self.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+            if not objectchange.changed_object_id:  # changed_object was deleted
+                # Clear out the GenericForeignKey to keep Django from complaining about an unsaved object:
+                objectchange.changed_object = None
+                # Set the component fields individually:
+                objectchange.changed_object_id = entry.get("changed_object_id")
+                objectchange.changed_object_type = entry.get("changed_object_type")
+        return objectchange
+
+    def queue_object_change(self, unique_object_change_id):
+        """
+        Queue the creation of the ObjectChange for the latest deferred object change with the given ID.
+
+        For use with `settings.CHANGELOG_DEFER_SERIALIZATION`. Rather than serializing the changed object right away,
+        and again whenever it's changed further in the same transaction, all of the object changes queued during a
+        transaction are serialized (once each, from the committed state of the objects) and created in bulk once the
+        transaction commits. Object changes queued in a savepoint that's rolled back are discarded. Outside of a
+        transaction, the ObjectChange is created right away.
+        """
+        entry = self.deferred_object_changes[unique_object_change_id][-1]
+        if not connection.in_atomic_block:
+            self._create_queued_object_changes({unique_object_change_id: entry})
+            return
+
+        savepoint_ids = tuple(connection.savepoint_ids)
+        batch = self.queued_object_change_batches[-1] if self.queued_object_change_batches else None
+        # Django replaces the list of on-commit callbacks whenever any of them are run or discarded
+        if (
+            batch is None
+            or batch["savepoint_ids"] != savepoint_ids
+            or batch["run_on_commit"] is not connection.run_on_commit
+        ):
+            batch = {"changes": {}, "savepoint_ids": savepoint_ids}
+            batch["callback"] = functools.partial(self._create_queued_object_change_batch, batch)
+            self.queued_object_change_batches.append(batch)
+            transaction.on_commit(batch["callback"])
+            batch["run_on_commit"] = connection.run_on_commit
+        batch["changes"][unique_object_change_id] = entry
+
+    def create_queued_object_change(self, unique_object_change_id):
+        """
+        Create the ObjectChange queued by `queue_object_change()` for the given ID right away, if any.
+
+        Used before an object is deleted, while it can still be serialized.
+        """
+        if not self.queued_object_change_batches:
+            return
+        pending_callbacks = {id(func) for _, func, _ in connection.run_on_commit}
+        # If the on-commit callback of a batch is gone, its transaction (or savepoint) was rolled back
+        self.queued_object_change_batches = [
+            batch for batch in self.queued_object_change_batches if id(batch["callback"]) in pending_callbacks
+        ]
+        for batch in self.queued_object_change_batches:
+            entry = batch["changes"].pop(unique_object_change_id, None)
+            if entry is not None:
+                self._create_queued_object_changes({unique_object_change_id: entry})
+
+    def _create_queued_object_change_batch(self, batch):
+        """On-commit callback creating the ObjectChanges of a batch of queued object changes."""
+        self.queued_object_change_batches = [
+            queued_batch for queued_batch in self.queued_object_change_batches if queued_batch is not batch
+        ]
+        self._create_queued_object_changes(batch["changes"])
+
+    def _create_queued_object_changes(self, changes):
+        """Create the ObjectChanges for the given queued object changes, retrieving their objects anew in bulk."""
+        pks_by_model = defaultdict(list)
+        for entry in changes.values():
+            pks_by_model[type(entry["instance"])].append(entry["instance"].pk)
+        instances_by_model = {model: model._base_manager.in_bulk(pks) for model, pks in pks_by_model.items()}
+
+        create_object_changes = []
+        for entry in changes.values():
+            instance = instances_by_model[type(entry["instance"])].get(entry["instance"].pk)
+            objectchange = self._to_objectchange(entry, instance=instance)
+            if objectchange is not None:
+                create_object_changes.append(objectchange)
+        ObjectChange.objects.bulk_create(create_object_changes)
+
 
 class JobChangeContext(ChangeContext):
     """ChangeContext for changes made by jobs"""
@@ -179,8 +289,6 @@ def web_request_context(
         Valid choices are in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param request: Optional web request instance, one will be generated if not supplied
     """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
-
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
         ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK: JobHookChangeContext,
@@ -203,9 +311,20 @@ def web_request_context(
             yield request
     finally:
         # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+        if change_context.queued_object_change_batches and connection.in_atomic_block:
+            # Some of the ObjectChanges are only created once the transaction commits
+            transaction.on_commit(functools.partial(_enqueue_hooks, change_context.change_id))
+        else:
+            _enqueue_hooks(change_context.change_id)
+
+
+def _enqueue_hooks(change_id):
+    """Enqueue the job hooks and webhooks for the ObjectChanges with the given request ID."""
+    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
+
+    for object_change in ObjectChange.objects.filter(request_id=change_id).iterator():
+        enqueue_job_hooks(object_change)
+        enqueue_webhooks(object_change)
 
 
 @contextmanager
@@ -1877,6 +1877,8 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_size",
+            "batch_interval",
         )
 
     def clean(self):
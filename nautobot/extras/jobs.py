@@ -30,6 +30,7 @@ import netaddr
 import yaml
 
 from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery.log import flush_job_log_entries
 from nautobot.core.forms import (
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
@@ -275,6 +276,9 @@ class BaseJob:
         if status == JobResultStatusChoices.STATUS_SUCCESS:
             self.logger.info("Job completed", extra={"grouping": "post_run"})
 
+        # Make sure that all log entries generated by this Job are written to the database
+        flush_job_log_entries(task_id=task_id)
+
     @final
     @classproperty
     def file_path(cls) -> str:  # pylint: disable=no-self-argument
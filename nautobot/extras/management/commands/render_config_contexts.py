@@ -0,0 +1,43 @@
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+
+from nautobot.extras.models import ConfigContextModel, RenderedConfigContext
+
+
+class Command(BaseCommand):
+    help = "Render and store the config contexts of all devices and virtual machines."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            dest="batch_size",
+            help="Number of objects to render at once (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        """Render the config context of every object of every ConfigContextModel and store the results."""
+        if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "CONFIG_CONTEXT_MATERIALIZATION_ENABLED is not set, "
+                    "so the stored config contexts will not be kept up to date or used."
+                )
+            )
+
+        for model in apps.get_models():
+            if not issubclass(model, ConfigContextModel):
+                continue
+            self.stdout.write(self.style.NOTICE(f"Rendering config contexts of {model._meta.verbose_name_plural}..."))
+            object_ids = model.objects.values_list("pk", flat=True)
+            count = RenderedConfigContext.objects.update_for_objects(
+                model, object_ids, batch_size=options["batch_size"]
+            )
+            # Discard any stored data of objects that no longer exist
+            RenderedConfigContext.objects.filter(assigned_object_type=ContentType.objects.get_for_model(model)).exclude(
+                assigned_object_id__in=model.objects.values("pk")
+            ).delete()
+            self.stdout.write(self.style.SUCCESS(f"Rendered {count} {model._meta.verbose_name_plural}"))
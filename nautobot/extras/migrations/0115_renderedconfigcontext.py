@@ -0,0 +1,48 @@
+# Generated by Django 4.2.15 on 2024-08-20 10:12
+
+import uuid
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0114_computedfield_grouping"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RenderedConfigContext",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("assigned_object_id", models.UUIDField()),
+                ("data", models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "assigned_object_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "config_contexts",
+                    models.ManyToManyField(
+                        blank=True, related_name="rendered_config_contexts", to="extras.configcontext"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("assigned_object_type", "assigned_object_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2024-08-21 09:40
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0115_renderedconfigcontext"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_interval",
+            field=models.PositiveIntegerField(
+                default=10,
+                help_text="When sending changes in batches, the maximum time to wait for more changes before sending a batch smaller than the batch size.",
+                verbose_name="Batch interval (seconds)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_size",
+            field=models.PositiveIntegerField(
+                default=1,
+                help_text="Maximum number of changes to send in a single request. If greater than 1, changes are sent in batches, and the request body is rendered with a <code>changes</code> list of the individual changes.",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.16 on 2024-09-05 14:12
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class AddIndexConcurrentlyOnPostgreSQL(AddIndexConcurrently):
+    """Add the index without locking the table against writes on PostgreSQL, and as usual on other databases."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class RemoveIndexConcurrentlyOnPostgreSQL(RemoveIndexConcurrently):
+    """Remove the index without locking the table against writes on PostgreSQL, and as usual on other databases."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.RemoveIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            migrations.RemoveIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    # Building an index concurrently can't be done in a transaction, and the ObjectChange table may be very large
+    atomic = False
+
+    dependencies = [
+        ("extras", "0116_webhook_batching"),
+    ]
+
+    operations = [
+        # Add the new index before removing the old one, so that lookups by changed object are never left unindexed
+        AddIndexConcurrentlyOnPostgreSQL(
+            model_name="objectchange",
+            index=models.Index(
+                fields=["changed_object_type", "changed_object_id", "time"], name="changed_object_time_idx"
+            ),
+        ),
+        RemoveIndexConcurrentlyOnPostgreSQL(
+            model_name="objectchange",
+            name="changed_object_idx",
+        ),
+    ]
@@ -27,6 +27,7 @@ from .models import (
     HealthCheckTestModel,
     ImageAttachment,
     Note,
+    RenderedConfigContext,
     SavedView,
     UserSavedViewAssociation,
     Webhook,
@@ -75,6 +76,7 @@ __all__ = (
     "Relationship",
     "RelationshipModel",
     "RelationshipAssociation",
+    "RenderedConfigContext",
     "Role",
     "RoleField",
     "SavedView",
@@ -35,13 +35,18 @@ class ChangeLoggedModel(models.Model):
         """
         Return a new ObjectChange representing a change made to this object, or None if the object shouldn't be logged.
 
-        This will typically be called automatically by ChangeLoggingMiddleware.
+        This will typically be called automatically by ChangeLoggingMiddleware. The legacy `object_data` is left empty
+        if `settings.CHANGELOG_SKIP_OBJECT_DATA` is set.
         """
+        if settings.CHANGELOG_SKIP_OBJECT_DATA:
+            object_data = {}
+        else:
+            object_data = serialize_object(self, extra=object_data_extra, exclude=object_data_exclude)
         return ObjectChange(
             changed_object=self,
             object_repr=str(self)[:CHANGELOG_MAX_OBJECT_REPR],
             action=action,
-            object_data=serialize_object(self, extra=object_data_extra, exclude=object_data_exclude),
+            object_data=object_data,
             object_data_v2=serialize_object_v2(self),
             related_object=related_object,
         )
@@ -132,9 +137,10 @@ class ObjectChange(BaseModel):
                 name="extras_objectchange_rtime_idx",
                 fields=["-time"],
             ),
+            # Also serves get_prev_change() and get_next_change(), which find the adjacent change by time
             models.Index(
-                name="changed_object_idx",
-                fields=["changed_object_type", "changed_object_id"],
+                name="changed_object_time_idx",
+                fields=["changed_object_type", "changed_object_id", "time"],
             ),
             models.Index(
                 name="related_object_idx",
@@ -220,7 +226,10 @@ class ObjectChange(BaseModel):
                 postchange = self.object_data
 
         if prechange and postchange:
-            if self.object_data_v2 is None or prior_change.object_data_v2 is None:
+            # Compare the legacy data of both changes if either lacks the v2 data, unless either lacks the legacy data
+            if (self.object_data_v2 is None or prior_change.object_data_v2 is None) and (
+                self.object_data and prior_change.object_data
+            ):
                 prechange = prior_change.object_data
                 postchange = self.object_data
             diff_added = shallow_compare_dict(prechange, postchange, exclude=["last_updated"])
@@ -6,7 +6,6 @@ import re
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import RegexValidator, ValidationError
@@ -40,7 +39,7 @@ from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTy
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import ContactMixin, DynamicGroupsModelMixin, NotesMixin, SavedViewMixin
 from nautobot.extras.tasks import delete_custom_field_data, update_custom_field_choice_data
-from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery
+from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery, metadata_cache
 
 logger = logging.getLogger(__name__)
 
@@ -53,15 +52,9 @@ class ComputedFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
         Return all ComputedFields assigned to the given model.
         """
         concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
-            content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_type=content_type)
-            cache.set(cache_key, queryset)
-        return queryset
-
-    get_for_model.cache_key_prefix = "nautobot.extras.computedfield.get_for_model"
+        content_type = ContentType.objects.get_for_model(concrete_model)
+        queryset = self.get_queryset().filter(content_type=content_type)
+        return metadata_cache.get_queryset(("computedfield", concrete_model._meta.label_lower), queryset)
 
 
 @extras_features("graphql")
@@ -377,19 +370,13 @@ class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
             exclude_filter_disabled: Exclude any custom fields which have filter logic disabled
         """
         concrete_model = model._meta.concrete_model
-        cache_key = (
-            f"{self.get_for_model.cache_key_prefix}.{concrete_model._meta.label_lower}.{exclude_filter_disabled}"
+        content_type = ContentType.objects.get_for_model(concrete_model)
+        queryset = self.get_queryset().filter(content_types=content_type)
+        if exclude_filter_disabled:
+            queryset = queryset.exclude(filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED)
+        return metadata_cache.get_queryset(
+            ("customfield", concrete_model._meta.label_lower, exclude_filter_disabled), queryset
         )
-        queryset = cache.get(cache_key)
-        if queryset is None:
-            content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = self.get_queryset().filter(content_types=content_type)
-            if exclude_filter_disabled:
-                queryset = queryset.exclude(filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED)
-            cache.set(cache_key, queryset)
-        return queryset
-
-    get_for_model.cache_key_prefix = "nautobot.extras.customfield.get_for_model"
 
 
 @extras_features("webhooks")
@@ -1,5 +1,6 @@
 """Dynamic Groups Models."""
 
+from contextlib import contextmanager
 import logging
 
 from django import forms
@@ -21,13 +22,33 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.deprecation import method_deprecated, method_deprecated_in_favor_of
 from nautobot.core.utils.lookup import get_filterset_for_model, get_form_for_model
-from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices
+from nautobot.extras.choices import DynamicGroupOperatorChoices, DynamicGroupTypeChoices, ObjectChangeActionChoices
 from nautobot.extras.querysets import DynamicGroupMembershipQuerySet, DynamicGroupQuerySet
-from nautobot.extras.utils import extras_features, FeatureQuery
+from nautobot.extras.utils import bulk_delete_with_bulk_change_logging, extras_features, FeatureQuery
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _deferred_change_logging():
+    """
+    Defer change logging (if enabled) for the duration of a bulk operation on group members, yielding the ChangeContext.
+
+    If change logging is not enabled, yields `None`; if already deferred by an enclosing bulk operation, leaves it
+    to that operation to flush the deferred object changes.
+    """
+    # Circular imports
+    from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if change_context is None or change_context.defer_object_changes:
+        yield change_context
+    else:
+        with deferred_change_logging_for_bulk_operation():
+            yield change_context
+
+
 @extras_features(
     "custom_links",
     "custom_validators",
@@ -311,30 +332,35 @@ class DynamicGroup(PrimaryModel):
             )
         return self._set_members(value)
 
+    def _get_object_pks(self, objects):
+        """Return the set of PKs of the given list or QuerySet of objects, which must all be of this group's model."""
+        if isinstance(objects, models.QuerySet):
+            if objects.model != self.model:
+                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
+            return set(objects.values_list("pk", flat=True))
+
+        pks = set()
+        for obj in objects:
+            if not isinstance(obj, self.model):
+                raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+            pks.add(obj.pk)
+        return pks
+
+    def _get_cached_member_pks(self, pks=None):
+        """Return the set of PKs of the (cached) members of this group, optionally limited to the given `pks`."""
+        associations = StaticGroupAssociation.all_objects.filter(
+            dynamic_group=self, associated_object_type=self.content_type
+        )
+        if pks is not None:
+            associations = associations.filter(associated_object_id__in=pks)
+        return set(associations.values_list("associated_object_id", flat=True))
+
     def _set_members(self, value):
         """Internal API for updating the static/cached members of this group."""
-        if isinstance(value, models.QuerySet):
-            if value.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            to_remove = self.members.exclude(pk__in=value.values_list("pk", flat=True))
-            self._remove_members(to_remove)
-            to_add = value.exclude(pk__in=self.members.values_list("pk", flat=True))
-            self._add_members(to_add)
-        else:
-            for obj in value:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-            to_remove = []
-            for member in self.members:
-                if member not in value:
-                    to_remove.append(member)
-            self._remove_members(to_remove)
-            to_add = []
-            members = self.members
-            for candidate in value:
-                if candidate not in members:
-                    to_add.append(candidate)
-            self._add_members(to_add)
+        pks = self._get_object_pks(value)
+        existing_pks = self._get_cached_member_pks()
+        self._remove_member_pks(existing_pks - pks)
+        self._add_member_pks(pks - existing_pks)
 
         return self.members
 
@@ -346,32 +372,43 @@ class DynamicGroup(PrimaryModel):
 
     def _add_members(self, objects_to_add):
         """Internal API for adding the given list or QuerySet of objects to the cached/static members of this group."""
-        if isinstance(objects_to_add, models.QuerySet):
-            if objects_to_add.model != self.model:
-                raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-        else:
-            for obj in objects_to_add:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
+        pks = self._get_object_pks(objects_to_add)
+        if pks:
+            self._add_member_pks(pks - self._get_cached_member_pks(pks))
+
+    def _add_member_pks(self, pks_to_add, batch_size=1000):
+        """Bulk-create associations to this group for the given object PKs, which must not already be members."""
+        if not pks_to_add:
+            return
+
+        sgas = [
+            StaticGroupAssociation(
+                dynamic_group=self, associated_object_type=self.content_type, associated_object_id=pk
+            )
+            for pk in pks_to_add
+        ]
 
-        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
-            for obj in objects_to_add:
-                # We don't use `.bulk_create()` currently because we want change logging for these creates.
-                # Might be a good future performance improvement though.
-                StaticGroupAssociation.all_objects.get_or_create(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-        else:
+        from nautobot.extras.signals import (  # avoid circular import
+            queue_rendered_config_context_updates_for_group_members,
+            queue_saved_query_results_invalidation,
+        )
+
+        # Bulk-create doesn't send the post_save signals that would otherwise invalidate cached saved query results
+        # and queue the re-rendering of the config contexts of the new members
+        queue_saved_query_results_invalidation(StaticGroupAssociation)
+        queue_rendered_config_context_updates_for_group_members(self.model, pks_to_add)
+
+        if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
             # Cached/hidden static group associations, so we can use bulk-create to bypass change logging.
-            existing_members = self.members
-            sgas = [
-                StaticGroupAssociation(
-                    dynamic_group=self, associated_object_type=self.content_type, associated_object_id=obj.pk
-                )
-                for obj in objects_to_add
-                if obj not in existing_members
-            ]
-            StaticGroupAssociation.all_objects.bulk_create(sgas)
+            StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=batch_size, ignore_conflicts=True)
+            return
+
+        # Static group associations are change-logged, but bulk-create doesn't emit the signals that would normally
+        # take care of that, so we need to record the object changes ourselves.
+        with _deferred_change_logging() as change_context:
+            StaticGroupAssociation.all_objects.bulk_create(sgas, batch_size=batch_size, ignore_conflicts=True)
+            if change_context is not None:
+                change_context.add_deferred_object_changes(sgas, ObjectChangeActionChoices.ACTION_CREATE)
 
     def remove_members(self, objects_to_remove):
         """Remove the given list or QuerySet of objects from this staticly defined group."""
@@ -384,21 +421,30 @@ class DynamicGroup(PrimaryModel):
         if isinstance(objects_to_remove, models.QuerySet):
             if objects_to_remove.model != self.model:
                 raise TypeError(f"QuerySet does not contain {self.model._meta.label_lower} objects")
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self,
-                associated_object_type=self.content_type,
-                associated_object_id__in=objects_to_remove.values_list("pk", flat=True),
-            ).delete()
+            self._remove_member_pks(objects_to_remove.values_list("pk", flat=True))
         else:
-            pks_to_remove = set()
-            for obj in objects_to_remove:
-                if not isinstance(obj, self.model):
-                    raise TypeError(f"{obj} is not a {self.model._meta.label_lower}")
-                pks_to_remove.add(obj.pk)
+            self._remove_member_pks(self._get_object_pks(objects_to_remove))
+
+    def _remove_member_pks(self, pks_to_remove):
+        """Delete the associations to this group for the given object PKs (or subquery of PKs)."""
+        if isinstance(pks_to_remove, (set, list, tuple)) and not pks_to_remove:
+            return
+
+        associations = StaticGroupAssociation.all_objects.filter(
+            dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks_to_remove
+        )
+        if self.group_type != DynamicGroupTypeChoices.TYPE_STATIC:
+            associations.delete()
+            return
 
-            StaticGroupAssociation.all_objects.filter(
-                dynamic_group=self, associated_object_type=self.content_type, associated_object_id__in=pks_to_remove
-            ).delete()
+        from nautobot.extras.signals import change_context_state  # avoid circular import
+
+        change_context = change_context_state.get()
+        if change_context is None or change_context.defer_object_changes:
+            # Either no change logging, or an enclosing bulk operation will take care of flushing the object changes.
+            associations.delete()
+        else:
+            bulk_delete_with_bulk_change_logging(associations)
 
     @property
     @method_deprecated("Members are now cached in the database via StaticGroupAssociations rather than in Redis.")
@@ -432,6 +478,61 @@ class DynamicGroup(PrimaryModel):
 
         return members
 
+    def update_cached_members_for_objects(self, object_ids, batch_size=1000):
+        """
+        Re-evaluate membership of only the given objects and update the cached members of this group accordingly.
+
+        This is a much cheaper alternative to `update_cached_members()` when only a handful of candidate objects
+        have been created, updated, or deleted, as only those objects are evaluated against this group's filter(s).
+        Objects that no longer exist in the database are removed from the cache.
+
+        Args:
+            object_ids (iterable): Primary keys of the objects to re-evaluate.
+            batch_size (int): Maximum number of objects to evaluate per database query.
+
+        Returns:
+            tuple: `(added_ids, removed_ids)`, the sets of object primary keys added to and removed from this group.
+        """
+        added_ids = set()
+        removed_ids = set()
+
+        if self.group_type == DynamicGroupTypeChoices.TYPE_STATIC:
+            return added_ids, removed_ids  # nothing to do
+        if self.group_type not in (
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_FILTER,
+            DynamicGroupTypeChoices.TYPE_DYNAMIC_SET,
+        ):
+            raise RuntimeError(f"Unknown/invalid group_type {self.group_type}")
+
+        object_ids = list(set(object_ids))
+        if not object_ids:
+            return added_ids, removed_ids
+
+        group_queryset = self._get_group_queryset()
+
+        for i in range(0, len(object_ids), batch_size):
+            batch = object_ids[i : i + batch_size]
+            matching_ids = set(group_queryset.filter(pk__in=batch).values_list("pk", flat=True))
+            cached_ids = self._get_cached_member_pks(batch)
+
+            to_add = matching_ids - cached_ids
+            to_remove = cached_ids - matching_ids
+            self._remove_member_pks(to_remove)
+            self._add_member_pks(to_add)
+
+            added_ids.update(to_add)
+            removed_ids.update(to_remove)
+
+        logger.debug(
+            "Incrementally refreshed cache for %s from %d objects: %d added, %d removed",
+            self,
+            len(object_ids),
+            len(added_ids),
+            len(removed_ids),
+        )
+
+        return added_ids, removed_ids
+
     def has_member(self, obj, use_cache=False):
         """
         Return True if the given object is a member of this group.
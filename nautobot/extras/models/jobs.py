@@ -752,6 +752,26 @@ class JobResult(BaseModel, CustomFieldModel):
         level_choice (LogLevelChoices): Message severity level
         grouping (str): Grouping to store the log message under
         """
+        log = self.build_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)
+        # If the override is provided, we want to use the default database(pass no using argument)
+        # Otherwise we want to use a separate database here so that the logs are created immediately
+        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
+        # are running, and allow us to rollback the database without losing the log entries.
+        if not self.use_job_logs_db or not JOB_LOGS:
+            log.save()
+        else:
+            log.save(using=JOB_LOGS)
+
+    def build_log_entry(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """
+        Construct (but do not save) a JobLogEntry for this JobResult; see `log()` for a description of the arguments.
+        """
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
 
@@ -779,14 +799,21 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
-        # If the override is provided, we want to use the default database(pass no using argument)
-        # Otherwise we want to use a separate database here so that the logs are created immediately
-        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
-        # are running, and allow us to rollback the database without losing the log entries.
+        return log
+
+    def bulk_log(self, log_entries, batch_size=1000):
+        """
+        Save the given list of JobLogEntry instances (e.g. from `build_log_entry()`) in bulk.
+
+        As with `log()`, the entries are written using the separate `JOB_LOGS` database connection (if enabled), so
+        that they're immediately visible and aren't lost if the Job's own database transaction is rolled back.
+        """
+        if not log_entries:
+            return
         if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
+            JobLogEntry.objects.bulk_create(log_entries, batch_size=batch_size)
         else:
-            log.save(using=JOB_LOGS)
+            JobLogEntry.objects.using(JOB_LOGS).bulk_create(log_entries, batch_size=batch_size)
 
 
 #
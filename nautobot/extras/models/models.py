@@ -34,7 +34,7 @@ from nautobot.extras.constants import HTTP_CONTENT_TYPE_JSON
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import ContactMixin, DynamicGroupsModelMixin, NotesMixin, SavedViewMixin
 from nautobot.extras.models.relationships import RelationshipModel
-from nautobot.extras.querysets import ConfigContextQuerySet, NotesQuerySet
+from nautobot.extras.querysets import ConfigContextQuerySet, NotesQuerySet, RenderedConfigContextQuerySet
 from nautobot.extras.utils import extras_features, FeatureQuery, image_upload
 
 # Avoid breaking backward compatibility on anything that might expect these to still be defined here:
@@ -157,6 +157,61 @@ class ConfigContext(
         # Validate data against schema
         self._validate_with_schema("data", "config_context_schema")
 
+    def get_matching_objects(self, model):
+        """
+        Return a queryset of the objects of the given ConfigContextModel (Device or VirtualMachine) this context applies to.
+
+        This is the inverse of `ConfigContext.objects.get_for_object()`: an object matches if, for every kind of scope
+        that this context is assigned to, the object matches at least one of the assigned values.
+        """
+        from nautobot.extras.models.groups import StaticGroupAssociation
+
+        queryset = model.objects.all()
+        if not self.is_active:
+            return queryset.none()
+
+        is_device = model._meta.model_name == "device"
+        location_field = "location" if is_device else "cluster__location"
+        scope_filters = {
+            # Objects match locations and tenant groups by way of any of their ancestors
+            f"{location_field}__in": {
+                descendant.pk
+                for location in self.locations.all()
+                for descendant in location.descendants(include_self=True)
+            },
+            "tenant__tenant_group__in": {
+                descendant.pk
+                for tenant_group in self.tenant_groups.all()
+                for descendant in tenant_group.descendants(include_self=True)
+            },
+            "role__in": set(self.roles.values_list("pk", flat=True)),
+            "platform__in": set(self.platforms.values_list("pk", flat=True)),
+            "cluster__cluster_group__in": set(self.cluster_groups.values_list("pk", flat=True)),
+            "cluster__in": set(self.clusters.values_list("pk", flat=True)),
+            "tenant__in": set(self.tenants.values_list("pk", flat=True)),
+            "tags__in": set(self.tags.values_list("pk", flat=True)),
+        }
+        device_scope_filters = {
+            "device_type__in": set(self.device_types.values_list("pk", flat=True)),
+            "device_redundancy_group__in": set(self.device_redundancy_groups.values_list("pk", flat=True)),
+        }
+        if is_device:
+            scope_filters.update(device_scope_filters)
+        elif any(device_scope_filters.values()):
+            # A context assigned to device types or device redundancy groups never applies to virtual machines
+            return queryset.none()
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED and self.dynamic_groups.exists():
+            queryset = queryset.filter(
+                pk__in=StaticGroupAssociation.all_objects.filter(dynamic_group__in=self.dynamic_groups.all()).values(
+                    "associated_object_id"
+                )
+            )
+
+        for lookup, values in scope_filters.items():
+            if values:
+                queryset = queryset.filter(**{lookup: values})
+        return queryset.distinct()
+
 
 class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
     """
@@ -203,6 +258,9 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         """
         Return the rendered configuration context for a device or VM.
         """
+        if getattr(self, "rendered_config_context", None) is not None:
+            # Stored RenderedConfigContext data, as annotated by annotate_rendered_config_context()
+            return self.rendered_config_context
         if not hasattr(self, "config_context_data"):
             # Annotation not available, so fall back to manually querying for the config context
             config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
@@ -240,6 +298,36 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         self._validate_with_schema("local_config_context_data", "local_config_context_schema")
 
 
+class RenderedConfigContext(BaseModel):
+    """
+    The stored result of rendering the configuration context of a single Device or VirtualMachine.
+
+    These records are only maintained if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set, in which case they
+    are kept up to date in the background as the object itself, its applicable ConfigContexts, or the objects that
+    these contexts are scoped to change, and are used by the REST API and GraphQL in place of rendering the context.
+    """
+
+    assigned_object_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    assigned_object_id = models.UUIDField()
+    assigned_object = GenericForeignKey(ct_field="assigned_object_type", fk_field="assigned_object_id")
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+    # The ConfigContexts that were merged into `data`, so that the affected records are known when one of them changes
+    config_contexts = models.ManyToManyField(to=ConfigContext, related_name="rendered_config_contexts", blank=True)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    objects = BaseManager.from_queryset(RenderedConfigContextQuerySet)()
+
+    is_metadata_associable_model = False
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        unique_together = [["assigned_object_type", "assigned_object_id"]]
+
+    def __str__(self):
+        return f"Rendered config context for {self.assigned_object}"
+
+
 @extras_features(
     "custom_validators",
     "graphql",
@@ -986,6 +1074,18 @@ class Webhook(
         "Leave blank to use the system defaults.",
         default="",
     )
+    batch_size = models.PositiveIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text="Maximum number of changes to send in a single request. If greater than 1, changes are sent in "
+        "batches, and the request body is rendered with a <code>changes</code> list of the individual changes.",
+    )
+    batch_interval = models.PositiveIntegerField(
+        default=10,
+        verbose_name="Batch interval (seconds)",
+        help_text="When sending changes in batches, the maximum time to wait for more changes before sending a batch "
+        "smaller than the batch size.",
+    )
 
     class Meta:
         ordering = ("name",)
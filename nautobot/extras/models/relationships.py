@@ -3,7 +3,6 @@ import logging
 from django import forms
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -26,7 +25,7 @@ from nautobot.core.utils.lookup import get_filterset_for_model, get_route_for_mo
 from nautobot.extras.choices import RelationshipRequiredSideChoices, RelationshipSideChoices, RelationshipTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import ContactMixin, DynamicGroupsModelMixin, NotesMixin, SavedViewMixin
-from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery
+from nautobot.extras.utils import check_if_key_is_graphql_safe, extras_features, FeatureQuery, metadata_cache
 
 logger = logging.getLogger(__name__)
 
@@ -366,19 +365,15 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
             hidden (bool): Filter based on the value of the hidden flag, or None to not apply this filter
         """
         concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model_source.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
-            content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = (
-                self.get_queryset().filter(source_type=content_type).select_related("source_type", "destination_type")
-            )  # You almost always will want access to the source_type/destination_type
-            if hidden is not None:
-                queryset = queryset.filter(source_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
-
-    get_for_model_source.cache_key_prefix = "nautobot.extras.relationship.get_for_model_source"
+        content_type = ContentType.objects.get_for_model(concrete_model)
+        queryset = (
+            self.get_queryset().filter(source_type=content_type).select_related("source_type", "destination_type")
+        )  # You almost always will want access to the source_type/destination_type
+        if hidden is not None:
+            queryset = queryset.filter(source_hidden=hidden)
+        return metadata_cache.get_queryset(
+            ("relationship", "source", concrete_model._meta.label_lower, hidden), queryset
+        )
 
     def get_for_model_destination(self, model, hidden=None):
         """
@@ -389,21 +384,15 @@ class RelationshipManager(BaseManager.from_queryset(RestrictedQuerySet)):
             hidden (bool): Filter based on the value of the hidden flag, or None to not apply this filter
         """
         concrete_model = model._meta.concrete_model
-        cache_key = f"{self.get_for_model_destination.cache_key_prefix}.{concrete_model._meta.label_lower}.{hidden}"
-        queryset = cache.get(cache_key)
-        if queryset is None:
-            content_type = ContentType.objects.get_for_model(concrete_model)
-            queryset = (
-                self.get_queryset()
-                .filter(destination_type=content_type)
-                .select_related("source_type", "destination_type")
-            )  # You almost always will want access to the source_type/destination_type
-            if hidden is not None:
-                queryset = queryset.filter(destination_hidden=hidden)
-            cache.set(cache_key, queryset)
-        return queryset
-
-    get_for_model_destination.cache_key_prefix = "nautobot.extras.relationship.get_for_model_destination"
+        content_type = ContentType.objects.get_for_model(concrete_model)
+        queryset = (
+            self.get_queryset().filter(destination_type=content_type).select_related("source_type", "destination_type")
+        )  # You almost always will want access to the source_type/destination_type
+        if hidden is not None:
+            queryset = queryset.filter(destination_hidden=hidden)
+        return metadata_cache.get_queryset(
+            ("relationship", "destination", concrete_model._meta.label_lower, hidden), queryset
+        )
 
     def get_required_for_model(self, model):
         """
@@ -5,10 +5,24 @@ from django.db import models
 from django.utils.encoding import force_str
 from django.utils.hashable import make_hashable
 
+from nautobot.core.models import BaseManager, ContentTypeRelatedQuerySet
 from nautobot.core.models.fields import ForeignKeyLimitedByContentTypes
 from nautobot.core.models.name_color_content_types import NameColorContentTypesModel
 from nautobot.core.utils.deprecation import class_deprecated
-from nautobot.extras.utils import extras_features, FeatureQuery
+from nautobot.extras.utils import extras_features, FeatureQuery, metadata_cache
+
+
+class StatusManager(BaseManager.from_queryset(ContentTypeRelatedQuerySet)):
+    def get_for_model(self, model):
+        """
+        Return all Statuses assigned to the given model.
+
+        Unlike `ContentTypeRelatedQuerySet.get_for_model()`, which is still used when filtering an existing queryset,
+        the Statuses are taken from the in-process metadata cache whenever possible.
+        """
+        concrete_model = model._meta.concrete_model
+        queryset = super().get_for_model(concrete_model)
+        return metadata_cache.get_queryset(("status", concrete_model._meta.label_lower), queryset)
 
 
 @extras_features(
@@ -29,6 +43,8 @@ class Status(NameColorContentTypesModel):
         help_text="The content type(s) to which this status applies.",
     )
 
+    objects = StatusManager()
+
     class Meta:
         ordering = ["name"]
         verbose_name_plural = "statuses"
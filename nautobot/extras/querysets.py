@@ -1,10 +1,13 @@
-from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models import F, Model, OuterRef, Q, Subquery
 from django.db.models.functions import JSONObject
+from django.db.models.query import ModelIterable
+from django.utils import timezone
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
 from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.extras.config_context_index import get_config_context_index, get_object_scope_values
 from nautobot.extras.models.tags import TaggedItem
 
 
@@ -12,59 +15,13 @@ class ConfigContextQuerySet(RestrictedQuerySet):
     def get_for_object(self, obj):
         """
         Return all applicable ConfigContexts for a given object. Only active ConfigContexts will be included.
-        """
-
-        role = obj.role
-
-        # `device_type` for Device; `type` for VirtualMachine
-        device_type = getattr(obj, "device_type", None)
-
-        # Virtualization cluster for VirtualMachine
-        cluster = getattr(obj, "cluster", None)
-        cluster_group = getattr(cluster, "cluster_group", None)
-
-        device_redundancy_group = getattr(obj, "device_redundancy_group", None)
-
-        # Get the group of the assigned tenant, if any
-        tenant_group = obj.tenant.tenant_group if obj.tenant else None
-        tenant = obj.tenant if obj.tenant else None
-
-        if tenant_group:
-            tenant_groups = tenant_group.ancestors(include_self=True)
-        else:
-            tenant_groups = []
-        # Match against the directly assigned location as well as any parent locations
-        location = getattr(obj, "location", None)
-        if location:
-            locations = location.ancestors(include_self=True)
-        else:
-            locations = []
-
-        query = [
-            Q(locations__in=locations) | Q(locations=None),
-            Q(roles=role) | Q(roles=None),
-            Q(device_types=device_type) | Q(device_types=None),
-            Q(platforms=obj.platform) | Q(platforms=None),
-            Q(cluster_groups=cluster_group) | Q(cluster_groups=None),
-            Q(clusters=cluster) | Q(clusters=None),
-            Q(device_redundancy_groups=device_redundancy_group) | Q(device_redundancy_groups=None),
-            Q(tenant_groups__in=tenant_groups) | Q(tenant_groups=None),
-            Q(tenants=tenant) | Q(tenants=None),
-            Q(tags__name__in=obj.tags.names()) | Q(tags=None),
-        ]
-        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
-            query.append(Q(dynamic_groups__in=obj.dynamic_groups) | Q(dynamic_groups=None))
-
-        queryset = (
-            self.filter(
-                *query,
-                is_active=True,
-            )
-            .order_by("weight", "name")
-            .distinct()
-        )
 
-        return queryset
+        The applicable ConfigContexts are determined using the in-memory `ConfigContextScopeIndex`, rather than by
+        joining all of the scope tables of ConfigContexts in the database.
+        """
+        index = get_config_context_index()
+        config_context_ids = index.get_config_context_ids(get_object_scope_values(obj, index.get_scope_fields()))
+        return self.filter(pk__in=config_context_ids, is_active=True).order_by("weight", "name")
 
 
 class ConfigContextModelQuerySet(RestrictedQuerySet):
@@ -77,8 +34,45 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     multiple objects.
 
     This allows the annotation to be entirely optional.
+
+    Alternatively, `prefetch_config_context_data()` retrieves the same data for all of the objects at once from the
+    in-memory `ConfigContextScopeIndex` after the objects themselves have been fetched, avoiding the subquery entirely.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch_config_context_data = False
+
+    def _clone(self):
+        queryset = super()._clone()
+        queryset._prefetch_config_context_data = self._prefetch_config_context_data
+        return queryset
+
+    def _fetch_all(self):
+        fetch_needed = self._result_cache is None
+        super()._fetch_all()
+        if fetch_needed and self._prefetch_config_context_data and issubclass(self._iterable_class, ModelIterable):
+            objects = [obj for obj in self._result_cache if not hasattr(obj, "config_context_data")]
+            if objects:
+                config_context_data = get_config_context_index().get_config_context_data(
+                    self.model, [obj.pk for obj in objects]
+                )
+                for obj in objects:
+                    obj.config_context_data = config_context_data.get(obj.pk, [])
+
+    def prefetch_config_context_data(self):
+        """
+        Attach the same `config_context_data` as `annotate_config_context_data()` to each object once it is fetched.
+
+        Rather than a subquery, the data is looked up from the in-memory `ConfigContextScopeIndex`, retrieving the scope
+        values of all of the fetched objects with at most three additional queries.
+
+        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
+        """
+        queryset = self._chain()
+        queryset._prefetch_config_context_data = True
+        return queryset
+
     def annotate_config_context_data(self):
         """
         Attach the subquery annotation to the base queryset.
@@ -97,6 +91,7 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
                 .annotate(
                     _data=EmptyGroupByJSONBAgg(
                         JSONObject(
+                            id=F("id"),
                             data=F("data"),
                             name=F("name"),
                             weight=F("weight"),
@@ -108,6 +103,25 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
             )
         ).distinct()
 
+    def annotate_rendered_config_context(self):
+        """
+        Attach the stored `RenderedConfigContext` data of each object (if any) as a `rendered_config_context` annotation.
+
+        Unlike `annotate_config_context_data()`, this doesn't involve any matching or merging of ConfigContexts, but the
+        stored data is only available if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set. Objects without
+        stored data fall back to rendering their config context on demand in `get_config_context()`.
+        """
+        from nautobot.extras.models import RenderedConfigContext
+
+        return self.annotate(
+            rendered_config_context=Subquery(
+                RenderedConfigContext.objects.filter(
+                    assigned_object_type=ContentType.objects.get_for_model(self.model),
+                    assigned_object_id=OuterRef("pk"),
+                ).values("data")[:1]
+            )
+        )
+
     def _get_config_context_filters(self):
         """
         This method is constructing the set of Q objects for the specific object types.
@@ -157,6 +171,78 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         return base_query
 
 
+class RenderedConfigContextQuerySet(RestrictedQuerySet):
+    """Queryset for `RenderedConfigContext` objects, providing the means to (re-)render them in bulk."""
+
+    def update_for_objects(self, model, object_ids, batch_size=1000):
+        """
+        Render the config contexts of the given Device or VirtualMachine objects and store the results.
+
+        Objects are processed `batch_size` at a time, matching the ConfigContexts of each batch with the
+        `ConfigContextScopeIndex`. Stored data for any of the given IDs that no longer correspond to an existing object
+        is deleted.
+
+        Args:
+            model (Model): The ConfigContextModel subclass of the objects
+            object_ids (iterable): The PKs of the objects to render
+            batch_size (int): Number of objects to render and store at a time
+
+        Returns:
+            (int): The number of objects whose config context was rendered.
+        """
+        from nautobot.extras.signals import queue_saved_query_results_invalidation  # avoid circular import
+
+        index = get_config_context_index()
+        content_type = ContentType.objects.get_for_model(model)
+        through_model = self.model.config_contexts.through
+        object_ids = list(object_ids)
+        count = 0
+        for start in range(0, len(object_ids), batch_size):
+            batch = object_ids[start : start + batch_size]
+            objects = model.objects.filter(pk__in=batch)
+            config_context_data = index.get_config_context_data(model, batch)
+            existing = {
+                record.assigned_object_id: record
+                for record in self.model.objects.filter(assigned_object_type=content_type, assigned_object_id__in=batch)
+            }
+            now = timezone.now()
+            to_create = []
+            to_update = []
+            config_context_ids = {}
+            for obj in objects:
+                obj.config_context_data = config_context_data.get(obj.pk, [])
+                data = obj.get_config_context()
+                record = existing.pop(obj.pk, None)
+                if record is None:
+                    record = self.model(assigned_object_type=content_type, assigned_object_id=obj.pk)
+                    to_create.append(record)
+                else:
+                    to_update.append(record)
+                record.data = data
+                record.last_updated = now
+                config_context_ids[record.pk] = {str(context["id"]) for context in obj.config_context_data or []}
+                count += 1
+
+            with transaction.atomic():
+                # Whatever remains in `existing` belongs to objects that have since been deleted
+                self.model.objects.filter(pk__in=[record.pk for record in existing.values()]).delete()
+                self.model.objects.bulk_create(to_create, batch_size=batch_size)
+                self.model.objects.bulk_update(to_update, ["data", "last_updated"], batch_size=batch_size)
+                through_model.objects.filter(renderedconfigcontext_id__in=config_context_ids.keys()).delete()
+                through_model.objects.bulk_create(
+                    [
+                        through_model(renderedconfigcontext_id=record_pk, configcontext_id=context_id)
+                        for record_pk, context_ids in config_context_ids.items()
+                        for context_id in context_ids
+                    ],
+                    batch_size=batch_size,
+                )
+                # The bulk operations above don't send the signals that would otherwise invalidate cached saved query
+                # results involving config contexts
+                queue_saved_query_results_invalidation(self.model)
+        return count
+
+
 class DynamicGroupQuerySet(RestrictedQuerySet):
     """Queryset for `DynamicGroup` objects that provides `get_for_object` and `get_for_model` methods."""
 
@@ -22,10 +22,14 @@ import redis.exceptions
 from nautobot.core.celery import app, import_jobs
 from nautobot.core.models import BaseModel
 from nautobot.core.utils.logging import sanitize
+from nautobot.core.utils.transactions import OnCommitCallback
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
+from nautobot.extras.config_context_index import config_context_index_cache, SCOPE_FIELDS
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import (
     ComputedField,
+    ConfigContext,
+    ConfigContextModel,
     ContactAssociation,
     CustomField,
     DynamicGroup,
@@ -35,10 +39,15 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     Relationship,
+    RenderedConfigContext,
+    StaticGroupAssociation,
+    Status,
+    Webhook,
 )
 from nautobot.extras.querysets import NotesQuerySet
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
-from nautobot.extras.utils import refresh_job_model_from_job_class
+from nautobot.extras.utils import metadata_cache, refresh_job_model_from_job_class
+from nautobot.extras.webhooks import webhook_cache
 
 # thread safe change context state variable
 change_context_state = contextvars.ContextVar("change_context_state", default=None)
@@ -64,47 +73,37 @@ def get_user_if_authenticated(user, instance):
         return None
 
 
-@receiver(post_save, sender=ComputedField)
-@receiver(post_save, sender=CustomField)
-@receiver(post_save, sender=CustomField.content_types.through)
 @receiver(post_save, sender=MetadataType)
 @receiver(post_save, sender=MetadataType.content_types.through)
-@receiver(m2m_changed, sender=ComputedField)
-@receiver(m2m_changed, sender=CustomField)
-@receiver(m2m_changed, sender=CustomField.content_types.through)
 @receiver(m2m_changed, sender=MetadataType)
 @receiver(m2m_changed, sender=MetadataType.content_types.through)
-@receiver(post_delete, sender=ComputedField)
-@receiver(post_delete, sender=CustomField)
-@receiver(post_delete, sender=CustomField.content_types.through)
 @receiver(post_delete, sender=MetadataType)
 @receiver(post_delete, sender=MetadataType.content_types.through)
 def invalidate_models_cache(sender, **kwargs):
-    """Invalidate the related-models cache for ComputedFields and CustomFields."""
-    if sender is CustomField.content_types.through:
-        manager = CustomField.objects
-    elif sender is MetadataType.content_types.through:
-        manager = MetadataType.objects
-    else:
-        manager = sender.objects
-
+    """Invalidate the related-models cache for MetadataTypes."""
     with contextlib.suppress(redis.exceptions.ConnectionError):
         # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
-        cache.delete_pattern(f"{manager.get_for_model.cache_key_prefix}.*")
+        cache.delete_pattern(f"{MetadataType.objects.get_for_model.cache_key_prefix}.*")
 
 
+@receiver(post_save, sender=ComputedField)
+@receiver(post_save, sender=CustomField)
+@receiver(post_save, sender=CustomField.content_types.through)
 @receiver(post_save, sender=Relationship)
+@receiver(post_save, sender=Status)
+@receiver(m2m_changed, sender=ComputedField)
+@receiver(m2m_changed, sender=CustomField)
+@receiver(m2m_changed, sender=CustomField.content_types.through)
 @receiver(m2m_changed, sender=Relationship)
+@receiver(m2m_changed, sender=Status.content_types.through)
+@receiver(post_delete, sender=ComputedField)
+@receiver(post_delete, sender=CustomField)
+@receiver(post_delete, sender=CustomField.content_types.through)
 @receiver(post_delete, sender=Relationship)
-def invalidate_relationship_models_cache(sender, **kwargs):
-    """Invalidate the related-models caches for Relationships."""
-    for method in (
-        Relationship.objects.get_for_model_source,
-        Relationship.objects.get_for_model_destination,
-    ):
-        with contextlib.suppress(redis.exceptions.ConnectionError):
-            # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
-            cache.delete_pattern(f"{method.cache_key_prefix}.*")
+@receiver(post_delete, sender=Status)
+def invalidate_metadata_cache(sender, **kwargs):
+    """Invalidate the cached CustomFields, ComputedFields, Relationships and Statuses of all models."""
+    metadata_cache.queue_invalidation()
 
 
 @receiver(post_save)
@@ -176,7 +175,10 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
             change_context.deferred_object_changes[unique_object_change_id] = [
                 {"action": action, "instance": instance, "user": user}
             ]
-            if not change_context.defer_object_changes:
+            if not change_context.defer_object_changes and settings.CHANGELOG_DEFER_SERIALIZATION:
+                # Serialize the object once the transaction commits, however many more times it's changed until then
+                change_context.queue_object_change(unique_object_change_id)
+            elif not change_context.defer_object_changes:
                 objectchange = instance.to_objectchange(action)
                 if objectchange is not None:
                     objectchange.user = user
@@ -233,6 +235,9 @@ def _handle_deleted_object(sender, instance, **kwargs):
         unique_object_change_id = f"{changed_object_type.pk}__{changed_object_id}__{user.pk}"
         save_new_objectchange = True
 
+        # Create any ObjectChange still queued for this object until the transaction commits, while it still exists
+        change_context.create_queued_object_change(unique_object_change_id)
+
         # if a change already exists for this change_id, user, and object, update it instead of creating a new one
         # except in the case that the object was created and deleted in the same change_id
         # we don't want to create a delete change for an object that never existed
@@ -439,6 +444,322 @@ post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
 
 
+# Mapping of {content_type_pk: set(object_pks)} of candidate members that still need to be re-evaluated
+dynamic_group_pending_member_updates = contextvars.ContextVar("dynamic_group_pending_member_updates", default=None)
+
+
+def _queue_dynamic_group_member_updates(model, object_ids):
+    """Queue the given objects for re-evaluation against Dynamic Groups once the current transaction commits."""
+    if not object_ids or not getattr(model, "is_dynamic_group_associable_model", False):
+        return
+
+    pending = dynamic_group_pending_member_updates.get()
+    if pending is None:
+        pending = {}
+        dynamic_group_pending_member_updates.set(pending)
+    content_type = ContentType.objects.get_for_model(model)
+    pending.setdefault(content_type.pk, set()).update(object_ids)
+
+    # The updates for an entire transaction are batched together, and if the transaction is rolled back, any stale
+    # entries are simply re-evaluated (harmlessly) along with the next successfully committed batch.
+    dynamic_group_member_updates_on_commit.register()
+
+
+def _dispatch_dynamic_group_member_updates():
+    """Enqueue a background task per content-type to re-evaluate the queued candidate members."""
+    from nautobot.extras.tasks import update_dynamic_group_cached_members_for_objects
+
+    pending = dynamic_group_pending_member_updates.get()
+    if not pending:
+        return
+    dynamic_group_pending_member_updates.set(None)
+
+    for content_type_pk, object_ids in pending.items():
+        update_dynamic_group_cached_members_for_objects.delay(content_type_pk, [str(pk) for pk in object_ids])
+
+
+dynamic_group_member_updates_on_commit = OnCommitCallback(
+    "dynamic_group_member_updates", _dispatch_dynamic_group_member_updates
+)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def dynamic_group_queue_member_update(sender, instance, raw=False, **kwargs):
+    """
+    When a Dynamic Group candidate object is created, updated, or deleted, queue it for membership re-evaluation.
+
+    Only takes effect if `settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` is set.
+    """
+    if raw or not settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED:
+        return
+    _queue_dynamic_group_member_updates(sender, [instance.pk])
+
+
+@receiver(m2m_changed)
+def dynamic_group_queue_member_update_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    When a Dynamic Group candidate object's many-to-many relations (e.g. tags) change, queue it for re-evaluation.
+
+    Only takes effect if `settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED` is set.
+    """
+    if not settings.DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED:
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        # e.g. `tag.devices.add(...)` - the candidate members are the objects in `pk_set`
+        if pk_set:
+            _queue_dynamic_group_member_updates(model, pk_set)
+    else:
+        _queue_dynamic_group_member_updates(type(instance), [instance.pk])
+
+
+#
+# Config context scope index
+#
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def config_context_index_invalidate(sender, instance, signal, **kwargs):
+    """
+    Invalidate the ConfigContext scope index when a ConfigContext is created, updated, or deleted, when a Location or
+    TenantGroup is created or updated (which may change the tree of scopes), or when any object that ConfigContexts can
+    be scoped to is deleted.
+    """
+    if (
+        isinstance(instance, ConfigContext)
+        or sender._meta.label_lower in (SCOPE_FIELDS["locations"], SCOPE_FIELDS["tenant_groups"])
+        or (signal is post_delete and sender._meta.label_lower in SCOPE_FIELDS.values())
+    ):
+        config_context_index_cache.queue_invalidation()
+
+
+@receiver(m2m_changed)
+def config_context_index_invalidate_m2m(sender, instance, action, model, **kwargs):
+    """Invalidate the ConfigContext scope index when the scopes of a ConfigContext change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, ConfigContext) or issubclass(model, ConfigContext):
+        config_context_index_cache.queue_invalidation()
+
+
+#
+# Rendered config contexts
+#
+
+
+# Models whose changes can affect which ConfigContexts apply to a Device or VirtualMachine, beyond the object itself
+CONFIG_CONTEXT_SCOPE_MODELS = ("dcim.location", "tenancy.tenantgroup", "tenancy.tenant", "virtualization.cluster")
+
+# {"objects": {content_type_pk: set(object_pks)}, "config_contexts": set(pks), "scopes": {content_type_pk: set(pks)}}
+# of the changes in the current transaction for which RenderedConfigContexts still need to be updated
+rendered_config_context_pending_updates = contextvars.ContextVar(
+    "rendered_config_context_pending_updates", default=None
+)
+
+
+def _queue_rendered_config_context_updates(objects=None, config_context_ids=None, scope_objects=None):
+    """
+    Queue the re-rendering of the config contexts affected by the given changes, once the current transaction commits.
+
+    Args:
+        objects (tuple): (model, object_ids) of changed Devices or VirtualMachines
+        config_context_ids (iterable): PKs of changed ConfigContexts
+        scope_objects (tuple): (model, object_ids) of changed scope objects, such as Locations
+    """
+    pending = rendered_config_context_pending_updates.get()
+    if pending is None:
+        pending = {"objects": {}, "config_contexts": set(), "scopes": {}}
+        rendered_config_context_pending_updates.set(pending)
+    for key, model_object_ids in (("objects", objects), ("scopes", scope_objects)):
+        if model_object_ids is not None:
+            model, object_ids = model_object_ids
+            content_type = ContentType.objects.get_for_model(model)
+            pending[key].setdefault(content_type.pk, set()).update(str(pk) for pk in object_ids)
+    pending["config_contexts"].update(str(pk) for pk in config_context_ids or [])
+
+    rendered_config_context_updates_on_commit.register()
+
+
+def queue_rendered_config_context_updates_for_group_members(model, object_ids):
+    """
+    Queue the re-rendering of the config contexts of the given objects, whose Dynamic Group memberships have changed.
+
+    Also for use by code that changes group memberships in bulk without sending any model signals. Only takes effect if
+    `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` and `settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED` are both set
+    and `model` is a config context model such as Device or VirtualMachine.
+    """
+    if not (settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED and settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED):
+        return
+    if model is not None and issubclass(model, ConfigContextModel):
+        _queue_rendered_config_context_updates(objects=(model, object_ids))
+
+
+def _dispatch_rendered_config_context_updates():
+    """Enqueue a background task to re-render the config contexts affected by the queued changes."""
+    from nautobot.extras.tasks import update_rendered_config_contexts
+
+    pending = rendered_config_context_pending_updates.get()
+    if not pending:
+        return
+    rendered_config_context_pending_updates.set(None)
+
+    # Make sure that the task won't match ConfigContexts using an out-of-date scope index
+    config_context_index_cache.flush_invalidation()
+    update_rendered_config_contexts.delay(
+        objects=[(content_type_pk, list(object_ids)) for content_type_pk, object_ids in pending["objects"].items()],
+        config_context_ids=list(pending["config_contexts"]),
+        scopes=[(content_type_pk, list(object_ids)) for content_type_pk, object_ids in pending["scopes"].items()],
+    )
+
+
+rendered_config_context_updates_on_commit = OnCommitCallback(
+    "rendered_config_context_updates", _dispatch_rendered_config_context_updates
+)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def rendered_config_context_queue_update(sender, instance, raw=False, **kwargs):
+    """
+    When a Device or VirtualMachine, a ConfigContext, or an object that ConfigContexts are scoped to is created,
+    updated, or deleted, queue the affected config contexts for re-rendering.
+
+    Only takes effect if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set.
+    """
+    if raw or not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    if isinstance(instance, ConfigContextModel):
+        _queue_rendered_config_context_updates(objects=(sender, [instance.pk]))
+    elif isinstance(instance, ConfigContext):
+        _queue_rendered_config_context_updates(config_context_ids=[instance.pk])
+    elif isinstance(instance, StaticGroupAssociation):
+        # Dynamic Group membership of a Device or VirtualMachine
+        queue_rendered_config_context_updates_for_group_members(
+            instance.associated_object_type.model_class(), [instance.associated_object_id]
+        )
+    elif sender._meta.label_lower in CONFIG_CONTEXT_SCOPE_MODELS:
+        _queue_rendered_config_context_updates(scope_objects=(sender, [instance.pk]))
+
+
+@receiver(pre_delete, sender=ConfigContext)
+def rendered_config_context_queue_update_pre_delete(sender, instance, **kwargs):
+    """
+    When a ConfigContext is about to be deleted, queue the objects whose rendered config context includes it.
+
+    Only takes effect if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set.
+    """
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    object_ids_by_model = {}
+    for content_type_id, object_id in RenderedConfigContext.objects.filter(config_contexts=instance).values_list(
+        "assigned_object_type_id", "assigned_object_id"
+    ):
+        object_ids_by_model.setdefault(content_type_id, []).append(object_id)
+    for content_type_id, object_ids in object_ids_by_model.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        _queue_rendered_config_context_updates(objects=(model, object_ids))
+
+
+@receiver(m2m_changed)
+def rendered_config_context_queue_update_m2m(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    When the many-to-many relations of a Device or VirtualMachine (e.g. tags) or a ConfigContext (e.g. its locations)
+    change, queue the affected config contexts for re-rendering.
+
+    Only takes effect if `settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED` is set.
+    """
+    if not settings.CONFIG_CONTEXT_MATERIALIZATION_ENABLED:
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, ConfigContextModel):
+        _queue_rendered_config_context_updates(objects=(type(instance), [instance.pk]))
+    elif isinstance(instance, ConfigContext):
+        _queue_rendered_config_context_updates(config_context_ids=[instance.pk])
+    elif reverse and pk_set:
+        # e.g. `tag.devices.add(...)` - the affected objects are the ones in `pk_set`
+        if issubclass(model, ConfigContextModel):
+            _queue_rendered_config_context_updates(objects=(model, pk_set))
+        elif issubclass(model, ConfigContext):
+            _queue_rendered_config_context_updates(config_context_ids=pk_set)
+
+
+#
+# GraphQL saved query results
+#
+
+
+# Set of labels of the models that have changed in the current transaction, for which cached saved query results
+# will be invalidated once the transaction commits
+graphql_saved_query_pending_invalidations = contextvars.ContextVar(
+    "graphql_saved_query_pending_invalidations", default=None
+)
+
+
+def queue_saved_query_results_invalidation(*models):
+    """
+    Queue the invalidation of cached saved query results involving the given models, until the transaction commits.
+
+    Also for use by code that writes to the database in bulk without sending any model signals. Has no effect unless
+    `settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT` is set.
+    """
+    if settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT <= 0:
+        return
+    pending = graphql_saved_query_pending_invalidations.get()
+    if pending is None:
+        pending = set()
+        graphql_saved_query_pending_invalidations.set(pending)
+    pending.update(model._meta.label_lower for model in models if model is not None)
+
+    # Invalidating only after the commit ensures that no result computed from the old data can be cached anew.
+    saved_query_results_invalidation_on_commit.register()
+
+
+def _dispatch_saved_query_results_invalidation():
+    from nautobot.core.graphql import invalidate_saved_query_results
+
+    pending = graphql_saved_query_pending_invalidations.get()
+    if not pending:
+        return
+    graphql_saved_query_pending_invalidations.set(None)
+    invalidate_saved_query_results(pending)
+
+
+saved_query_results_invalidation_on_commit = OnCommitCallback(
+    "saved_query_results_invalidation", _dispatch_saved_query_results_invalidation
+)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def graphql_saved_query_invalidate_results(sender, instance, raw=False, **kwargs):
+    """
+    When an object is created, updated, or deleted, invalidate the cached results of saved queries involving its model.
+
+    Only takes effect if `settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT` is set.
+    """
+    if raw or settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT <= 0:
+        return
+    queue_saved_query_results_invalidation(sender)
+
+
+@receiver(m2m_changed)
+def graphql_saved_query_invalidate_results_m2m(sender, instance, action, model, **kwargs):
+    """
+    When an object's many-to-many relations change, invalidate the cached results of saved queries involving either side.
+
+    Only takes effect if `settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT` is set.
+    """
+    if settings.GRAPHQL_SAVED_QUERY_CACHE_TIMEOUT <= 0:
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    queue_saved_query_results_invalidation(type(instance), model, sender)
+
+
 #
 # Jobs
 #
@@ -502,3 +823,22 @@ def handle_mdt_removed_obj_types(instance, action, pk_set, **kwargs):  # pylint:
 
 
 m2m_changed.connect(handle_mdt_removed_obj_types, sender=MetadataType.content_types.through)
+
+
+#
+# Webhooks
+#
+
+
+@receiver(post_save, sender=Webhook)
+@receiver(post_delete, sender=Webhook)
+def webhook_invalidate_cache(sender, instance, **kwargs):
+    """Invalidate the cache of enabled Webhooks when a Webhook is created, updated, or deleted."""
+    webhook_cache.queue_invalidation()
+
+
+@receiver(m2m_changed, sender=Webhook.content_types.through)
+def webhook_invalidate_cache_m2m(sender, instance, action, **kwargs):
+    """Invalidate the cache of enabled Webhooks when the content types of a Webhook change."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        webhook_cache.queue_invalidation()
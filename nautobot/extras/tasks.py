@@ -1,20 +1,134 @@
+import contextlib
+import http.cookiejar
+import json
 from logging import getLogger
+import threading
+import time
+from urllib.parse import urlsplit
 
+from celery.exceptions import SoftTimeLimitExceeded
+from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 from jinja2.exceptions import TemplateError
+from prometheus_client import Counter, Histogram
 import requests
 
 from nautobot.core.celery import nautobot_task
-from nautobot.extras.choices import CustomFieldTypeChoices, ObjectChangeActionChoices
+from nautobot.core.models.query_functions import JSONRemoveKey, JSONReplaceArrayElement, JSONSetKey
+from nautobot.extras.choices import CustomFieldTypeChoices, DynamicGroupTypeChoices, ObjectChangeActionChoices
 from nautobot.extras.utils import generate_signature
 
 logger = getLogger("nautobot.extras.tasks")
 
 
-@nautobot_task
-def update_custom_field_choice_data(field_id, old_value, new_value, change_context=None):
+# Number of objects whose custom field data is updated by each UPDATE statement of the custom field data tasks below
+CUSTOM_FIELD_DATA_BATCH_SIZE = 1000
+
+# How long to keep the checkpoint of an interrupted custom field data task, for it to be resumed from
+CUSTOM_FIELD_DATA_CHECKPOINT_TIMEOUT = 24 * 60 * 60
+
+
+def _custom_field_data_change_logging(change_context):
+    """Get a context manager enabling change logging with the given (serialized) change context, if any."""
+    # Circular Import
+    from nautobot.extras.context_managers import web_request_context
+
+    if change_context is None:
+        return contextlib.nullcontext()
+    return web_request_context(
+        user=change_context.get("user"),
+        change_id=change_context.get("change_id"),
+        context_detail=change_context.get("context_detail"),
+        context=change_context.get("context"),
+    )
+
+
+def _bulk_update_custom_field_data(task, content_type, filter_q, value):
+    """
+    Update the `_custom_field_data` of all objects of a content type matching `filter_q` in batches of set-based updates.
+
+    Objects are updated in primary key order, one batch per transaction, without calling `save()` or sending any model
+    signals. If change logging is enabled, the ObjectChanges of each batch are created in bulk along with it.
+
+    After each batch the primary key of its last object is checkpointed (in Django's cache) under the ID of the Celery
+    task, so that if the task is interrupted, for example because the worker died or the task's time limit was hit,
+    retrying the same task resumes right after the last completed batch.
+
+    Args:
+        task (Task): The bound Celery task doing the update
+        content_type (ContentType): Content type of the objects to update
+        filter_q (Q): Filter selecting the objects to update
+        value (Expression): New value of `_custom_field_data`, such as a `JSONSetKey()` expression
+
+    Returns:
+        (int): The number of objects updated.
+    """
+    # Circular Import
+    from nautobot.extras.context_managers import deferred_change_logging_for_bulk_operation
+    from nautobot.extras.signals import change_context_state, queue_saved_query_results_invalidation
+
+    model = content_type.model_class()
+    # Tasks called directly, rather than through Celery, have no ID and can't be resumed
+    checkpoint_key = None
+    last_pk = None
+    if task.request.id is not None:
+        checkpoint_key = f"nautobot.extras.tasks.{task.name}.{task.request.id}.{content_type.pk}"
+        last_pk = cache.get(checkpoint_key)
+    queryset = model.objects.filter(filter_q).order_by("pk")
+    if last_pk is not None:
+        logger.info("Resuming update of custom field data of %s after %s", model._meta.verbose_name_plural, last_pk)
+    total = queryset.filter(pk__gt=last_pk).count() if last_pk is not None else queryset.count()
+
+    updated = 0
+    while True:
+        batch = queryset.filter(pk__gt=last_pk) if last_pk is not None else queryset
+        pks = list(batch.values_list("pk", flat=True)[:CUSTOM_FIELD_DATA_BATCH_SIZE])
+        if not pks:
+            break
+        change_context = change_context_state.get()
+        with deferred_change_logging_for_bulk_operation() if change_context is not None else transaction.atomic():
+            model.objects.filter(pk__in=pks).update(_custom_field_data=value)
+            queue_saved_query_results_invalidation(model)
+            if change_context is not None:
+                change_context.add_deferred_object_changes(
+                    model.objects.filter(pk__in=pks), ObjectChangeActionChoices.ACTION_UPDATE
+                )
+        last_pk = pks[-1]
+        if checkpoint_key is not None:
+            cache.set(checkpoint_key, last_pk, timeout=CUSTOM_FIELD_DATA_CHECKPOINT_TIMEOUT)
+        updated += len(pks)
+        logger.info("Updated custom field data of %d of %d %s", updated, total, model._meta.verbose_name_plural)
+
+    if checkpoint_key is not None:
+        cache.delete(checkpoint_key)
+    return updated
+
+
+def _run_custom_field_data_task(task, change_context, updates):
+    """
+    Run the given custom field data updates, retrying the task to resume them if its soft time limit is exceeded.
+
+    Args:
+        task (Task): The bound Celery task doing the updates
+        change_context (dict): Serialized change context to log the changes with, if any
+        updates (list): (content type, filter, value) arguments of each call to `_bulk_update_custom_field_data()`
+    """
+    try:
+        with _custom_field_data_change_logging(change_context):
+            for content_type, filter_q, value in updates:
+                _bulk_update_custom_field_data(task, content_type, filter_q, value)
+    except SoftTimeLimitExceeded as exc:
+        logger.warning("Time limit exceeded while updating custom field data, the task will be resumed")
+        raise task.retry(exc=exc, countdown=0)
+
+
+@nautobot_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=None)
+def update_custom_field_choice_data(self, field_id, old_value, new_value, change_context=None):
     """
     Update the values for a custom field choice used in objects' _custom_field_data for the given field.
 
@@ -23,8 +137,6 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         old_value (str): The existing value of the choice
         new_value (str): The value which will be used as replacement
     """
-    # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -34,56 +146,24 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         return False
 
     if field.type == CustomFieldTypeChoices.TYPE_SELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                        obj._custom_field_data[field.key] = new_value
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                    obj._custom_field_data[field.key] = new_value
-                    obj.save()
-
+        filter_q = Q(**{f"_custom_field_data__{field.key}": old_value})
+        value = JSONSetKey("_custom_field_data", field.key, new_value)
     elif field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                        old_list = obj._custom_field_data[field.key]
-                        new_list = [new_value if e == old_value else e for e in old_list]
-                        obj._custom_field_data[field.key] = new_list
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                    old_list = obj._custom_field_data[field.key]
-                    new_list = [new_value if e == old_value else e for e in old_list]
-                    obj._custom_field_data[field.key] = new_list
-                    obj.save()
-
+        filter_q = Q(**{f"_custom_field_data__{field.key}__contains": old_value})
+        value = JSONReplaceArrayElement("_custom_field_data", field.key, old_value, new_value)
     else:
         logger.error(f"Unknown field type, failing to act on choice data for this field {field.key}.")
         return False
 
+    # Search all field content types for values to update
+    updates = [(ct, filter_q, value) for ct in field.content_types.order_by("pk")]
+    _run_custom_field_data_task(self, change_context, updates)
+
     return True
 
 
-@nautobot_task
-def delete_custom_field_data(field_key, content_type_pk_set, change_context=None):
+@nautobot_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=None)
+def delete_custom_field_data(self, field_key, content_type_pk_set, change_context=None):
     """
     Delete the values for a custom field
 
@@ -91,30 +171,14 @@ def delete_custom_field_data(field_key, content_type_pk_set, change_context=None
         field_key (str): The key of the custom field which is being deleted
         content_type_pk_set (list): List of PKs for content types to act upon
     """
-    # Circular Import
-    from nautobot.extras.context_managers import web_request_context
-
-    with transaction.atomic():
-        for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                        del obj._custom_field_data[field_key]
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                    del obj._custom_field_data[field_key]
-                    obj.save()
+    filter_q = Q(_custom_field_data__has_key=field_key)
+    value = JSONRemoveKey("_custom_field_data", field_key)
+    updates = [(ct, filter_q, value) for ct in ContentType.objects.filter(pk__in=content_type_pk_set).order_by("pk")]
+    _run_custom_field_data_task(self, change_context, updates)
 
 
-@nautobot_task
-def provision_field(field_id, content_type_pk_set, change_context=None):
+@nautobot_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=None)
+def provision_field(self, field_id, content_type_pk_set, change_context=None):
     """
     Provision a new custom field on all relevant content type object instances.
 
@@ -122,8 +186,6 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         field_id (uuid4): The PK of the custom field being provisioned
         content_type_pk_set (list): List of PKs for content types to act upon
     """
-    # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -132,37 +194,174 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         logger.error(f"Custom field with ID {field_id} not found, failing to provision.")
         return False
 
-    with transaction.atomic():
-        for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.all():
-                        obj._custom_field_data.setdefault(field.key, field.default)
-                        obj.save()
-            else:
-                for obj in model.objects.all():
-                    obj._custom_field_data.setdefault(field.key, field.default)
-                    obj.save()
+    # Only objects that don't have a value for the field yet, as with `_custom_field_data.setdefault()`
+    filter_q = ~Q(_custom_field_data__has_key=field.key)
+    value = JSONSetKey("_custom_field_data", field.key, field.default)
+    updates = [(ct, filter_q, value) for ct in ContentType.objects.filter(pk__in=content_type_pk_set).order_by("pk")]
+    _run_custom_field_data_task(self, change_context, updates)
 
     return True
 
 
 @nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+def update_dynamic_group_cached_members_for_objects(content_type_pk, object_ids):
     """
-    Make a POST request to the defined Webhook
+    Re-evaluate the given objects against every non-static DynamicGroup of their content type.
+
+    Args:
+        content_type_pk (int): The PK of the content type of the objects being re-evaluated
+        object_ids (list): List of PKs of objects that have been created, updated, or deleted
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    from nautobot.extras.models import DynamicGroup  # avoiding circular import
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
+    groups = DynamicGroup.objects.filter(content_type_id=content_type_pk).exclude(
+        group_type=DynamicGroupTypeChoices.TYPE_STATIC
+    )
+    for group in groups:
+        try:
+            with transaction.atomic():
+                group.update_cached_members_for_objects(object_ids)
+        except Exception as e:
+            # One broken group definition (e.g. an obsolete filter) shouldn't block updating all of the others
+            logger.error("Failed to update cached members of dynamic group %s: %s", group, e)
+
+    return True
+
+
+def _get_objects_affected_by_scope_change(model, scope_model, scope_ids):
+    """
+    Get the objects of the given ConfigContextModel whose applicable ConfigContexts may depend on the given scope objects.
 
-    context = {
+    For example, moving a Location to a different parent Location may change the contexts applying to the Devices at
+    that Location or any of its descendants, but only if any ConfigContexts are scoped to Locations in the first place.
+    """
+    from nautobot.dcim.models import Location
+    from nautobot.extras.models import ConfigContext
+    from nautobot.tenancy.models import Tenant, TenantGroup
+    from nautobot.virtualization.models import Cluster
+
+    location_field = "location" if model._meta.model_name == "device" else "cluster__location"
+    if scope_model is Location and ConfigContext.objects.filter(locations__isnull=False).exists():
+        location_ids = {
+            descendant.pk
+            for location in Location.objects.filter(pk__in=scope_ids)
+            for descendant in location.descendants(include_self=True)
+        }
+        return model.objects.filter(**{f"{location_field}__in": location_ids})
+    if scope_model is TenantGroup and ConfigContext.objects.filter(tenant_groups__isnull=False).exists():
+        tenant_group_ids = {
+            descendant.pk
+            for tenant_group in TenantGroup.objects.filter(pk__in=scope_ids)
+            for descendant in tenant_group.descendants(include_self=True)
+        }
+        return model.objects.filter(tenant__tenant_group__in=tenant_group_ids)
+    if (
+        scope_model is Tenant
+        and ConfigContext.objects.filter(Q(tenant_groups__isnull=False) | Q(tenants__isnull=False)).exists()
+    ):
+        return model.objects.filter(tenant__in=scope_ids)
+    if (
+        scope_model is Cluster
+        and ConfigContext.objects.filter(
+            Q(clusters__isnull=False) | Q(cluster_groups__isnull=False) | Q(locations__isnull=False)
+        ).exists()
+    ):
+        return model.objects.filter(cluster__in=scope_ids)
+    return model.objects.none()
+
+
+@nautobot_task
+def update_rendered_config_contexts(objects=None, config_context_ids=None, scopes=None):
+    """
+    Re-render and store the config contexts of the Devices and VirtualMachines affected by the given changes.
+
+    Args:
+        objects (list): (content type PK, list of PKs) of Devices and VirtualMachines that have been created, updated,
+            or deleted
+        config_context_ids (list): PKs of ConfigContexts that have been created, updated, or deleted
+        scopes (list): (content type PK, list of PKs) of Locations, TenantGroups, Tenants, and Clusters that have been
+            created, updated, or deleted
+    """
+    from nautobot.extras.models import ConfigContext, ConfigContextModel, RenderedConfigContext
+
+    config_context_models = [model for model in apps.get_models() if issubclass(model, ConfigContextModel)]
+    object_ids_by_model = {model: set() for model in config_context_models}
+
+    for content_type_pk, object_ids in objects or []:
+        model = ContentType.objects.get_for_id(content_type_pk).model_class()
+        object_ids_by_model[model].update(str(pk) for pk in object_ids)
+
+    if config_context_ids:
+        # Objects that the changed contexts applied to before the change...
+        for content_type_pk, object_id in (
+            RenderedConfigContext.objects.filter(config_contexts__in=config_context_ids)
+            .values_list("assigned_object_type_id", "assigned_object_id")
+            .distinct()
+        ):
+            object_ids_by_model[ContentType.objects.get_for_id(content_type_pk).model_class()].add(str(object_id))
+        # ...and objects that they apply to after the change
+        for config_context in ConfigContext.objects.filter(pk__in=config_context_ids):
+            for model in config_context_models:
+                object_ids_by_model[model].update(
+                    str(pk) for pk in config_context.get_matching_objects(model).values_list("pk", flat=True)
+                )
+
+    for content_type_pk, scope_ids in scopes or []:
+        scope_model = ContentType.objects.get_for_id(content_type_pk).model_class()
+        for model in config_context_models:
+            object_ids_by_model[model].update(
+                str(pk)
+                for pk in _get_objects_affected_by_scope_change(model, scope_model, scope_ids).values_list(
+                    "pk", flat=True
+                )
+            )
+
+    for model, object_ids in object_ids_by_model.items():
+        if object_ids:
+            count = RenderedConfigContext.objects.update_for_objects(model, object_ids)
+            logger.debug("Rendered the config contexts of %d %s", count, model._meta.verbose_name_plural)
+
+    return True
+
+
+# Metrics of the HTTP requests made by webhooks, and of the number of changes that they deliver
+WEBHOOK_DELIVERY_METRIC = Histogram(
+    "nautobot_webhook_delivery_duration_seconds", "Duration of Nautobot webhook HTTP requests.", ["webhook", "status"]
+)
+WEBHOOK_CHANGES_METRIC = Counter(
+    "nautobot_webhook_changes_delivered_total",
+    "Number of changes delivered by Nautobot webhooks.",
+    ["webhook", "status"],
+)
+
+# Number of times that the delivery of a batch of changes is attempted before the batch is discarded
+WEBHOOK_BATCH_MAX_ATTEMPTS = 5
+
+# Shared requests.Session per target host (and SSL verification setting), so that connections are kept alive and
+# reused across webhook deliveries made by this process
+_webhook_sessions = {}
+_webhook_sessions_lock = threading.Lock()
+
+
+def get_webhook_session(webhook):
+    """Get the shared HTTP session of this process for delivering requests of the given Webhook."""
+    url = urlsplit(webhook.payload_url)
+    verify = webhook.ca_file_path or webhook.ssl_verification
+    key = (url.scheme, url.netloc, verify)
+    with _webhook_sessions_lock:
+        session = _webhook_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.verify = verify
+            # Only the connections are shared, not any cookies set by the responses to earlier (other webhooks') requests
+            session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            _webhook_sessions[key] = session
+    return session
+
+
+def get_webhook_change_context(data, model_name, event, timestamp, username, request_id, snapshots):
+    """Get the context describing a single change, with which a Webhook renders its headers and body."""
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -172,6 +371,16 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "snapshots": snapshots,
     }
 
+
+def send_webhook_request(webhook, context, change_count=1):
+    """
+    Render and send the HTTP request of a Webhook with the given context, using the shared session for its host.
+
+    Args:
+        webhook (Webhook): The webhook to send the request of
+        context (dict): Context to render the headers and body of the request with
+        change_count (int): Number of changes delivered by the request, for metrics
+    """
     # Build the headers for the HTTP request
     headers = {
         "Content-Type": webhook.http_content_type,
@@ -196,7 +405,12 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "headers": headers,
         "data": body.encode("utf8"),
     }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
+    if "changes" in context:
+        logger.info("Sending %s request to %s (%d changes)", params["method"], params["url"], change_count)
+    else:
+        logger.info(
+            "Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"]
+        )
     logger.debug("%s", params)
     try:
         prepared_request = requests.Request(**params).prepare()
@@ -209,11 +423,17 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
 
     # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
+    session = get_webhook_session(webhook)
+    start_time = time.monotonic()
+    try:
         response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    except requests.exceptions.RequestException:
+        WEBHOOK_DELIVERY_METRIC.labels(webhook.name, "failure").observe(time.monotonic() - start_time)
+        WEBHOOK_CHANGES_METRIC.labels(webhook.name, "failure").inc(change_count)
+        raise
+    status = "success" if response.ok else "failure"
+    WEBHOOK_DELIVERY_METRIC.labels(webhook.name, status).observe(time.monotonic() - start_time)
+    WEBHOOK_CHANGES_METRIC.labels(webhook.name, status).inc(change_count)
 
     if response.ok:
         logger.info("Request succeeded; response status %s", response.status_code)
@@ -223,3 +443,88 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         raise requests.exceptions.RequestException(
             f"Status {response.status_code} returned with content '{response.content}', webhook FAILED to process."
         )
+
+
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id, snapshots):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = get_webhook_change_context(data, model_name, event, timestamp, username, request_id, snapshots)
+    return send_webhook_request(webhook, context)
+
+
+@nautobot_task
+def process_webhook_batch(webhook_pk):
+    """
+    Send the pending changes of a batching Webhook, with one request per `batch_size` changes.
+
+    The context of each request has a `changes` list of the contexts of the individual changes, and a `timestamp`.
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+    from nautobot.extras.webhooks import get_webhook_batch_keys
+
+    changes_key, scheduled_key = get_webhook_batch_keys(webhook_pk)
+    # Number of failed delivery attempts of the batch at the head of the list of pending changes
+    attempts_key = f"{changes_key}.attempts"
+    client = cache.client.get_client(write=True)
+    try:
+        webhook = Webhook.objects.get(pk=webhook_pk)
+    except Webhook.DoesNotExist:
+        client.delete(changes_key, attempts_key)
+        cache.delete(scheduled_key)
+        return "Webhook no longer exists, pending changes discarded."
+
+    lock = cache.lock(f"{scheduled_key}.lock", timeout=settings.REDIS_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        # Another worker is already sending the pending changes
+        return "Pending changes are already being processed."
+
+    results = []
+    try:
+        while True:
+            with client.pipeline() as pipe:
+                pipe.lrange(changes_key, 0, webhook.batch_size - 1)
+                pipe.ltrim(changes_key, webhook.batch_size, -1)
+                changes, _ = pipe.execute()
+            if not changes:
+                break
+            try:
+                context = {
+                    "timestamp": str(timezone.now()),
+                    "changes": [get_webhook_change_context(*json.loads(change)) for change in changes],
+                }
+                results.append(send_webhook_request(webhook, context, change_count=len(changes)))
+            except requests.exceptions.RequestException:
+                attempts = client.incr(attempts_key)
+                if attempts < WEBHOOK_BATCH_MAX_ATTEMPTS:
+                    # Put the undelivered changes back at the head of the list, in their original order, to be retried
+                    client.lpush(changes_key, *reversed(changes))
+                else:
+                    client.delete(attempts_key)
+                    logger.error(
+                        "Discarding %d changes for webhook %s after %d failed delivery attempts: %s",
+                        len(changes),
+                        webhook,
+                        attempts,
+                        changes,
+                    )
+                raise
+            except Exception:
+                # Retrying can't fix a request that failed to render, so the changes are discarded right away
+                client.delete(attempts_key)
+                logger.error("Discarding %d changes for webhook %s: %s", len(changes), webhook, changes)
+                raise
+            client.delete(attempts_key)
+    finally:
+        cache.delete(scheduled_key)
+        lock.release()
+        # Schedule the delivery of any changes that are left over, whether they arrived after the last batch was taken
+        # or couldn't be delivered
+        if client.llen(changes_key) and cache.add(scheduled_key, True, timeout=webhook.batch_interval + 60):
+            process_webhook_batch.apply_async(args=[webhook_pk], countdown=webhook.batch_interval)
+
+    return " ".join(results)
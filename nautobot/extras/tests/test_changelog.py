@@ -1,4 +1,5 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test import override_settings
 from django.urls import reverse
 from django.utils.html import escape
@@ -593,3 +594,71 @@ class ObjectChangeModelTest(TestCase):  # TODO: change to BaseModelTestCase once
             self.assertIsNone(snapshots["postchange"])
             self.assertEqual(snapshots["differences"]["removed"], oc_with_object_data_v2.object_data_v2)
             self.assertIsNone(snapshots["differences"]["added"])
+
+    @override_settings(CHANGELOG_DEFER_SERIALIZATION=True)
+    def test_defer_serialization(self):
+        """Objects changed repeatedly in a transaction are serialized once, from their state when it commits."""
+        location_type = LocationType.objects.get(name="Campus")
+        tag = Tag.objects.get_for_model(Location).first()
+        with context_managers.web_request_context(self.user):
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    location = Location(
+                        name="testdeferredlocation", status=self.location_status, location_type=location_type
+                    )
+                    location.validated_save()
+                    location.tags.add(tag)
+                    location.description = "changed description"
+                    location.validated_save()
+                    self.assertFalse(get_changes_for_model(location).exists())
+
+        self.assertEqual(get_changes_for_model(location).count(), 1)
+        oc = get_changes_for_model(location).first()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.user, self.user)
+        self.assertEqual(oc.object_data["description"], "changed description")
+        self.assertEqual(oc.object_data["tags"], [tag.name])
+        self.assertEqual(oc.object_data_v2["description"], "changed description")
+
+        with self.subTest("changes in a rolled-back savepoint aren't logged"):
+            with context_managers.web_request_context(self.user):
+                with self.captureOnCommitCallbacks(execute=True):
+                    with transaction.atomic():
+                        try:
+                            with transaction.atomic():
+                                location.description = "rolled back description"
+                                location.validated_save()
+                                raise RuntimeError
+                        except RuntimeError:
+                            pass
+            self.assertEqual(get_changes_for_model(location).count(), 1)
+
+        with self.subTest("queued changes are logged before the object is deleted"):
+            location_pk = location.pk
+            with context_managers.web_request_context(self.user):
+                with self.captureOnCommitCallbacks(execute=True):
+                    with transaction.atomic():
+                        location.description = "final description"
+                        location.validated_save()
+                        location.delete()
+            object_changes = get_changes_for_model(Location).filter(changed_object_id=location_pk)
+            self.assertEqual(object_changes.count(), 2)
+            self.assertEqual(object_changes.first().action, ObjectChangeActionChoices.ACTION_DELETE)
+            self.assertEqual(object_changes.first().object_data_v2["description"], "final description")
+
+    @override_settings(CHANGELOG_SKIP_OBJECT_DATA=True)
+    def test_skip_object_data(self):
+        location_type = LocationType.objects.get(name="Campus")
+        with context_managers.web_request_context(self.user):
+            location = Location(name="testskiplocation", status=self.location_status, location_type=location_type)
+            location.validated_save()
+        with context_managers.web_request_context(self.user):
+            location.description = "changed description"
+            location.validated_save()
+
+        oc = get_changes_for_model(location).first()
+        self.assertEqual(oc.object_data, {})
+        self.assertEqual(oc.object_data_v2["description"], "changed description")
+        snapshots = oc.get_snapshots()
+        self.assertEqual(snapshots["differences"]["removed"], {"description": ""})
+        self.assertEqual(snapshots["differences"]["added"], {"description": "changed description"})
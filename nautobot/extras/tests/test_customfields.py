@@ -3,6 +3,7 @@ import logging
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError
 from django.forms import ChoiceField, IntegerField, NumberInput
@@ -24,6 +25,7 @@ from nautobot.dcim.tables import LocationTable
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
 from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import ComputedField, CustomField, CustomFieldChoice, Status
+from nautobot.extras.tasks import provision_field
 from nautobot.users.models import ObjectPermission
 from nautobot.virtualization.models import VirtualMachine
 
@@ -2131,6 +2133,63 @@ class CustomFieldBackgroundTasks(TransactionTestCase):
         self.assertEqual(oc_list[0].change_context_detail, "update custom field choice data")
         self.assertEqual(oc_list[0].user, self.user)
 
+    def test_update_custom_field_choice_data_task_multiselect(self):
+        obj_type = ContentType.objects.get_for_model(Location)
+        cf = CustomField(label="CF1", type=CustomFieldTypeChoices.TYPE_MULTISELECT)
+        cf.save()
+        cf.content_types.set([obj_type])
+        choice = CustomFieldChoice(custom_field=cf, value="Foo")
+        choice.save()
+        CustomFieldChoice.objects.create(custom_field=cf, value="Bar")
+        location_type = LocationType.objects.create(name="Root Type 4")
+        location_status = Status.objects.get_for_model(Location).first()
+        location = Location.objects.create(
+            name="Location 1",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": ["Bar", "Foo"]},
+        )
+        other_location = Location.objects.create(
+            name="Location 2",
+            location_type=location_type,
+            status=location_status,
+            _custom_field_data={"cf1": ["Bar"]},
+        )
+
+        choice.value = "FizzBuzz"
+        choice.save()
+
+        location.refresh_from_db()
+        other_location.refresh_from_db()
+        self.assertEqual(location.cf["cf1"], ["Bar", "FizzBuzz"])
+        self.assertEqual(other_location.cf["cf1"], ["Bar"])
+
+    def test_provision_field_task_resume(self):
+        """A retried task resumes after the last object checkpointed by its earlier attempt."""
+        location_type = LocationType.objects.create(name="Root Type 5")
+        location_status = Status.objects.get_for_model(Location).first()
+        locations = sorted(
+            (
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=location_status)
+                for i in range(3)
+            ),
+            key=lambda location: str(location.pk),
+        )
+        cf = CustomField(label="CF1", type=CustomFieldTypeChoices.TYPE_TEXT, default="Foo")
+        cf.save()
+        obj_type = ContentType.objects.get_for_model(Location)
+
+        checkpoint_key = f"nautobot.extras.tasks.{provision_field.name}.resumed-task.{obj_type.pk}"
+        cache.set(checkpoint_key, locations[0].pk)
+        provision_field.apply(args=[cf.pk, [obj_type.pk]], task_id="resumed-task")
+
+        self.assertIsNone(cache.get(checkpoint_key))
+        for location in locations:
+            location.refresh_from_db()
+        self.assertNotIn("cf1", locations[0]._custom_field_data)
+        self.assertEqual(locations[1].cf["cf1"], "Foo")
+        self.assertEqual(locations[2].cf["cf1"], "Foo")
+
 
 class CustomFieldTableTest(TestCase):
     """
@@ -1,8 +1,10 @@
 import random
 
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError, QuerySet
+from django.test import override_settings
 from django.urls import reverse
 
 from nautobot.core.forms.fields import MultiMatchModelMultipleChoiceField, MultiValueCharField
@@ -27,16 +29,20 @@ from nautobot.extras.choices import (
     CustomFieldTypeChoices,
     DynamicGroupOperatorChoices,
     DynamicGroupTypeChoices,
+    ObjectChangeActionChoices,
     RelationshipTypeChoices,
 )
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.filters import DynamicGroupFilterSet, DynamicGroupMembershipFilterSet
 from nautobot.extras.models import (
     CustomField,
     DynamicGroup,
     DynamicGroupMembership,
+    ObjectChange,
     Relationship,
     RelationshipAssociation,
     Role,
+    StaticGroupAssociation,
     Status,
     Tag,
 )
@@ -45,6 +51,8 @@ from nautobot.ipam.querysets import PrefixQuerySet
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import VirtualMachine
 
+User = get_user_model()
+
 
 class DynamicGroupTestBase(TestCase):
     @classmethod
@@ -329,6 +337,37 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertIsInstance(Prefix.objects.filter(ip_version=6).first().dynamic_groups, QuerySet)
         self.assertIn(sg, list(Prefix.objects.filter(ip_version=6).first().dynamic_groups))
 
+    def test_static_member_operations_change_logging(self):
+        """Test that bulk addition and removal of static group members are change-logged."""
+        user = User.objects.create_user(username="dynamicgroupuser")
+        sg = DynamicGroup.objects.create(
+            name="Some Prefixes",
+            content_type=ContentType.objects.get_for_model(Prefix),
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        prefixes = Prefix.objects.filter(ip_version=4)
+        sga_ct = ContentType.objects.get_for_model(StaticGroupAssociation)
+
+        with web_request_context(user):
+            sg.add_members(prefixes)
+        self.assertQuerysetEqualAndNotEmpty(sg.members, prefixes)
+        changes = ObjectChange.objects.filter(
+            changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_CREATE, user=user
+        )
+        self.assertEqual(changes.count(), prefixes.count())
+        self.assertEqual(
+            set(changes.values_list("changed_object_id", flat=True)),
+            set(sg.static_group_associations.values_list("pk", flat=True)),
+        )
+
+        with web_request_context(user):
+            sg.members = list(prefixes[:1])
+        self.assertQuerysetEqualAndNotEmpty(sg.members, prefixes[:1])
+        changes = ObjectChange.objects.filter(
+            changed_object_type=sga_ct, action=ObjectChangeActionChoices.ACTION_DELETE, user=user
+        )
+        self.assertEqual(changes.count(), prefixes.count() - 1)
+
     # TODO negative test that members=, add_members(), remove_members() raise appropriate errors for non-static groups
 
     def test_members_fail_closed(self):
@@ -1037,6 +1076,83 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         self.assertEqual(sorted(list(group.members)), sorted(list(updated_members)))
         self.assertEqual(sorted(list(group.members)), sorted(list(group.members_cached)))
 
+    def test_update_cached_members_for_objects(self):
+        """Test that `update_cached_members_for_objects()` only re-evaluates the given objects."""
+        group = self.first_child
+        device1 = self.devices[0]
+        device2 = self.devices[1]
+        self.assertIn(device1, group.members)
+        self.assertNotIn(device2, group.members)
+
+        # Move device1 out of and device2 into the group's filter, without refreshing the entire group
+        Device.objects.filter(pk=device1.pk).update(location=self.locations[1])
+        Device.objects.filter(pk=device2.pk).update(location=self.locations[0])
+
+        added, removed = group.update_cached_members_for_objects([device2.pk])
+        self.assertEqual(added, {device2.pk})
+        self.assertEqual(removed, set())
+        self.assertIn(device1, group.members)  # not yet re-evaluated
+        self.assertIn(device2, group.members)
+
+        added, removed = group.update_cached_members_for_objects([device1.pk, device2.pk])
+        self.assertEqual(added, set())
+        self.assertEqual(removed, {device1.pk})
+        self.assertNotIn(device1, group.members)
+        self.assertIn(device2, group.members)
+
+        # Set-based groups are evaluated against their full (nested) definition
+        self.parent.update_cached_members()
+        self.assertQuerysetEqual(self.parent.members, self.parent._get_group_queryset(), ordered=False)
+        Device.objects.filter(pk=device2.pk).update(location=self.locations[1])
+        self.parent.update_cached_members_for_objects([device2.pk])
+        self.assertQuerysetEqual(self.parent.members, self.parent._get_group_queryset(), ordered=False)
+
+        # Static groups are left untouched
+        static_group = DynamicGroup.objects.create(
+            name="Static Devices",
+            content_type=self.device_ct,
+            group_type=DynamicGroupTypeChoices.TYPE_STATIC,
+        )
+        self.assertEqual(static_group.update_cached_members_for_objects([device1.pk]), (set(), set()))
+        self.assertFalse(static_group.members.exists())
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=True)
+    def test_incremental_member_updates(self):
+        """Test that saving and deleting candidate objects incrementally updates the cached members."""
+        group = self.first_child
+        device = self.devices[1]
+        self.assertNotIn(device, group.members)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[0]
+            device.save()
+        self.assertIn(device, group.members)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[1]
+            device.save()
+        self.assertNotIn(device, group.members)
+
+        device = self.devices[0]
+        self.assertIn(device, group.members)
+        device_pk = device.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            device.delete()
+        self.assertFalse(
+            group.static_group_associations(manager="all_objects").filter(associated_object_id=device_pk).exists()
+        )
+
+    @override_settings(DYNAMIC_GROUPS_INCREMENTAL_UPDATES_ENABLED=False)
+    def test_incremental_member_updates_disabled(self):
+        """Test that saving candidate objects doesn't update the cached members unless enabled."""
+        group = self.first_child
+        device = self.devices[1]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[0]
+            device.save()
+        self.assertNotIn(device, group.members)
+
 
 class DynamicGroupMembershipModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mixin?
     """DynamicGroupMembership model tests."""
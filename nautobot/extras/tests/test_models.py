@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta, timezone
+import logging
 import os
 import tempfile
+import threading
 from unittest import expectedFailure, mock
 import uuid
 import warnings
@@ -18,6 +20,7 @@ from django.utils.timezone import now
 from jinja2.exceptions import TemplateAssertionError, TemplateSyntaxError
 
 from nautobot.circuits.models import CircuitType
+from nautobot.core.celery.log import flush_job_log_entries, NautobotDatabaseHandler
 from nautobot.core.choices import ColorChoices
 from nautobot.core.testing import TestCase
 from nautobot.core.testing.models import ModelTestCases
@@ -38,6 +41,7 @@ from nautobot.extras.choices import (
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
 )
+from nautobot.extras.config_context_index import get_config_context_index, get_object_scope_values
 from nautobot.extras.constants import (
     JOB_LOG_MAX_ABSOLUTE_URL_LENGTH,
     JOB_LOG_MAX_GROUPING_LENGTH,
@@ -63,6 +67,7 @@ from nautobot.extras.models import (
     MetadataType,
     ObjectChange,
     ObjectMetadata,
+    RenderedConfigContext,
     Role,
     SavedView,
     Secret,
@@ -77,6 +82,7 @@ from nautobot.extras.models import (
 from nautobot.extras.models.statuses import StatusModel
 from nautobot.extras.registry import registry
 from nautobot.extras.secrets.exceptions import SecretParametersError, SecretProviderError, SecretValueNotFoundError
+from nautobot.extras.tasks import update_rendered_config_contexts
 from nautobot.ipam.models import IPAddress
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import (
@@ -607,6 +613,140 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertIn("dynamic context 2", device2.get_config_context().values())
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
+    def test_get_matching_objects(self):
+        """Verify that get_matching_objects() is the inverse of get_for_object()."""
+        location_context = ConfigContext.objects.create(name="location", weight=100, data={"location": 1})
+        location_context.locations.add(self.root_location)
+        role_context = ConfigContext.objects.create(name="location and role", weight=100, data={"role": 1})
+        role_context.locations.add(self.location)
+        role_context.roles.add(self.devicerole)
+        device_type_context = ConfigContext.objects.create(name="device type", weight=100, data={"device_type": 1})
+        device_type_context.device_types.add(self.devicetype)
+        tag_context = ConfigContext.objects.create(name="tag", weight=100, data={"tag": 1})
+        tag_context.tags.add(self.tag2)
+        inactive_context = ConfigContext.objects.create(name="inactive", weight=100, data={"x": 1}, is_active=False)
+
+        device = Device.objects.create(
+            name="Device 3",
+            location=self.parent_location,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+        )
+        cluster_type = ClusterType.objects.create(name="Cluster Type 1")
+        cluster = Cluster.objects.create(name="Cluster", cluster_type=cluster_type, location=self.location)
+        vm_status = Status.objects.get_for_model(VirtualMachine).first()
+        virtual_machine = VirtualMachine.objects.create(
+            name="VM 1", cluster=cluster, role=Role.objects.get_for_model(VirtualMachine).first(), status=vm_status
+        )
+
+        for config_context in ConfigContext.objects.all():
+            for obj in [self.device, device, virtual_machine]:
+                with self.subTest(config_context=config_context.name, obj=obj.name):
+                    self.assertEqual(
+                        config_context.get_matching_objects(type(obj)).filter(pk=obj.pk).exists(),
+                        ConfigContext.objects.get_for_object(obj).filter(pk=config_context.pk).exists(),
+                    )
+        self.assertFalse(inactive_context.get_matching_objects(Device).exists())
+        self.assertFalse(device_type_context.get_matching_objects(VirtualMachine).exists())
+
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True)
+    def test_rendered_config_context(self):
+        """Verify that rendered config contexts are stored, used, and kept up to date."""
+        location_context = ConfigContext.objects.create(name="location", weight=200, data={"b": 999})
+        location_context.locations.add(self.parent_location)
+        device_content_type = ContentType.objects.get_for_model(Device)
+
+        self.assertEqual(RenderedConfigContext.objects.update_for_objects(Device, [self.device.pk]), 1)
+        rendered = RenderedConfigContext.objects.get(
+            assigned_object_type=device_content_type, assigned_object_id=self.device.pk
+        )
+        self.assertEqual(rendered.data, {"a": 123, "b": 999, "c": 777})
+        self.assertEqual(rendered.data, self.device.get_config_context())
+        self.assertEqual(
+            set(rendered.config_contexts.values_list("name", flat=True)), {"context 1", location_context.name}
+        )
+
+        annotated_device = Device.objects.annotate_rendered_config_context().get(pk=self.device.pk)
+        self.assertEqual(annotated_device.rendered_config_context, rendered.data)
+        self.assertEqual(annotated_device.get_config_context(), rendered.data)
+
+        # Changes to a ConfigContext are propagated to the objects it applied to before and after the change
+        ConfigContext.objects.filter(pk=location_context.pk).update(data={"b": 1000})
+        update_rendered_config_contexts(config_context_ids=[str(location_context.pk)])
+        rendered.refresh_from_db()
+        self.assertEqual(rendered.data["b"], 1000)
+        location_context.locations.clear()
+        location_context.tags.add(self.tag)
+        update_rendered_config_contexts(config_context_ids=[str(location_context.pk)])
+        rendered.refresh_from_db()
+        self.assertEqual(rendered.data, {"a": 123, "b": 456, "c": 777})
+
+        # Stored data of objects that no longer exist is deleted
+        device_pk = self.device.pk
+        self.device.delete()
+        self.assertEqual(RenderedConfigContext.objects.update_for_objects(Device, [device_pk]), 0)
+        self.assertFalse(
+            RenderedConfigContext.objects.filter(
+                assigned_object_type=device_content_type, assigned_object_id=device_pk
+            ).exists()
+        )
+
+    @override_settings(CONFIG_CONTEXT_MATERIALIZATION_ENABLED=True, CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    @mock.patch("nautobot.extras.tasks.update_rendered_config_contexts.delay")
+    def test_rendered_config_context_dynamic_group_members(self, mock_delay):
+        """Verify that refreshing the cached members of a Dynamic Group queues the new members for re-rendering."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dynamic_groups.update_cached_members()
+        mock_delay.assert_called_once()
+        self.assertIn(
+            (ContentType.objects.get_for_model(Device).pk, [str(self.device.pk)]),
+            mock_delay.call_args.kwargs["objects"],
+        )
+
+    def test_scope_index_same_as_annotation(self):
+        """Verify that matching config contexts with the ConfigContextScopeIndex is consistent with the annotation."""
+        location_context = ConfigContext.objects.create(name="root location", weight=100, data={"location": 1})
+        location_context.locations.add(self.root_location)
+        tenant_group_context = ConfigContext.objects.create(name="tenant group", weight=150, data={"tenant_group": 1})
+        tenant_group_context.tenant_groups.add(self.parent_tenantgroup)
+        tag_context = ConfigContext.objects.create(name="tag", weight=200, data={"tag": 1, "location": 2})
+        tag_context.tags.add(self.tag)
+        role_context = ConfigContext.objects.create(name="role and platform", weight=300, data={"role": 1})
+        role_context.roles.add(self.devicerole)
+        role_context.platforms.add(self.platform)
+        ConfigContext.objects.create(name="inactive", weight=400, data={"location": 3}, is_active=False)
+
+        device = Device.objects.create(
+            name="Device 2",
+            location=self.location,
+            tenant=self.child_tenant,
+            platform=self.platform,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+        )
+        device.tags.add(self.tag)
+
+        index = get_config_context_index()
+        # ConfigContexts were changed in the current transaction, so a private index is built rather than a cached one
+        self.assertIsNot(index, get_config_context_index())
+        self.assertEqual(
+            index.get_config_context_ids(get_object_scope_values(device)),
+            list(ConfigContext.objects.get_for_object(device).values_list("pk", flat=True)),
+        )
+
+        devices = Device.objects.filter(pk__in=[self.device.pk, device.pk])
+        annotated = {obj.pk: obj.get_config_context() for obj in devices.annotate_config_context_data()}
+        prefetched_devices = list(devices.prefetch_config_context_data())
+        with self.assertNumQueries(0):
+            prefetched = {obj.pk: obj.get_config_context() for obj in prefetched_devices}
+        self.assertEqual(prefetched, annotated)
+        self.assertEqual(
+            prefetched[device.pk], {"a": 123, "b": 456, "c": 777, "location": 2, "tag": 1, "tenant_group": 1, "role": 1}
+        )
+        self.assertEqual(prefetched[self.device.pk], {"a": 123, "b": 456, "c": 777, "location": 1})
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
@@ -1329,6 +1469,95 @@ class ObjectChangeTest(ModelTestCases.BaseModelTestCase):
         self.assertEqual("a" * JOB_LOG_MAX_LOG_OBJECT_LENGTH, log.log_object)
         self.assertEqual("", log.absolute_url)
 
+    def test_bulk_log(self):
+        """Test that log entries can be built and then saved in bulk."""
+        job_result = JobResult.objects.create(
+            name="irrelevant",
+            user=None,
+            status=JobResultStatusChoices.STATUS_STARTED,
+        )
+        job_result.use_job_logs_db = False
+
+        log_entries = [job_result.build_log_entry(f"Message {i}", grouping="bulk") for i in range(5)]
+        self.assertFalse(JobLogEntry.objects.filter(job_result=job_result).exists())
+        job_result.bulk_log(log_entries)
+        self.assertEqual(
+            sorted(
+                JobLogEntry.objects.filter(job_result=job_result, grouping="bulk").values_list("message", flat=True)
+            ),
+            [f"Message {i}" for i in range(5)],
+        )
+
+    @mock.patch("nautobot.extras.models.jobs.JOB_LOGS", None)
+    def test_database_log_handler_buffering(self):
+        """Test that the NautobotDatabaseHandler buffers log entries and writes them in bulk."""
+        job_result = JobResult.objects.create(
+            name="irrelevant",
+            user=None,
+            status=JobResultStatusChoices.STATUS_STARTED,
+        )
+        handler = NautobotDatabaseHandler(flush_size=3, flush_interval=3600)
+
+        def log(message):
+            record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None, func="test")
+            record.task_id = str(job_result.pk)
+            handler.handle(record)
+
+        log("one")
+        log("two")
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 0)
+        log("three")
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 3)
+        log("four")
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 3)
+        flush_job_log_entries(task_id=str(job_result.pk), discard=True)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 4)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result, grouping="test").count(), 4)
+
+    def test_database_log_handler_flushes_on_timer(self):
+        """Test that the NautobotDatabaseHandler writes buffered log entries once its flush interval has elapsed."""
+        job_result = JobResult.objects.create(
+            name="irrelevant",
+            user=None,
+            status=JobResultStatusChoices.STATUS_STARTED,
+        )
+        handler = NautobotDatabaseHandler(flush_size=100, flush_interval=0.1)
+        flushed = threading.Event()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "one", None, None, func="test")
+        record.task_id = str(job_result.pk)
+
+        # The entries are written from a separate thread, which can't see the JobResult of this test's transaction
+        with mock.patch.object(JobResult, "bulk_log", side_effect=lambda log_entries: flushed.set()) as mock_bulk_log:
+            handler.handle(record)
+            mock_bulk_log.assert_not_called()
+            self.assertTrue(flushed.wait(timeout=10))
+        self.assertEqual([entry.message for entry in mock_bulk_log.call_args.args[0]], ["one"])
+        handler.flush(discard=True)
+
+    @mock.patch("nautobot.extras.models.jobs.JOB_LOGS", None)
+    def test_database_log_handler_flushes_warnings(self):
+        """Test that the NautobotDatabaseHandler writes buffered log entries as soon as a warning is logged."""
+        job_result = JobResult.objects.create(
+            name="irrelevant",
+            user=None,
+            status=JobResultStatusChoices.STATUS_STARTED,
+        )
+        handler = NautobotDatabaseHandler(flush_size=100, flush_interval=3600)
+
+        def log(message, level):
+            record = logging.LogRecord("test", level, __file__, 1, message, None, None, func="test")
+            record.task_id = str(job_result.pk)
+            handler.handle(record)
+
+        log("one", logging.INFO)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 0)
+        log("two", logging.WARNING)
+        self.assertEqual(JobLogEntry.objects.filter(job_result=job_result).count(), 2)
+        self.assertEqual(
+            JobLogEntry.objects.get(job_result=job_result, message="two").log_level, LogLevelChoices.LOG_WARNING
+        )
+        handler.flush(discard=True)
+
 
 class ObjectMetadataTest(ModelTestCases.BaseModelTestCase):
     model = ObjectMetadata
@@ -2246,6 +2475,24 @@ class StatusTest(ModelTestCases.BaseModelTestCase):
             self.status.save()
             self.assertEqual(str(self.status), test)
 
+    def test_get_for_model_caching_and_cache_invalidation(self):
+        """Test that the cache is used and is properly invalidated when Statuses change."""
+        statuses = list(Status.objects.get_for_model(Device))
+        self.assertIn(self.status, statuses)
+        with self.assertNumQueries(0):
+            self.assertEqual(list(Status.objects.get_for_model(Device)), statuses)
+
+        # Assert that the cache is invalidated when removing a Status.content_types m2m relationship
+        self.status.content_types.remove(ContentType.objects.get_for_model(Device))
+        with self.assertNumQueries(1):
+            self.assertNotIn(self.status, Status.objects.get_for_model(Device))
+        with self.assertNumQueries(0):
+            self.assertNotIn(self.status, Status.objects.get_for_model(Device))
+
+        # Assert that filtering the Statuses of a model still queries the database
+        with self.assertNumQueries(1):
+            self.assertFalse(Status.objects.get_for_model(Device).filter(pk=self.status.pk).exists())
+
     @isolate_apps("nautobot.extras.tests")
     def test_deprecated_mixin_class(self):
         """Test that inheriting from StatusModel raises a DeprecationWarning."""
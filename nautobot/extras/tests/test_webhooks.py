@@ -6,7 +6,10 @@ import uuid
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.utils import timezone
+from jinja2.exceptions import TemplateError
+import requests
 from requests import Session
 
 from nautobot.core.api.exceptions import SerializerNotFound
@@ -20,8 +23,9 @@ from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.models import Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch, WEBHOOK_BATCH_MAX_ATTEMPTS
 from nautobot.extras.utils import generate_signature
+from nautobot.extras.webhooks import get_webhook_batch_keys
 
 User = get_user_model()
 
@@ -330,6 +334,133 @@ class WebhookTest(APITestCase):
         self.assertEqual(args[6], request_id)
         self.assertNotEqual(args[7], {})
 
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_after_webhook_change(self, mock_async):
+        """Make sure that changes to webhooks are taken into account when enqueueing webhooks."""
+        location_type = LocationType.objects.get(name="Campus")
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.enabled = False
+        webhook.save()
+
+        with web_request_context(self.user):
+            Location.objects.create(name="Location 1", location_type=location_type, status=self.statuses[0])
+        mock_async.assert_not_called()
+
+        webhook.enabled = True
+        webhook.save()
+        with web_request_context(self.user):
+            Location.objects.create(name="Location 2", location_type=location_type, status=self.statuses[0])
+        mock_async.assert_called_once()
+        self.assertEqual(mock_async.call_args[1]["args"][0], webhook.pk)
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_webhooks_batch(self, mock_async, mock_batch_async):
+        """Make sure that changes for a batching webhook are sent together in a single request."""
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 3
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+        changes_key, scheduled_key = get_webhook_batch_keys(webhook.pk)
+        cache.client.get_client(write=True).delete(changes_key)
+        cache.delete(scheduled_key)
+        request_bodies = []
+
+        def mock_send(_, request, **kwargs):
+            self.assertEqual(request.headers["X-Hook-Signature"], generate_signature(request.body, webhook.secret))
+            request_bodies.append(json.loads(request.body))
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with web_request_context(self.user):
+            for i in range(4):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        mock_async.assert_not_called()
+        # One delivery scheduled after the batch interval for the first change, and one right away for a full batch
+        self.assertEqual(mock_batch_async.call_count, 2)
+        self.assertEqual(mock_batch_async.call_args_list[0][1], {"args": [webhook.pk], "countdown": 10})
+        self.assertEqual(mock_batch_async.call_args_list[1][1], {"args": [webhook.pk]})
+
+        with patch.object(Session, "send", mock_send):
+            process_webhook_batch(webhook.pk)
+
+        self.assertEqual(len(request_bodies), 2)
+        self.assertEqual([len(body["changes"]) for body in request_bodies], [3, 1])
+        # Changes are enqueued in reverse chronological order
+        self.assertEqual(
+            [change["data"]["name"] for body in request_bodies for change in body["changes"]],
+            [f"Location {i}" for i in reversed(range(4))],
+        )
+        self.assertEqual(request_bodies[0]["changes"][0]["event"], "created")
+        self.assertEqual(request_bodies[0]["changes"][0]["username"], self.user.username)
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_webhooks_batch_failure(self, mock_async, mock_batch_async):
+        """Make sure that the changes of a batch that fails to be delivered are kept, and their delivery rescheduled."""
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 3
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+        changes_key, scheduled_key = get_webhook_batch_keys(webhook.pk)
+        client = cache.client.get_client(write=True)
+        client.delete(changes_key, f"{changes_key}.attempts")
+        cache.delete(scheduled_key)
+
+        with web_request_context(self.user):
+            for i in range(2):
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+        changes = client.lrange(changes_key, 0, -1)
+        self.assertEqual(len(changes), 2)
+        cache.delete(scheduled_key)
+        mock_batch_async.reset_mock()
+
+        with patch.object(Session, "send", side_effect=requests.exceptions.ConnectionError):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                process_webhook_batch(webhook.pk)
+
+        self.assertEqual(client.lrange(changes_key, 0, -1), changes)
+        mock_batch_async.assert_called_once_with(args=[webhook.pk], countdown=webhook.batch_interval)
+
+        # Once the delivery of the batch has failed too often, it's discarded
+        with patch.object(Session, "send", side_effect=requests.exceptions.ConnectionError):
+            for _ in range(WEBHOOK_BATCH_MAX_ATTEMPTS - 1):
+                cache.delete(scheduled_key)
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    process_webhook_batch(webhook.pk)
+        self.assertEqual(client.lrange(changes_key, 0, -1), [])
+
+    @patch("nautobot.extras.tasks.process_webhook_batch.apply_async")
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_webhooks_batch_render_failure(self, mock_async, mock_batch_async):
+        """Make sure that the changes of a batch whose request fails to render are discarded right away."""
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_size = 3
+        webhook.body_template = "{{ changes.nonexistent.attribute }}"
+        webhook.save()
+        location_type = LocationType.objects.get(name="Campus")
+        changes_key, scheduled_key = get_webhook_batch_keys(webhook.pk)
+        client = cache.client.get_client(write=True)
+        client.delete(changes_key)
+        cache.delete(scheduled_key)
+
+        with web_request_context(self.user):
+            Location.objects.create(name="Location 1", location_type=location_type, status=self.statuses[0])
+        cache.delete(scheduled_key)
+        mock_batch_async.reset_mock()
+
+        with patch.object(Session, "send") as mock_send:
+            with self.assertRaises(TemplateError):
+                process_webhook_batch(webhook.pk)
+        mock_send.assert_not_called()
+        self.assertEqual(client.lrange(changes_key, 0, -1), [])
+        mock_batch_async.assert_not_called()
+
     @patch("nautobot.extras.context_managers.enqueue_webhooks")
     def test_enqueue_webhooks_create_update(self, mock_enqueue_webhooks):
         """
@@ -21,6 +21,7 @@ from nautobot.core.choices import ColorChoices
 from nautobot.core.constants import CHARFIELD_MAX_LENGTH
 from nautobot.core.models.managers import TagsManager
 from nautobot.core.models.utils import find_models_with_matching_fields
+from nautobot.core.utils.cache import ProcessLocalLRUCache
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.constants import (
     CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL,
@@ -32,6 +33,10 @@ from nautobot.extras.registry import registry
 
 logger = logging.getLogger(__name__)
 
+# Cache of the CustomFields, ComputedFields, Relationships and Statuses of each model, invalidated by signals whenever
+# any of them change; see the `get_for_model()` methods of their managers
+metadata_cache = ProcessLocalLRUCache("extras.metadata", maxsize=4096)
+
 
 def get_base_template(base_template, model):
     """
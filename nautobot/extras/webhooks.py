@@ -1,9 +1,50 @@
+from collections import defaultdict
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
+from nautobot.core.utils.cache import ProcessLocalCache
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhook_batch
+
+WEBHOOK_BATCH_CACHE_KEY_PREFIX = "nautobot.extras.webhooks.batch"
+
+ACTION_FLAGS = {
+    ObjectChangeActionChoices.ACTION_CREATE: "type_create",
+    ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
+    ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
+}
+
+
+def _get_enabled_webhooks_by_content_type_and_action():
+    """Map each (content type PK, ObjectChange action) to the list of enabled Webhooks that apply to it."""
+    webhooks_by_content_type_and_action = defaultdict(list)
+    for webhook in Webhook.objects.filter(enabled=True).prefetch_related("content_types"):
+        for content_type in webhook.content_types.all():
+            for action, action_flag in ACTION_FLAGS.items():
+                if getattr(webhook, action_flag):
+                    webhooks_by_content_type_and_action[(content_type.pk, action)].append(webhook)
+    return dict(webhooks_by_content_type_and_action)
+
+
+# Cache of the enabled Webhooks by content type and action, invalidated by signals whenever a Webhook changes
+webhook_cache = ProcessLocalCache("extras.webhooks", _get_enabled_webhooks_by_content_type_and_action)
+
+
+def get_webhook_batch_keys(webhook_pk):
+    """
+    Get the cache keys used to batch the changes for the given Webhook.
+
+    Returns:
+        (tuple[str, str]): The key of the Redis list of pending changes, and the key of the flag that's set while a
+            delivery of the pending changes is scheduled.
+    """
+    prefix = f"{WEBHOOK_BATCH_CACHE_KEY_PREFIX}.{webhook_pk}"
+    return cache.make_key(f"{prefix}.changes"), f"{prefix}.scheduled"
 
 
 def enqueue_webhooks(object_change):
@@ -18,30 +59,48 @@ def enqueue_webhooks(object_change):
         return
 
     # Retrieve any applicable Webhooks
-    content_type = object_change.changed_object_type
-    action_flag = {
-        ObjectChangeActionChoices.ACTION_CREATE: "type_create",
-        ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
-        ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
-    }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
+    webhooks = webhook_cache.get().get((object_change.changed_object_type_id, object_change.action), [])
+
+    if webhooks:
         # fall back to object_data if object_data_v2 is not available
         serialized_data = object_change.object_data_v2
         if serialized_data is None:
             serialized_data = object_change.object_data
 
+        args = [
+            serialized_data,
+            model_name,
+            object_change.action,
+            str(timezone.now()),
+            object_change.user_name,
+            object_change.request_id,
+            object_change.get_snapshots(),
+        ]
+
         # Enqueue the webhooks
         for webhook in webhooks:
-            args = [
-                webhook.pk,
-                serialized_data,
-                model_name,
-                object_change.action,
-                str(timezone.now()),
-                object_change.user_name,
-                object_change.request_id,
-                object_change.get_snapshots(),
-            ]
-            process_webhook.apply_async(args=args)
+            if webhook.batch_size > 1:
+                enqueue_webhook_batch_change(webhook, args)
+            else:
+                process_webhook.apply_async(args=[webhook.pk, *args])
+
+
+def enqueue_webhook_batch_change(webhook, args):
+    """
+    Add a change to the pending changes of a batching Webhook, and schedule their delivery if needed.
+
+    The changes are appended to a list in Redis. A delivery is scheduled right away whenever the list reaches the batch
+    size of the webhook, and otherwise `batch_interval` seconds after the first change that arrives while no delivery is
+    scheduled, so that no change waits longer than that.
+
+    Args:
+        webhook (Webhook): The webhook to send the change to
+        args (list): The arguments of `process_webhook()` (except for the webhook PK) describing the change
+    """
+    changes_key, scheduled_key = get_webhook_batch_keys(webhook.pk)
+    client = cache.client.get_client(write=True)
+    pending_count = client.rpush(changes_key, json.dumps(args, cls=DjangoJSONEncoder))
+    if pending_count % webhook.batch_size == 0:
+        process_webhook_batch.apply_async(args=[webhook.pk])
+    elif cache.add(scheduled_key, True, timeout=webhook.batch_interval + 60):
+        process_webhook_batch.apply_async(args=[webhook.pk], countdown=webhook.batch_interval)
@@ -0,0 +1,98 @@
+"""
+Allocation of available IP addresses and prefixes, working on sorted integer intervals.
+
+Rather than building `netaddr.IPSet` objects out of every child IP address or prefix of a parent prefix (which can be
+very slow and memory-hungry for a large prefix such as an IPv6 /48 or a busy IPv4 /16), the functions in this module
+stream the used address ranges from the database in sorted order and scan the gaps between them. Only the free space
+that is actually needed by the caller is ever computed.
+"""
+
+import netaddr
+
+
+def iter_used_ranges(queryset, first_field, last_field=None, chunk_size=2000):
+    """
+    Stream the address ranges used by the records of a queryset from the database, in ascending order.
+
+    Args:
+        queryset (QuerySet): Records (such as IP addresses or prefixes) whose address ranges are used
+        first_field (str): Name of the field holding the first address of each range, such as `"host"` or `"network"`
+        last_field (str): Name of the field holding the last address of each range, such as `"broadcast"`;
+            if unset, each range consists of the single address in `first_field`
+        chunk_size (int): Number of records to retrieve from the database at a time
+
+    Yields:
+        (tuple[int, int]): The (first, last) integer values of each used range, ordered by their first address.
+    """
+    fields = [first_field] if last_field is None else [first_field, last_field]
+    values = queryset.order_by(first_field).values_list(*fields)
+    for record in values.iterator(chunk_size=chunk_size):
+        yield int(netaddr.IPAddress(record[0])), int(netaddr.IPAddress(record[-1]))
+
+
+def iter_free_ranges(first, last, used_ranges):
+    """
+    Yield the free ranges between `first` and `last` (inclusive) that are not covered by any of the `used_ranges`.
+
+    Args:
+        first (int): First address of the space to search
+        last (int): Last address of the space to search
+        used_ranges (iterable): (first, last) integer ranges, sorted by their first address; they may overlap.
+
+    Yields:
+        (tuple[int, int]): Each free (first, last) integer range, in ascending order.
+    """
+    cursor = first
+    for used_first, used_last in used_ranges:
+        if used_last < cursor:
+            continue
+        if used_first > last:
+            break
+        if used_first > cursor:
+            yield cursor, used_first - 1
+        cursor = used_last + 1
+        if cursor > last:
+            return
+    if cursor <= last:
+        yield cursor, last
+
+
+def iter_free_addresses(free_ranges, version):
+    """Yield each individual address (as a `netaddr.IPAddress`) contained in the given free ranges."""
+    for range_first, range_last in free_ranges:
+        for value in range(range_first, range_last + 1):
+            yield netaddr.IPAddress(value, version=version)
+
+
+def iter_free_cidrs(free_ranges, version):
+    """Yield the free ranges broken down into the fewest possible `netaddr.IPNetwork` CIDRs, in ascending order."""
+    for range_first, range_last in free_ranges:
+        yield from netaddr.iprange_to_cidrs(
+            netaddr.IPAddress(range_first, version=version), netaddr.IPAddress(range_last, version=version)
+        )
+
+
+def find_free_prefix(free_ranges, prefix_length, version):
+    """
+    Find the first free prefix of the given length in the given free ranges.
+
+    Args:
+        free_ranges (iterable): Free (first, last) integer ranges, in ascending order
+        prefix_length (int): Length of the desired prefix
+        version (int): IP version (4 or 6)
+
+    Returns:
+        (netaddr.IPNetwork): The first free prefix of the requested length, or None if there isn't enough free space.
+    """
+    size = 2 ** ((32 if version == 4 else 128) - prefix_length)
+    for range_first, range_last in free_ranges:
+        # Round up to the first correctly aligned network address within this range
+        network = -(-range_first // size) * size
+        if network + size - 1 <= range_last:
+            return netaddr.IPNetwork(f"{netaddr.IPAddress(network, version=version)}/{prefix_length}")
+    return None
+
+
+def to_ipset(free_ranges, version):
+    """Build a `netaddr.IPSet` out of the given free ranges."""
+    return netaddr.IPSet(iter_free_cidrs(free_ranges, version))
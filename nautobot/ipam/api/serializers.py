@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.validators import UniqueTogetherValidator
@@ -227,6 +228,7 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
         view_name="dcim-api:location-detail",
         write_only=True,
     )
+    utilization = serializers.SerializerMethodField()
 
     class Meta:
         model = Prefix
@@ -276,6 +278,21 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
             ],
         }
 
+    def get_field_names(self, declared_fields, info):
+        """Utilization is relatively expensive to compute and so it's opt-in only."""
+        fields = list(super().get_field_names(declared_fields, info))
+        self.extend_field_names(fields, "utilization", opt_in_only=True)
+        return fields
+
+    @extend_schema_field(
+        {
+            "type": "object",
+            "properties": {"numerator": {"type": "integer"}, "denominator": {"type": "integer"}},
+        }
+    )
+    def get_utilization(self, obj):
+        return obj.get_utilization()._asdict()
+
 
 class PrefixLegacySerializer(PrefixSerializer):
     """Serializer for API versions 2.0-2.1 where a Prefix only had a single Location."""
@@ -1,5 +1,7 @@
-from django.conf import settings
-from django.core.cache import cache
+import bisect
+import itertools
+
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
@@ -9,9 +11,10 @@ from rest_framework.response import Response
 
 from nautobot.core.models.querysets import count_related
 from nautobot.core.utils.config import get_settings_or_config
+from nautobot.core.utils.requests import normalize_querydict
 from nautobot.dcim.models import Location
 from nautobot.extras.api.views import NautobotModelViewSet
-from nautobot.ipam import filters
+from nautobot.ipam import allocation, filters
 from nautobot.ipam.models import (
     IPAddress,
     IPAddressToInterface,
@@ -120,6 +123,15 @@ class PrefixViewSet(NautobotModelViewSet):
     serializer_class = serializers.PrefixSerializer
     filterset_class = filters.PrefixFilterSet
 
+    def paginate_queryset(self, queryset):
+        """If `?include=utilization` was requested, calculate the utilization of the whole page of Prefixes at once."""
+        page = super().paginate_queryset(queryset)
+        if page is not None and "utilization" in normalize_querydict(self.request.query_params).get("include", []):
+            utilization_data = Prefix.objects.filter(pk__in=[prefix.pk for prefix in page]).get_utilization_data()
+            for prefix in page:
+                prefix._utilization_data = utilization_data.get(prefix.pk)
+        return page
+
     def get_serializer_class(self):
         if (
             not getattr(self, "swagger_fake_view", False)
@@ -173,15 +185,14 @@ class PrefixViewSet(NautobotModelViewSet):
         """
         A convenience method for listing and/or allocating available child prefixes within a parent.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        Allocation locks the parent prefix's database row for the duration of the transaction, in order to avoid a
+        race condition if multiple clients tried to simultaneously request allocation from the same parent prefix.
         """
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_prefixes", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
-                available_prefixes = prefix.get_available_prefixes()
+            with transaction.atomic():
+                # Serialize concurrent allocations from this parent prefix
+                Prefix.objects.select_for_update().get(pk=prefix.pk)
 
                 # Validate Requested Prefixes' length
                 serializer = serializers.PrefixLengthSerializer(
@@ -195,23 +206,25 @@ class PrefixViewSet(NautobotModelViewSet):
                 serializer.is_valid(raise_exception=True)
 
                 requested_prefixes = serializer.validated_data
-                # Allocate prefixes to the requested objects based on availability within the parent
+                # Allocate prefixes to the requested objects based on availability within the parent,
+                # by scanning the gaps between its existing descendants and any prefixes allocated so far
+                used_ranges = list(allocation.iter_used_ranges(prefix.descendants(), "network", "broadcast"))
                 for requested_prefix in requested_prefixes:
-                    # Find the first available prefix equal to or larger than the requested size
-                    for available_prefix in available_prefixes.iter_cidrs():
-                        if requested_prefix["prefix_length"] >= available_prefix.prefixlen:
-                            allocated_prefix = f"{available_prefix.network}/{requested_prefix['prefix_length']}"
-                            requested_prefix["prefix"] = allocated_prefix
-                            requested_prefix["namespace"] = prefix.namespace.pk
-                            break
-                    else:
+                    # Find the first available prefix of the requested size
+                    free_ranges = allocation.iter_free_ranges(prefix.prefix.first, prefix.prefix.last, used_ranges)
+                    allocated_prefix = allocation.find_free_prefix(
+                        free_ranges, requested_prefix["prefix_length"], prefix.ip_version
+                    )
+                    if allocated_prefix is None:
                         return Response(
                             {"detail": "Insufficient space is available to accommodate the requested prefix size(s)"},
                             status=status.HTTP_204_NO_CONTENT,
                         )
+                    requested_prefix["prefix"] = str(allocated_prefix)
+                    requested_prefix["namespace"] = prefix.namespace.pk
 
-                    # Remove the allocated prefix from the list of available prefixes
-                    available_prefixes.remove(allocated_prefix)
+                    # Remove the allocated prefix from the available space
+                    bisect.insort(used_ranges, (allocated_prefix.first, allocated_prefix.last))
 
                 # Initialize the serializer with a list or a single object depending on what was requested
                 context = {"request": request, "depth": 0}
@@ -226,9 +239,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                list(prefix.iter_available_prefixes()),
                 many=True,
                 context={
                     "request": request,
@@ -258,16 +270,17 @@ class PrefixViewSet(NautobotModelViewSet):
         By default, the number of IPs returned will be equivalent to PAGINATE_COUNT.
         An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed, however results will not be paginated.
 
-        This uses a Redis lock to prevent this API from being invoked in parallel, in order to avoid a race condition
-        if multiple clients tried to simultaneously request allocation from the same parent prefix.
+        Allocation locks the parent prefix's database row for the duration of the transaction, in order to avoid a
+        race condition if multiple clients tried to simultaneously request allocation from the same parent prefix.
         """
         prefix = get_object_or_404(Prefix.objects.restrict(request.user), pk=pk)
 
         # Create the next available IP within the prefix
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_ips", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
+            with transaction.atomic():
+                # Serialize concurrent allocations from this parent prefix
+                Prefix.objects.select_for_update().get(pk=prefix.pk)
+
                 # Normalize to a list of objects
                 serializer = serializers.IPAllocationSerializer(
                     data=request.data if isinstance(request.data, list) else [request.data],
@@ -282,8 +295,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 requested_ips = serializer.validated_data
 
                 # Determine if the requested number of IPs is available
-                available_ips = prefix.get_available_ips()
-                if available_ips.size < len(requested_ips):
+                available_ips = list(itertools.islice(prefix.iter_available_ips(), len(requested_ips)))
+                if len(available_ips) < len(requested_ips):
                     return Response(
                         {
                             "detail": (
@@ -295,10 +308,9 @@ class PrefixViewSet(NautobotModelViewSet):
                     )
 
                 # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
-                available_ips = iter(available_ips)
                 prefix_length = prefix.prefix.prefixlen
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips)}/{prefix_length}"
+                for requested_ip, available_ip in zip(requested_ips, available_ips):
+                    requested_ip["address"] = f"{available_ip}/{prefix_length}"
                     requested_ip["namespace"] = prefix.namespace.pk
 
                 # Initialize the serializer with a list or a single object depending on what was requested
@@ -323,11 +335,7 @@ class PrefixViewSet(NautobotModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE"))
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(prefix.get_available_ips(), start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = list(itertools.islice(prefix.iter_available_ips(), limit if limit > 0 else None))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
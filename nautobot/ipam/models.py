@@ -18,7 +18,7 @@ from nautobot.core.utils.data import UtilizationData
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import RoleField, StatusField
 from nautobot.extras.utils import extras_features
-from nautobot.ipam import choices, constants
+from nautobot.ipam import allocation, choices, constants
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
@@ -845,43 +845,65 @@ class Prefix(PrimaryModel):
 
         return query
 
+    def _get_free_prefix_ranges(self):
+        """Yield the (first, last) integer ranges within this prefix that aren't covered by any descendant prefix."""
+        used_ranges = allocation.iter_used_ranges(self.descendants(), "network", "broadcast")
+        return allocation.iter_free_ranges(self.prefix.first, self.prefix.last, used_ranges)
+
+    def _get_free_ip_ranges(self):
+        """Yield the (first, last) integer ranges of IP addresses within this prefix that are available for use."""
+        first, last = self.prefix.first, self.prefix.last
+        # IPv6, pool, or IPv4 /31-32 sets are fully usable
+        # For "normal" IPv4 prefixes, omit first and last addresses
+        if not any(
+            [
+                self.ip_version == 6,
+                self.type == choices.PrefixTypeChoices.TYPE_POOL,
+                self.ip_version == 4 and self.prefix_length >= 31,
+            ]
+        ):
+            first, last = first + 1, last - 1
+        used_ranges = allocation.iter_used_ranges(self.ip_addresses.all(), "host")
+        return allocation.iter_free_ranges(first, last, used_ranges)
+
     def get_available_prefixes(self):
         """
         Return all available Prefixes within this prefix as an IPSet.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
+        return allocation.to_ipset(self._get_free_prefix_ranges(), self.ip_version)
+
+    def iter_available_prefixes(self):
+        """
+        Iterate over the available Prefixes within this prefix, as the fewest possible `netaddr.IPNetwork` CIDRs.
+
+        Unlike `get_available_prefixes()`, this is computed lazily, so only as much of the available space as is
+        actually consumed is ever calculated.
+        """
+        return allocation.iter_free_cidrs(self._get_free_prefix_ranges(), self.ip_version)
+
+    def find_available_prefix(self, prefix_length):
+        """
+        Return the first available child prefix of the given length within this prefix (or None).
 
-        return available_prefixes
+        Returns:
+            (netaddr.IPNetwork): the first available prefix of the requested length, or None
+        """
+        return allocation.find_free_prefix(self._get_free_prefix_ranges(), prefix_length, self.ip_version)
 
     def get_available_ips(self):
         """
         Return all available IPs within this prefix as an IPSet.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.ip_addresses.all()])
-        available_ips = prefix - child_ips
+        return allocation.to_ipset(self._get_free_ip_ranges(), self.ip_version)
 
-        # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if any(
-            [
-                self.ip_version == 6,
-                self.type == choices.PrefixTypeChoices.TYPE_POOL,
-                self.ip_version == 4 and self.prefix_length >= 31,
-            ]
-        ):
-            return available_ips
+    def iter_available_ips(self):
+        """
+        Iterate over the available IPs within this prefix, in ascending order, as `netaddr.IPAddress` objects.
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
-        )
-        return available_ips
+        Unlike `get_available_ips()`, this is computed lazily, so for example the first N available IPs can be found
+        without calculating all of the available IPs within a large prefix.
+        """
+        return allocation.iter_free_addresses(self._get_free_ip_ranges(), self.ip_version)
 
     def get_child_ips(self):
         """
@@ -904,19 +926,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        available_ip = next(self.iter_available_ips(), None)
+        if available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -926,9 +945,15 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
+        If this Prefix's utilization was already calculated in bulk by `PrefixQuerySet.get_utilization_data()` and
+        stored as `self._utilization_data`, that value is returned instead of being recalculated.
+
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
+        if getattr(self, "_utilization_data", None) is not None:
+            return self._utilization_data
+
         denominator = self.prefix.size
         child_ips = netaddr.IPSet()
         child_prefixes = netaddr.IPSet()
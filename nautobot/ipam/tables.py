@@ -340,6 +340,27 @@ class RIRTable(BaseTable):
 #
 
 
+class PrefixUtilizationColumn(tables.TemplateColumn):
+    """
+    Column displaying the utilization graph of a Prefix.
+
+    Rather than calling `Prefix.get_utilization()` for each row in turn, the utilization of all Prefixes on the current
+    page of the table is calculated at once, the first time that this column is rendered.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("orderable", False)
+        super().__init__(*args, template_code=UTILIZATION_GRAPH, **kwargs)
+
+    def render(self, record, table, **kwargs):
+        if record.present_in_database:
+            if getattr(table, "_utilization_data", None) is None:
+                pks = [row.record.pk for row in table.paginated_rows if row.record.present_in_database]
+                table._utilization_data = Prefix.objects.filter(pk__in=pks).get_utilization_data()
+            record._utilization_data = table._utilization_data.get(record.pk)
+        return super().render(record=record, table=table, **kwargs)
+
+
 class PrefixTable(StatusTableMixin, RoleTableMixin, BaseTable):
     pk = ToggleColumn()
     prefix = tables.TemplateColumn(
@@ -397,7 +418,7 @@ class PrefixTable(StatusTableMixin, RoleTableMixin, BaseTable):
 
 
 class PrefixDetailTable(PrefixTable):
-    utilization = tables.TemplateColumn(template_code=UTILIZATION_GRAPH, orderable=False)
+    utilization = PrefixUtilizationColumn()
     tenant = TenantColumn()
     tags = TagColumn(url_name="ipam:prefix_list")
 
@@ -414,6 +414,27 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
                 "Please correct the data or use a later API version.",
             )
 
+    def test_utilization_opt_in(self):
+        """Prefix utilization is only included when requested, and matches `Prefix.get_utilization()`."""
+        self.add_permissions("ipam.view_prefix")
+        url = reverse("ipam-api:prefix-list")
+
+        response = self.client.get(f"{url}?limit=10", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn("utilization", response.data["results"][0])
+
+        response = self.client.get(f"{url}?limit=10&include=utilization", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        for result in response.data["results"]:
+            prefix = Prefix.objects.get(pk=result["id"])
+            numerator, denominator = prefix.get_utilization()
+            self.assertEqual(result["utilization"], {"numerator": numerator, "denominator": denominator})
+
+        url = reverse("ipam-api:prefix-detail", kwargs={"pk": prefix.pk})
+        response = self.client.get(f"{url}?include=utilization", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["utilization"], {"numerator": numerator, "denominator": denominator})
+
     def test_list_available_prefixes(self):
         """
         Test retrieval of all available prefixes within a parent prefix.
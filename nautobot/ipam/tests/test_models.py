@@ -651,6 +651,50 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         IPAddress.objects.create(address="10.0.0.4/24", status=self.status, namespace=self.namespace)
         self.assertEqual(parent_prefix.get_first_available_ip(), "10.0.0.5/24")
 
+    def test_find_available_prefix(self):
+        parent = Prefix.objects.create(
+            prefix="10.0.0.0/16", status=self.status, namespace=self.namespace, type=PrefixTypeChoices.TYPE_CONTAINER
+        )
+        Prefix.objects.create(prefix="10.0.0.0/24", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.1.128/25", status=self.status, namespace=self.namespace)
+        # Nested descendants overlap their parent's range and must be handled too
+        Prefix.objects.create(prefix="10.0.0.0/26", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="10.0.4.0/22", status=self.status, namespace=self.namespace)
+
+        self.assertEqual(parent.find_available_prefix(25), netaddr.IPNetwork("10.0.1.0/25"))
+        self.assertEqual(parent.find_available_prefix(24), netaddr.IPNetwork("10.0.2.0/24"))
+        self.assertEqual(parent.find_available_prefix(23), netaddr.IPNetwork("10.0.2.0/23"))
+        self.assertEqual(parent.find_available_prefix(22), netaddr.IPNetwork("10.0.8.0/22"))
+        self.assertIsNone(parent.find_available_prefix(16))
+        self.assertEqual(list(parent.iter_available_prefixes()), list(parent.get_available_prefixes().iter_cidrs()))
+
+        large_parent = Prefix.objects.create(prefix="2001:db8::/32", status=self.status, namespace=self.namespace)
+        Prefix.objects.create(prefix="2001:db8::/48", status=self.status, namespace=self.namespace)
+        self.assertEqual(large_parent.find_available_prefix(48), netaddr.IPNetwork("2001:db8:1::/48"))
+        self.assertEqual(large_parent.find_available_prefix(127), netaddr.IPNetwork("2001:db8:1::/127"))
+
+    def test_iter_available_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/16", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.1/16", "10.0.0.2/16", "10.0.0.4/16"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+
+        available_ips = parent_prefix.iter_available_ips()
+        self.assertEqual(
+            [next(available_ips) for _ in range(3)],
+            [netaddr.IPAddress("10.0.0.3"), netaddr.IPAddress("10.0.0.5"), netaddr.IPAddress("10.0.0.6")],
+        )
+        self.assertEqual(sum(1 for _ in parent_prefix.iter_available_ips()), 2**16 - 2 - 3)
+        self.assertEqual(parent_prefix.get_available_ips().size, 2**16 - 2 - 3)
+
+        # Pools and IPv6 prefixes are fully usable
+        pool = Prefix.objects.create(
+            prefix="10.1.0.0/30", status=self.status, namespace=self.namespace, type=PrefixTypeChoices.TYPE_POOL
+        )
+        self.assertEqual(next(pool.iter_available_ips()), netaddr.IPAddress("10.1.0.0"))
+        ipv6_prefix = Prefix.objects.create(prefix="2001:db8::/64", status=self.status, namespace=self.namespace)
+        IPAddress.objects.create(address="2001:db8::/64", status=self.status, namespace=self.namespace)
+        self.assertEqual(next(ipv6_prefix.iter_available_ips()), netaddr.IPAddress("2001:db8::1"))
+
     def test_get_utilization(self):
         # Container Prefix
         prefix = Prefix.objects.create(
@@ -757,3 +757,50 @@ class PrefixQuerysetTestCase(TestCase):
                     .order_by("-prefix_length")
                     .first(),
                 )
+
+    def test_get_utilization_data(self):
+        """Bulk utilization calculation should agree with `Prefix.get_utilization()` for every type of Prefix."""
+        namespace = Namespace.objects.create(name="Utilization")
+        ip_status = Status.objects.get_for_model(IPAddress).first()
+
+        def create_prefix(prefix, prefix_type=choices.PrefixTypeChoices.TYPE_NETWORK):
+            return Prefix.objects.create(prefix=prefix, type=prefix_type, namespace=namespace, status=self.status)
+
+        create_prefix("10.0.0.0/16", choices.PrefixTypeChoices.TYPE_CONTAINER)
+        create_prefix("10.0.0.0/24")
+        create_prefix("10.0.0.128/26", choices.PrefixTypeChoices.TYPE_POOL)
+        create_prefix("10.0.1.0/24")
+        create_prefix("10.0.1.0/30", choices.PrefixTypeChoices.TYPE_POOL)
+        create_prefix("10.0.2.0/31")
+        create_prefix("10.0.3.0/24")
+        create_prefix("2001:db8::/32", choices.PrefixTypeChoices.TYPE_CONTAINER)
+        create_prefix("2001:db8::/64")
+        create_prefix("2001:db8::/124")
+        create_prefix("2001:db8:1::/48")
+        for address in [
+            "10.0.0.1/24",
+            "10.0.0.2/24",
+            "10.0.0.130/26",
+            "10.0.0.131/26",
+            "10.0.1.2/24",
+            "10.0.1.200/24",
+            "10.0.2.1/31",
+            "10.0.3.0/32",
+            "2001:db8::1/64",
+            "2001:db8::1:1/64",
+        ]:
+            IPAddress.objects.create(address=address, namespace=namespace, status=ip_status)
+
+        queryset = Prefix.objects.filter(namespace=namespace)
+        with self.assertNumQueries(2):
+            utilization_data = queryset.get_utilization_data()
+        self.assertEqual(len(utilization_data), queryset.count())
+        for prefix in queryset:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(utilization_data[prefix.pk], prefix.get_utilization())
+
+        # Sliced querysets are supported too, and bulk-calculated data is reused by get_utilization()
+        prefix = queryset.get(prefix="10.0.0.0/24")
+        prefix._utilization_data = queryset.order_by("network", "prefix_length")[:3].get_utilization_data()[prefix.pk]
+        with self.assertNumQueries(0):
+            self.assertEqual(prefix.get_utilization(), (66, 256 - 2))
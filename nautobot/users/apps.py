@@ -5,3 +5,7 @@ class UsersConfig(NautobotConfig):
     default = True
     name = "nautobot.users"
     verbose_name = "Users"
+
+    def ready(self):
+        super().ready()
+        import nautobot.users.signals  # noqa: F401  # unused-import -- but this import installs the signals
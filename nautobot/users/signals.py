@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from nautobot.core.authentication import invalidate_object_permissions_cache
+from nautobot.users.models import ObjectPermission
+
+User = get_user_model()
+
+
+def _invalidate_object_permissions_cache(user=None):
+    invalidate_object_permissions_cache(user)
+    # Invalidate again once the transaction is committed, in case the cache was repopulated in the meantime
+    transaction.on_commit(lambda: invalidate_object_permissions_cache(user))
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(post_delete, sender=Group)
+def invalidate_object_permissions_cache_for_all_users(sender, **kwargs):
+    """Invalidate the cached object permissions of all users when an ObjectPermission or Group changes."""
+    if kwargs.get("action", "post_").startswith("post_"):
+        _invalidate_object_permissions_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_object_permissions_cache_for_user(sender, instance, raw=False, **kwargs):
+    """Invalidate the cached object permissions of a user when the user is changed or deleted."""
+    if not raw:
+        _invalidate_object_permissions_cache(instance)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_object_permissions_cache_for_group_members(sender, instance, action, reverse, **kwargs):
+    """Invalidate the cached object permissions of any users whose group membership has changed."""
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        # instance is a User
+        _invalidate_object_permissions_cache(instance)
+    else:
+        # instance is a Group, and any number of its members may be affected
+        _invalidate_object_permissions_cache()